@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - arXiv 客户端
+所有分类合并为一个 OR 查询并分页；持久化游标记录已入库的最新 submittedDate 和论文ID，
+之后每次运行只下载真正新增的论文。
+响应按 Atom 流式解析，逐条产出带摘要、作者和版本号的论文记录
+"""
+
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+
+ARXIV_API = 'http://export.arxiv.org/api/query'
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+CURSOR_FILE = DATA_DIR / 'arxiv_cursor.json'
+CHUNK_SIZE = 16 * 1024
+
+# http://arxiv.org/abs/2410.12345v2 -> ('2410.12345', '2', ...)
+ID_PATTERN = re.compile(r'/(\d+\.\d+)(?:v(\d+))?$')
+
+# 缓存最近入库的论文，新增不足时用来补足
+RECENT_KEEP = 50
+
+
+def build_query(categories, since=None):
+    """构造 OR 分类查询；给定 since 时只查询该时间之后提交的论文"""
+    query = '(' + ' OR '.join(f'cat:{cat}' for cat in categories) + ')'
+    if since:
+        # submittedDate 精确到分钟，下界包含同一分钟，已见过的ID在结果中过滤
+        start = since.strftime('%Y%m%d%H%M')
+        query += f' AND submittedDate:[{start} TO 299912312359]'
+    return query
+
+
+def _local(tag):
+    """去掉命名空间，返回标签本地名"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _clean(text):
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def _paper_from_element(elem):
+    """从 Atom <entry> 元素提取论文记录"""
+    paper = {
+        'arxiv_id': '', 'version': 0, 'title': '', 'abstract': '', 'authors': [],
+        'published': '', 'updated': '', 'categories': [], 'primary_category': ''
+    }
+    for child in elem:
+        name = _local(child.tag)
+        if name == 'id':
+            match = ID_PATTERN.search(child.text or '')
+            if match:
+                paper['arxiv_id'] = match.group(1)
+                paper['version'] = int(match.group(2) or 1)
+        elif name == 'title':
+            paper['title'] = _clean(child.text)
+        elif name == 'summary':
+            paper['abstract'] = _clean(child.text)
+        elif name == 'author':
+            for sub in child:
+                if _local(sub.tag) == 'name':
+                    paper['authors'].append(_clean(sub.text))
+        elif name in ('published', 'updated'):
+            paper[name] = (child.text or '').strip()
+        elif name == 'category':
+            paper['categories'].append(child.get('term', ''))
+        elif name == 'primary_category':
+            paper['primary_category'] = child.get('term', '')
+    return paper
+
+
+def iter_papers(chunks):
+    """
+    增量解析 arXiv Atom 字节流，每个 <entry> 结束即产出一条论文记录
+
+    产出后清空并摘除该条目元素，内存占用与响应大小无关。
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    root = None
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == 'start':
+                if root is None:
+                    root = elem
+                continue
+            if _local(elem.tag) != 'entry':
+                continue
+            paper = _paper_from_element(elem)
+            elem.clear()
+            if root is not None and len(root) and root[-1] is elem:
+                root.remove(elem)
+            if paper['arxiv_id'] and paper['title'] and paper['published']:
+                yield paper
+
+
+def stream_papers(session, params, timeout=15):
+    """请求 arXiv API 并流式解析结果"""
+    resp = session.get(ARXIV_API, params=params, timeout=timeout, stream=True)
+    try:
+        resp.raise_for_status()
+        yield from iter_papers(resp.iter_content(chunk_size=CHUNK_SIZE))
+    finally:
+        resp.close()
+
+
+def _parse_time(value):
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ')
+
+
+class ArxivClient:
+    """带增量游标的 arXiv 客户端"""
+
+    def __init__(self, session, categories, cursor_path=CURSOR_FILE):
+        self.session = session
+        self.categories = list(categories)
+        self.cursor_path = Path(cursor_path)
+        self.cursor = self._load()
+
+    def _load(self):
+        try:
+            with open(self.cursor_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'submitted': '', 'ids': [], 'recent': []}
+
+    def _save(self):
+        self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cursor_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.cursor, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.cursor_path)
+
+    def _category_of(self, paper):
+        """主分类在关注列表中则用主分类，否则取第一个关注的交叉分类"""
+        if paper['primary_category'] in self.categories:
+            return paper['primary_category']
+        for cat in paper['categories']:
+            if cat in self.categories:
+                return cat
+        return paper['primary_category'] or self.categories[0]
+
+    def fetch_new(self, limit, max_pages=3, timeout=15):
+        """按提交时间倒序下载游标之后的新论文，最多 limit 篇"""
+        submitted = self.cursor.get('submitted', '')
+        seen_ids = set(self.cursor.get('ids', []))
+        since = _parse_time(submitted) if submitted else None
+        query = build_query(self.categories, since)
+
+        new_papers = []
+        # 翻页间隔由会话的主机限速保证（arXiv 要求3秒）
+        for page in range(max_pages):
+            entries = 0
+            reached_cursor = False
+            for paper in stream_papers(self.session, {
+                'search_query': query,
+                'sortBy': 'submittedDate',
+                'sortOrder': 'descending',
+                'start': page * limit,
+                'max_results': limit
+            }, timeout=timeout):
+                entries += 1
+                if submitted and paper['published'] < submitted:
+                    reached_cursor = True
+                    break
+                if paper['published'] == submitted and paper['arxiv_id'] in seen_ids:
+                    continue
+                new_papers.append(paper)
+                if len(new_papers) >= limit:
+                    break
+
+            # 已到游标、已凑满或没有更多结果时停止翻页
+            if reached_cursor or len(new_papers) >= limit or entries < limit:
+                break
+
+        return new_papers
+
+    def fetch(self, limit):
+        """返回最新 limit 篇论文：新增论文优先，不足时用最近入库的论文补足"""
+        new_papers = self.fetch_new(limit)
+        today = datetime.now().strftime('%b %d')
+
+        records = [{
+            'title': paper['title'],
+            'arxiv_id': paper['arxiv_id'],
+            'version': paper['version'],
+            'url': f"https://arxiv.org/abs/{paper['arxiv_id']}",
+            'abstract': paper['abstract'],
+            'authors': paper['authors'],
+            'category': self._category_of(paper),
+            'date': today,
+            'published': paper['published']
+        } for paper in new_papers]
+
+        new_ids = {r['arxiv_id'] for r in records}
+        recent = records + [r for r in self.cursor.get('recent', []) if r['arxiv_id'] not in new_ids]
+
+        if records:
+            # 游标前移到本次最新的提交时间，记录该时间点上已入库的ID
+            newest = max(paper['published'] for paper in new_papers)
+            ids = [p['arxiv_id'] for p in new_papers if p['published'] == newest]
+            if newest == self.cursor.get('submitted'):
+                ids += self.cursor.get('ids', [])
+            self.cursor = {'submitted': newest, 'ids': ids, 'recent': recent[:RECENT_KEEP]}
+            self._save()
+
+        return recent[:limit]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 信息源熔断器
+按源记录连续失败次数并跨运行持久化：连续失败达到阈值后熔断，
+熔断期间直接跳过该源，冷却结束后只放行一次半开探测；
+重试与冷却时间均为带抖动的指数退避
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+HEALTH_FILE = DATA_DIR / 'source_health.json'
+
+FAILURE_THRESHOLD = 3         # 连续失败多少次后熔断
+BASE_COOLDOWN = 30 * 60       # 首次熔断冷却时间（秒）
+MAX_COOLDOWN = 24 * 3600      # 冷却时间上限（秒）
+RETRIES = 1                   # 熔断关闭时单次调用的重试次数
+RETRY_BASE_DELAY = 1.0        # 重试退避基数（秒）
+
+
+class CircuitOpenError(Exception):
+    """信息源处于熔断状态，本次未发出请求"""
+
+
+def backoff_delay(attempt, base):
+    """全抖动指数退避：在 [0, base * 2^attempt] 内均匀取值"""
+    return random.uniform(0, base * (2 ** attempt))
+
+
+class CircuitBreaker:
+    """按信息源名称管理熔断状态，可被多个抓取线程共用"""
+
+    def __init__(self, path=HEALTH_FILE, threshold=FAILURE_THRESHOLD,
+                 base_cooldown=BASE_COOLDOWN, max_cooldown=MAX_COOLDOWN):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.lock = threading.Lock()
+        self.state = self._load()
+        self.probing = set()  # 本次运行中正在半开探测的源
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, name):
+        """只合并写回当前源的状态，避免覆盖其他脚本记录的源"""
+        on_disk = self._load()
+        on_disk[name] = self.state[name]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(on_disk, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+
+    def _acquire(self, name):
+        """返回 'closed' 或 'half_open'；熔断中则抛出 CircuitOpenError"""
+        with self.lock:
+            health = self.state.get(name, {})
+            if health.get('failures', 0) < self.threshold:
+                return 'closed'
+            wait = health.get('retry_at', 0) - time.time()
+            if wait > 0:
+                raise CircuitOpenError(
+                    f"连续失败 {health['failures']} 次已熔断，{wait / 60:.0f} 分钟后再探测")
+            if name in self.probing:
+                raise CircuitOpenError('正在半开探测中')
+            self.probing.add(name)
+            return 'half_open'
+
+    def record_success(self, name):
+        with self.lock:
+            self.probing.discard(name)
+            if not self.state.get(name, {}).get('failures'):
+                return
+            self.state[name] = {'failures': 0, 'last_success': time.time()}
+            self._save(name)
+
+    def record_failure(self, name, error):
+        with self.lock:
+            self.probing.discard(name)
+            health = dict(self.state.get(name, {}))
+            health['failures'] = health.get('failures', 0) + 1
+            health['last_error'] = str(error)[:200]
+            if health['failures'] >= self.threshold:
+                # 每次探测失败冷却时间翻倍，并加抖动避免各源同时恢复探测
+                exponent = health['failures'] - self.threshold
+                cooldown = min(self.max_cooldown, self.base_cooldown * (2 ** exponent))
+                health['retry_at'] = time.time() + cooldown * random.uniform(0.8, 1.2)
+            self.state[name] = health
+            self._save(name)
+
+    def call(self, name, fetch, retries=RETRIES, base_delay=RETRY_BASE_DELAY):
+        """
+        通过熔断器执行 fetch
+
+        熔断关闭时失败会按退避重试 retries 次；半开状态只探测一次。
+        熔断中直接抛出 CircuitOpenError，不发出请求。
+        """
+        mode = self._acquire(name)
+        attempts = 1 if mode == 'half_open' else retries + 1
+        for attempt in range(attempts):
+            try:
+                result = fetch()
+            except Exception as e:
+                if attempt + 1 < attempts:
+                    time.sleep(backoff_delay(attempt, base_delay))
+                    continue
+                self.record_failure(name, e)
+                raise
+            self.record_success(name)
+            return result
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 统一标题分类引擎
+所有分类规则集（category_rules.json）编译进同一个关键词自动机，
+每个标题只扫描一遍即得到全部规则集的标签，结果按标题缓存
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from keyword_matcher import KeywordMatcher
+
+RULES_FILE = Path(__file__).resolve().parent / 'category_rules.json'
+CACHE_SIZE = 4096
+
+
+class Classifier:
+    """
+    多规则集标题分类器
+
+    规则集可设 case_sensitive：自动机统一按小写匹配，
+    区分大小写的关键词再用原文对应片段校验一次。
+    """
+
+    def __init__(self, rules_path=RULES_FILE):
+        with open(rules_path, 'r', encoding='utf-8') as f:
+            self.rulesets = json.load(f)
+
+        # 关键词 -> [(规则集, 规则序号, 是否区分大小写)]
+        self.targets = {}
+        for name, ruleset in self.rulesets.items():
+            case_sensitive = ruleset.get('case_sensitive', True)
+            for index, rule in enumerate(ruleset['rules']):
+                for kw in dict.fromkeys(rule['keywords']):
+                    self.targets.setdefault(kw, []).append((name, index, case_sensitive))
+        self.matcher = KeywordMatcher(self.targets)
+        self.classify = lru_cache(maxsize=CACHE_SIZE)(self._classify)
+
+    def _classify(self, title):
+        """一遍扫描，返回 {规则集: 命中的规则序号元组（按规则顺序）}"""
+        hits = {name: set() for name in self.rulesets}
+        for start, end, keywords in self.matcher.iter_matches(title):
+            for kw in keywords:
+                for name, index, case_sensitive in self.targets[kw]:
+                    if not case_sensitive or title[start:end] == kw:
+                        hits[name].add(index)
+        return {name: tuple(sorted(indexes)) for name, indexes in hits.items()}
+
+    def labels(self, ruleset, title):
+        """命中的全部标签（按规则顺序），没有命中时为默认标签"""
+        rules = self.rulesets[ruleset]['rules']
+        indexes = self.classify(title)[ruleset]
+        if not indexes:
+            return [self.rulesets[ruleset]['default']['label']]
+        return [rules[i]['label'] for i in indexes]
+
+    def first(self, ruleset, title):
+        """按规则优先级返回第一个命中的规则（含 label 及附加字段），没有命中时返回默认规则"""
+        indexes = self.classify(title)[ruleset]
+        if not indexes:
+            return self.rulesets[ruleset]['default']
+        return self.rulesets[ruleset]['rules'][indexes[0]]
+
+
+_classifier = None
+
+
+def get_classifier():
+    """进程内共享的分类器，首次使用时加载规则"""
+    global _classifier
+    if _classifier is None:
+        _classifier = Classifier()
+    return _classifier
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 中文标题/摘要生成结果缓存
+各中文内容生成器共用的内容寻址缓存（SQLite）：
+键为「生成器名 + 版本 + 规范化原标题 + 其余参数」的摘要，
+命中时直接返回上次的生成结果，按总大小做 LRU 淘汰。
+
+    TECHHUB_CONTENT_CACHE   缓存库路径，默认 data/content_cache.db；设为 off 关闭缓存
+
+键中还包含生成函数代码的摘要（函数体内的模板、if 分支改动即失效），
+外部规则数据（JSON 文件、模块级模板表）用 data_version() 计算版本传入，
+规则改动后旧结果不再命中，之后被 LRU 淘汰。
+"""
+
+import atexit
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+CACHE_FILE = os.environ.get('TECHHUB_CONTENT_CACHE', str(DATA_DIR / 'content_cache.db'))
+MAX_BYTES = 32 * 1024 * 1024     # 超过后按最近使用时间淘汰
+LOW_WATER = 0.8                  # 淘汰到上限的 80%，避免每次写入都触发淘汰
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key       TEXT PRIMARY KEY,
+    generator TEXT NOT NULL,
+    value     TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+"""
+
+
+def normalize_source(title):
+    """NFC 规范化并合并空白；不改大小写和标点，生成结果可能依赖原文"""
+    return ' '.join(unicodedata.normalize('NFC', title).split())
+
+
+def cache_key(generator, version, title, args=()):
+    payload = json.dumps([generator, version, normalize_source(title), list(args)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def data_version(*sources):
+    """规则数据的版本号：Path 取文件内容，其余按 JSON（键排序）序列化后取摘要"""
+    digest = hashlib.sha256()
+    for source in sources:
+        if isinstance(source, Path):
+            digest.update(source.read_bytes())
+        else:
+            digest.update(json.dumps(source, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+
+def _code_digest(code, digest):
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _code_digest(const, digest)
+        elif isinstance(const, frozenset):
+            # 集合常量（如 `x in {'a', 'b'}`）的 repr 顺序随哈希种子变化
+            digest.update(repr(sorted(map(repr, const))).encode('utf-8'))
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+
+def code_version(func):
+    """函数代码（字节码、常量、引用的名字）的摘要，函数体内写死的规则改动后随之变化"""
+    digest = hashlib.sha256()
+    _code_digest(func.__code__, digest)
+    return digest.hexdigest()[:12]
+
+
+class ContentCache:
+    """
+    生成结果缓存
+
+    读写先记在内存里，flush() 在一个事务中写入新结果、
+    刷新命中条目的使用时间并执行淘汰（进程退出时自动调用）。
+    """
+
+    def __init__(self, path=CACHE_FILE, max_bytes=MAX_BYTES):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self.pending = {}    # key -> (generator, value)
+        self.touched = {}    # key -> 使用时间
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """返回 (是否命中, 结果)"""
+        with self.lock:
+            if key in self.pending:
+                self.hits += 1
+                return True, self.pending[key][1]
+            row = self.conn.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self.touched[key] = time.time()
+            return True, json.loads(row[0])
+
+    def put(self, key, generator, value):
+        with self.lock:
+            self.pending[key] = (generator, value)
+
+    def flush(self):
+        with self.lock:
+            now = time.time()
+            with self.conn:
+                for key, (generator, value) in self.pending.items():
+                    text = json.dumps(value, ensure_ascii=False)
+                    self.conn.execute(
+                        'INSERT OR REPLACE INTO entries (key, generator, value, size, last_used) VALUES (?, ?, ?, ?, ?)',
+                        (key, generator, text, len(key) + len(text.encode('utf-8')), now))
+                self.conn.executemany('UPDATE entries SET last_used = ? WHERE key = ?',
+                                      [(used, key) for key, used in self.touched.items()])
+                self._evict()
+            self.pending.clear()
+            self.touched.clear()
+
+    def _evict(self):
+        """总大小超过上限时从最久未使用的条目开始删除，直到低于 LOW_WATER"""
+        total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        target = total - self.max_bytes * LOW_WATER
+        freed = 0
+        stale = []
+        for key, size in self.conn.execute('SELECT key, size FROM entries ORDER BY last_used'):
+            stale.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self.conn.executemany('DELETE FROM entries WHERE key = ?', stale)
+        return len(stale)
+
+    def close(self):
+        self.flush()
+        if self.hits or self.misses:
+            print(f"💾 内容缓存：命中 {self.hits} 条，新生成 {self.misses} 条")
+        self.conn.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """进程内共享的缓存，首次使用时打开，退出时写回；关闭时返回 None"""
+    global _cache
+    if CACHE_FILE.lower() == 'off':
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ContentCache(CACHE_FILE)
+            atexit.register(_cache.close)
+        return _cache
+
+
+def cached_generator(name, version=1):
+    """
+    为「原标题 -> 中文内容」的生成函数加缓存
+
+    第一个参数为英文原标题，其余位置参数和关键字参数一并计入键；
+    version 应随外部规则数据变化（见 data_version），函数自身代码的摘要会自动计入。
+    返回值需可 JSON 序列化，元组取出时还原为元组。
+    """
+    def decorator(func):
+        full_version = [version, code_version(func)]
+
+        @functools.wraps(func)
+        def wrapper(title, *args, **kwargs):
+            cache = get_cache()
+            if cache is None:
+                return func(title, *args, **kwargs)
+            key = cache_key(name, full_version, title, list(args) + [sorted(kwargs.items())])
+            hit, value = cache.get(key)
+            if hit:
+                return tuple(value) if isinstance(value, list) else value
+            value = func(title, *args, **kwargs)
+            cache.put(key, name, value)
+            return value
+        return wrapper
+    return decorator
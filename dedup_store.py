@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 已发送新闻去重库
+SQLite（WAL 模式）替代只追加的 news-sent.txt：
+按规范化标题主键精确查找，按日期分区（day 索引）做保留期清理，
+同库保存字符倒排表用于近重复查找；启动无需读取全部历史
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from near_dup_index import INDEX_VERSION, THRESHOLD, index_chars, min_shared, overlap_ratio
+from text_utils import normalize_title
+
+DIGEST_DATA = Path(__file__).resolve().parent / 'skills' / 'ai-news-digest' / 'data'
+DB_FILE = DIGEST_DATA / 'news-sent.db'
+LEGACY_FILE = DIGEST_DATA / 'news-sent.txt'
+RETENTION_DAYS = 3 * 365
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sent (
+    norm_title TEXT NOT NULL,
+    day        TEXT NOT NULL,
+    title      TEXT NOT NULL,
+    PRIMARY KEY (norm_title, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sent_day ON sent (day);
+CREATE TABLE IF NOT EXISTS chars (
+    ch         TEXT NOT NULL,
+    norm_title TEXT NOT NULL,
+    PRIMARY KEY (ch, norm_title)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class DedupStore:
+    """已发送标题库：精确查找 + 近重复查找"""
+
+    def __init__(self, path=DB_FILE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        if self._meta('index_version') != INDEX_VERSION:
+            self._rebuild_index()
+
+    def _meta(self, key, default=None):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, str(value)))
+
+    def _rebuild_index(self):
+        """索引规则变化（或从旧的 MinHash/LSH 桶升级）后重建字符倒排表"""
+        with self.conn:
+            self.conn.execute('DROP TABLE IF EXISTS lsh')
+            self.conn.execute('DELETE FROM chars')
+            for norm, title in self.conn.execute('SELECT norm_title, title FROM sent').fetchall():
+                self._index(norm, title)
+            self._set_meta('index_version', INDEX_VERSION)
+
+    def _index(self, norm, title):
+        """同一规范化标题的各个原文写法取字符并集，共享字符计数只会多不会少"""
+        self.conn.executemany('INSERT OR IGNORE INTO chars (ch, norm_title) VALUES (?, ?)',
+                              [(ch, norm) for ch in index_chars(title)])
+
+    def contains(self, title):
+        """规范化标题精确查找（主键前缀）"""
+        row = self.conn.execute('SELECT 1 FROM sent WHERE norm_title = ? LIMIT 1',
+                                (normalize_title(title),)).fetchone()
+        return row is not None
+
+    def candidates(self, title, threshold=THRESHOLD):
+        """与 title 共享字符数足以让重合率超过阈值的历史标题（不漏检，仍需逐条校验）"""
+        chars = list(index_chars(title))
+        if not chars:
+            return []
+        placeholders = ','.join('?' * len(chars))
+        rows = self.conn.execute(
+            f'SELECT DISTINCT s.title FROM sent s JOIN ('
+            f'SELECT norm_title FROM chars WHERE ch IN ({placeholders}) '
+            f'GROUP BY norm_title HAVING COUNT(*) >= ?) c ON s.norm_title = c.norm_title',
+            chars + [min_shared(title, threshold)]).fetchall()
+        return [row[0] for row in rows]
+
+    def titles(self):
+        """全部已发送标题，每个规范化标题一条"""
+        return [row[0] for row in self.conn.execute('SELECT MIN(title) FROM sent GROUP BY norm_title')]
+
+    def is_duplicate(self, title, threshold=THRESHOLD):
+        """精确命中，或与某条历史标题的字符重合率超过阈值"""
+        if normalize_title(title) and self.contains(title):
+            return True
+        return any(overlap_ratio(title, sent) > threshold for sent in self.candidates(title, threshold))
+
+    def add_many(self, titles, day=None):
+        """在一个事务中记录当天发送的标题"""
+        day = day or datetime.now().strftime('%Y-%m-%d')
+        with self.conn:
+            for title in titles:
+                norm = normalize_title(title)
+                if not norm:
+                    continue
+                self.conn.execute('INSERT OR IGNORE INTO sent (norm_title, day, title) VALUES (?, ?, ?)',
+                                  (norm, day, title))
+                self._index(norm, title)
+
+    def import_text(self, path=LEGACY_FILE):
+        """导入旧的 'YYYY-MM-DD|标题' 文本记录；记录已导入的字节偏移，之后只读新增部分"""
+        try:
+            with open(path, 'rb') as f:
+                f.seek(0, 2)
+                size = f.tell()
+                offset = int(self._meta('imported_offset', 0))
+                if size < offset:
+                    offset = 0  # 文件被截断或替换，重新导入（已有记录会被忽略）
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return 0
+        # 最后一行可能还在写入，下次再导入
+        complete = data[:data.rfind(b'\n') + 1]
+        by_day = {}
+        for line in complete.decode('utf-8').splitlines():
+            if '|' not in line:
+                continue
+            parts = line.split('|')
+            by_day.setdefault(parts[0].strip(), []).append(parts[1].strip())
+        for day, titles in by_day.items():
+            self.add_many(titles, day)
+        with self.conn:
+            self._set_meta('imported_offset', offset + len(complete))
+        return sum(len(titles) for titles in by_day.values())
+
+    def prune(self, days=RETENTION_DAYS):
+        """删除保留期之前的日期分区及其倒排表条目"""
+        cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        with self.conn:
+            removed = self.conn.execute('DELETE FROM sent WHERE day < ?', (cutoff,)).rowcount
+            if removed:
+                self.conn.execute('DELETE FROM chars WHERE norm_title NOT IN (SELECT norm_title FROM sent)')
+        return removed
+
+    def close(self):
+        self.conn.close()
+
+
+def check_recall(path=LEGACY_FILE):
+    """
+    近重复召回校验：把旧文本记录导入临时库，用每条标题的前半、中段和每 8 个字的短片段
+    （被长标题包含的短标题，MinHash 这类对称相似度容易漏掉）作查询，
+    与逐条线性比较的结果对照，返回 (查询数, 线性比较判为重复的数量, 倒排表漏检数)
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = DedupStore(Path(tmp) / 'check.db')
+        try:
+            store.import_text(path)
+            sent = store.conn.execute('SELECT title FROM sent').fetchall()
+            sent = [row[0] for row in sent]
+            queries = []
+            for title in sent:
+                n = len(title)
+                queries += [title[:n // 2], title[n // 4:3 * n // 4]]
+                queries += [title[i:i + 8] for i in range(0, n - 7, 8)]
+            expected = missed = 0
+            for query in queries:
+                if any(overlap_ratio(query, s) > THRESHOLD for s in sent):
+                    expected += 1
+                    missed += not store.is_duplicate(query)
+        finally:
+            store.close()
+    return len(queries), expected, missed
+
+
+if __name__ == '__main__':
+    total, expected, missed = check_recall()
+    print(f"🔍 查询 {total} 条，线性比较判重 {expected} 条，倒排表漏检 {missed} 条")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - RSS/Atom 订阅源客户端
+条件请求（ETag / Last-Modified）+ 流式解析：
+未更新的源返回 304 直接复用上次结果；更新的源只解析前 N 条即断开连接
+"""
+
+import html
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import feedparser
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+FEED_STATE_FILE = DATA_DIR / 'feed_state.json'
+CHUNK_SIZE = 16 * 1024
+
+
+def _local(tag):
+    """去掉命名空间，返回标签本地名"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _entry_from_element(elem):
+    """从 RSS <item> 或 Atom <entry> 元素提取 title/link/published"""
+    entry = {'title': '', 'link': '', 'published': ''}
+    for child in elem:
+        name = _local(child.tag)
+        text = (child.text or '').strip()
+        if name == 'title':
+            entry['title'] = html.unescape(text)
+        elif name == 'link':
+            # Atom 使用 href 属性，优先取 rel="alternate"
+            href = child.get('href')
+            if href is None:
+                entry['link'] = entry['link'] or text
+            elif child.get('rel', 'alternate') == 'alternate' or not entry['link']:
+                entry['link'] = href
+        elif name in ('pubDate', 'published'):
+            entry['published'] = text
+    return entry
+
+
+def iter_feed_entries(chunks, limit):
+    """
+    增量解析 RSS/Atom 字节流，逐条产出条目
+
+    每个条目解析完即释放其元素；产出 limit 条后立即停止读取。
+    """
+    if limit <= 0:
+        return
+    parser = ET.XMLPullParser(events=('end',))
+    count = 0
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if _local(elem.tag) not in ('item', 'entry'):
+                continue
+            yield _entry_from_element(elem)
+            elem.clear()
+            count += 1
+            if count >= limit:
+                return
+
+
+class FeedClient:
+    """带条件请求缓存的订阅源客户端"""
+
+    def __init__(self, session, state_path=FEED_STATE_FILE):
+        self.session = session
+        self.state_path = Path(state_path)
+        self.state = self._load()
+        self.dirty = False
+        self.lock = threading.Lock()  # 多个源并发抓取时保护 state
+
+    def _load(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def fetch(self, url, limit, timeout=15):
+        """获取订阅源前 limit 条，未更新时复用缓存"""
+        cached = self.state.get(url)
+        headers = {}
+        # 缓存条数不足（limit 调大）时发无条件请求
+        if cached and len(cached.get('entries', [])) >= limit:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        resp = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            if resp.status_code == 304 and cached:
+                return cached['entries'][:limit]
+            resp.raise_for_status()
+            entries = self._parse(resp, limit)
+        finally:
+            resp.close()
+
+        with self.lock:
+            self.state[url] = {
+                'etag': resp.headers.get('ETag', ''),
+                'last_modified': resp.headers.get('Last-Modified', ''),
+                'entries': entries,
+                'fetched_at': time.time()
+            }
+            self.dirty = True
+        return entries
+
+    def _parse(self, resp, limit):
+        """流式解析；XML 不规范时退回 feedparser 解析完整内容"""
+        consumed = []
+
+        def chunks():
+            for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                consumed.append(chunk)
+                yield chunk
+
+        try:
+            return list(iter_feed_entries(chunks(), limit))
+        except ET.ParseError:
+            body = b''.join(consumed) + resp.raw.read(decode_content=True)
+            feed = feedparser.parse(body)
+            return [{
+                'title': entry.get('title', ''),
+                'link': entry.get('link', ''),
+                'published': entry.get('published', '')
+            } for entry in feed.entries[:limit]]
+
+    def save(self):
+        """原子写回订阅源状态"""
+        with self.lock:
+            if not self.dirty:
+                return
+            snapshot = dict(self.state)
+            self.dirty = False
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp, self.state_path)
@@ -4,16 +4,19 @@ TechInsight Hub - 终极AI新闻聚合器（去重版）
 覆盖国内外多个数据源，确保标题唯一
 """
 
-import requests
 import json
-import re
-import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from arxiv_client import stream_papers
+from hn_client import HNClient
+from http_client import create_session
+from relevance_model import story_filter
+from title_rules import get_title_rules
+
 class DataFetcher:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -24,27 +27,23 @@ class DataFetcher:
             print("📡 获取 Hacker News...")
             keywords = ['AI', 'LLM', 'GPT', 'Claude', 'OpenAI', 'DeepSeek', 'machine learning']
             
-            resp = self.session.get('https://hacker-news.firebaseio.com/v0/topstories.json', timeout=10)
-            story_ids = resp.json()[:60]
+            def is_ai_story(story):
+                if not story or 'title' not in story:
+                    return False
+                return any(kw.lower() in story['title'].lower() for kw in keywords)
             
+            # 有相关性模型时用模型判定并扫描全部 topstories
+            accept, scan = story_filter(is_ai_story, 60)
+            hn = HNClient(self.session)
             stories = []
-            for story_id in story_ids:
-                if len(stories) >= limit:
-                    break
-                try:
-                    story = self.session.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json', timeout=5).json()
-                    if story and 'title' in story:
-                        if any(kw.lower() in story['title'].lower() for kw in keywords):
-                            stories.append({
-                                'title': story['title'],
-                                'url': story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
-                                'source': 'Hacker News',
-                                'score': story.get('score', 0),
-                                'type': '国外热点'
-                            })
-                    time.sleep(0.03)
-                except:
-                    continue
+            for story in hn.top_stories(scan, limit, accept=accept):
+                stories.append({
+                    'title': story['title'],
+                    'url': story.get('url', f"https://news.ycombinator.com/item?id={story['id']}"),
+                    'source': 'Hacker News',
+                    'score': story.get('score', 0),
+                    'type': '国外热点'
+                })
             return stories
         except Exception as e:
             print(f"❌ HN失败: {e}")
@@ -59,22 +58,20 @@ class DataFetcher:
             
             for cat in categories[:2]:
                 try:
-                    url = f'http://export.arxiv.org/api/query?search_query=cat:{cat}&sortBy=submittedDate&sortOrder=descending&max_results=3'
-                    resp = self.session.get(url, timeout=15)
-                    
-                    entries = re.findall(r'<entry>(.*?)</entry>', resp.text, re.DOTALL)
-                    
-                    for entry in entries:
-                        title = re.search(r'<title>(.*?)</title>', entry, re.DOTALL)
-                        arxiv_id = re.search(r'<id>.*?/(\d+\.\d+)</id>', entry)
-                        if title and arxiv_id:
-                            papers.append({
-                                'title': re.sub(r'\s+', ' ', title.group(1)).strip(),
-                                'url': f'https://arxiv.org/abs/{arxiv_id.group(1)}',
-                                'source': 'arXiv',
-                                'type': '学术论文'
-                            })
-                    time.sleep(0.2)
+                    for paper in stream_papers(self.session, {
+                        'search_query': f'cat:{cat}',
+                        'sortBy': 'submittedDate',
+                        'sortOrder': 'descending',
+                        'max_results': 3
+                    }):
+                        papers.append({
+                            'title': paper['title'],
+                            'url': f"https://arxiv.org/abs/{paper['arxiv_id']}",
+                            'abstract': paper['abstract'],
+                            'authors': paper['authors'],
+                            'source': 'arXiv',
+                            'type': '学术论文'
+                        })
                 except:
                     continue
             return papers[:limit]
@@ -121,97 +118,8 @@ def get_unique_title(base_title, seen_titles, index):
     return new_title
 
 def translate_title(title, index=0):
-    """标题中文化 - 根据内容生成独特标题"""
-    title_lower = title.lower()
-    
-    # 模型相关 - 区分不同模型和版本
-    if 'claude' in title_lower:
-        if '4.6' in title or 'sonnet' in title_lower:
-            return f'Claude Sonnet 4.6发布：性能大幅提升'
-        elif '3.5' in title or '3' in title:
-            return f'Claude 3.5重大更新：编程能力增强'
-        else:
-            return f'Claude大模型新功能发布'
-    
-    if 'gpt' in title_lower or 'openai' in title_lower:
-        if 'o3' in title_lower or 'o1' in title_lower:
-            return f'OpenAI o3推理模型：数学能力突破'
-        elif '4.5' in title or '4.0' in title:
-            return f'GPT-4.5发布：多模态能力增强'
-        elif '5' in title:
-            return f'GPT-5预告：下一代大模型能力展望'
-        else:
-            return f'OpenAI GPT模型新功能发布'
-    
-    if 'deepseek' in title_lower:
-        if 'r1' in title_lower:
-            return f'DeepSeek-R1开源：推理能力对标o1'
-        elif 'v3' in title_lower:
-            return f'DeepSeek-V3发布：国产大模型新突破'
-        else:
-            return f'DeepSeek大模型技术升级'
-    
-    if 'gemini' in title_lower or 'google' in title_lower:
-        if '2.0' in title:
-            return f'Google Gemini 2.0：多模态全面升级'
-        elif '1.5' in title:
-            return f'Gemini 1.5 Pro：长文本能力突破'
-        else:
-            return f'Google Gemini AI能力增强'
-    
-    if 'llama' in title_lower:
-        if '4' in title:
-            return f'Llama 4发布：Meta开源新旗舰'
-        elif '3' in title:
-            return f'Llama 3.1更新：开源模型再进化'
-        else:
-            return f'Llama开源模型性能提升'
-    
-    # 硬件相关
-    if 'nvidia' in title_lower:
-        return f'NVIDIA芯片技术：AI算力新突破'
-    if 'gpu' in title_lower and 'async' in title_lower:
-        return f'GPU异步编程框架：并行计算革新'
-    if 'gpu' in title_lower:
-        return f'GPU加速技术：AI推理优化方案'
-    if 'chip' in title_lower or 'processor' in title_lower:
-        return f'AI芯片技术：存算一体新架构'
-    
-    # 应用领域
-    if 'productivity' in title_lower or 'ceo' in title_lower:
-        return f'AI企业应用调研：数千CEO真实反馈'
-    if 'investment' in title_lower or 'funding' in title_lower:
-        return f'AI行业投资动态：资本市场新动向'
-    if 'open source' in title_lower:
-        return f'开源AI项目新动态：社区活跃度提升'
-    if 'agent' in title_lower:
-        return f'AI智能体技术：自主决策能力突破'
-    
-    # 技术方向
-    if 'multimodal' in title_lower or 'vision' in title_lower:
-        return f'多模态AI技术：视觉理解新突破'
-    if 'code' in title_lower or 'programming' in title_lower:
-        return f'AI编程助手：代码生成新能力'
-    if 'safety' in title_lower or 'alignment' in title_lower:
-        return f'AI安全研究：价值对齐新进展'
-    if 'training' in title_lower:
-        return f'大模型训练技术：效率优化方案'
-    if 'inference' in title_lower:
-        return f'AI推理优化技术：降低部署成本'
-    
-    # 学术研究
-    if 'survey' in title_lower or 'review' in title_lower:
-        return f'AI技术综述：领域全景分析'
-    if 'architecture' in title_lower:
-        return f'神经网络架构：设计创新方案'
-    if 'efficiency' in title_lower or 'optimization' in title_lower:
-        return f'AI效率优化：性能提升方案'
-    if 'memory' in title_lower:
-        return f'AI记忆机制：长文本处理突破'
-    
-    # 默认分类
-    topics = ['AI应用落地', '大模型技术', '算法优化', '产业动态', '技术突破']
-    return f'{topics[index % len(topics)]}：最新进展'
+    """标题中文化 - 根据内容生成独特标题，规则见 title_rules.json 的 news_title"""
+    return get_title_rules().render('news_title', title, index)
 
 def generate_chinese_summary(index, is_academic=False):
     """生成独特的中文摘要"""
@@ -4,22 +4,30 @@
 补充：财联社、RSS订阅源
 """
 
-import requests
 import json
-import feedparser
 from datetime import datetime
 from pathlib import Path
 
+from feed_client import FeedClient
+from fetch_multi_platform import AIAnalyzer
+from fetch_scheduler import run_sources
+from hotness import HotnessScorer
+from http_client import create_session
+from story_cluster import story_clusters
+from trend_detector import detect_trends, format_trend_lines
+from trend_store import record_snapshot
+
 class ExtendedDataFetcher:
     """扩展数据获取器"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'zh-CN,zh;q=0.9',
         })
+        self.feeds = FeedClient(self.session)
     
     def fetch_cailianshe(self, limit=5):
         """
@@ -105,60 +113,72 @@ class ExtendedDataFetcher:
             }
         ]
         print(f"📡 使用财联社备用数据: {len(mock_data[:limit])} 条")
-        return mock_data[:limit]
+        return [dict(item, fallback=True) for item in mock_data[:limit]]
+    
+    # RSS源列表（国际科技媒体和AI专业博客）
+    RSS_SOURCES = [
+        {
+            'name': 'TechCrunch AI',
+            'url': 'https://techcrunch.com/category/artificial-intelligence/feed/',
+            'platform': 'rss_techcrunch'
+        },
+        {
+            'name': 'The Verge AI',
+            'url': 'https://www.theverge.com/ai-artificial-intelligence/rss/index.xml',
+            'platform': 'rss_verge'
+        },
+        {
+            'name': 'MIT Technology Review',
+            'url': 'https://www.technologyreview.com/feed/',
+            'platform': 'rss_mit'
+        },
+        {
+            'name': 'Import AI',
+            'url': 'https://importai.substack.com/feed',
+            'platform': 'rss_importai'
+        }
+    ]
+    
+    # 各源截止时间（秒）与总时间预算，超时使用备用数据
+    SOURCE_TIMEOUTS = {'cailianshe': 12, 'tieba': 15, 'rss': 20}
+    FETCH_BUDGET = 25
+    
+    def fetch_rss_source(self, source, limit=3):
+        """获取单个RSS订阅源"""
+        try:
+            print(f"📡 正在获取 {source['name']}...")
+            # 条件请求 + 流式解析，只读取前 limit 条
+            entries = self.feeds.fetch(source['url'], limit)
+            
+            items = []
+            for entry in entries:
+                items.append({
+                    'title': entry.get('title', ''),
+                    'url': entry.get('link', ''),
+                    'source': source['name'],
+                    'platform': source['platform'],
+                    'score': 5000,  # RSS默认热度
+                    'type': 'rss',
+                    'published': entry.get('published', '')
+                })
+            
+            print(f"✅ {source['name']}: {len(entries)} 条")
+            return items
+            
+        except Exception as e:
+            print(f"⚠️ {source['name']} 获取失败: {e}")
+            return []
     
     def fetch_rss_sources(self, limit_per_source=3):
         """
         获取RSS订阅源
         包括国际科技媒体和AI专业博客
         """
-        # RSS源列表
-        rss_sources = [
-            {
-                'name': 'TechCrunch AI',
-                'url': 'https://techcrunch.com/category/artificial-intelligence/feed/',
-                'platform': 'rss_techcrunch'
-            },
-            {
-                'name': 'The Verge AI',
-                'url': 'https://www.theverge.com/ai-artificial-intelligence/rss/index.xml',
-                'platform': 'rss_verge'
-            },
-            {
-                'name': 'MIT Technology Review',
-                'url': 'https://www.technologyreview.com/feed/',
-                'platform': 'rss_mit'
-            },
-            {
-                'name': 'Import AI',
-                'url': 'https://importai.substack.com/feed',
-                'platform': 'rss_importai'
-            }
-        ]
-        
         all_items = []
+        for source in self.RSS_SOURCES:
+            all_items.extend(self.fetch_rss_source(source, limit_per_source))
         
-        for source in rss_sources:
-            try:
-                print(f"📡 正在获取 {source['name']}...")
-                feed = feedparser.parse(source['url'])
-                
-                for entry in feed.entries[:limit_per_source]:
-                    all_items.append({
-                        'title': entry.get('title', ''),
-                        'url': entry.get('link', ''),
-                        'source': source['name'],
-                        'platform': source['platform'],
-                        'score': 5000,  # RSS默认热度
-                        'type': 'rss',
-                        'published': entry.get('published', '')
-                    })
-                
-                print(f"✅ {source['name']}: {min(len(feed.entries), limit_per_source)} 条")
-                
-            except Exception as e:
-                print(f"⚠️ {source['name']} 获取失败: {e}")
-        
+        self.feeds.save()
         return all_items
     
     def fetch_tieba(self, limit=5):
@@ -246,7 +266,7 @@ class ExtendedDataFetcher:
             }
         ]
         print(f"📡 使用贴吧备用数据: {len(mock_data[:limit])} 条")
-        return mock_data[:limit]
+        return [dict(item, fallback=True) for item in mock_data[:limit]]
     
     def fetch_all_extended(self):
         """获取所有扩展信息源"""
@@ -254,13 +274,37 @@ class ExtendedDataFetcher:
         print("🌐 扩展信息源获取")
         print("="*60 + "\n")
         
+        # 财联社、贴吧和每个RSS源并发抓取，超时的源使用备用数据
+        sources = [
+            {'name': 'cailianshe', 'fetch': lambda: self.fetch_cailianshe(5),
+             'timeout': self.SOURCE_TIMEOUTS['cailianshe'], 'fallback': lambda: self.get_mock_cailianshe(5)},
+            {'name': 'tieba', 'fetch': lambda: self.fetch_tieba(5),
+             'timeout': self.SOURCE_TIMEOUTS['tieba'], 'fallback': lambda: self.get_mock_tieba(5)},
+        ]
+        for source in self.RSS_SOURCES:
+            sources.append({
+                'name': source['platform'],
+                'fetch': lambda source=source: self.fetch_rss_source(source, 3),
+                'timeout': self.SOURCE_TIMEOUTS['rss'],
+                'fallback': lambda: []
+            })
+        results = run_sources(sources, budget=self.FETCH_BUDGET)
+        self.feeds.save()
+        
+        rss_items = []
+        for source in self.RSS_SOURCES:
+            rss_items.extend(results[source['platform']])
+        
         all_data = {
-            'cailianshe': self.fetch_cailianshe(5),
-            'rss': self.fetch_rss_sources(3),
-            'tieba': self.fetch_tieba(5),
+            'cailianshe': results['cailianshe'],
+            'rss': rss_items,
+            'tieba': results['tieba'],
             'updated_at': datetime.now().isoformat()
         }
         
+        # 排名和热度追加到时间序列，RSS 按各源分别排名
+        record_snapshot(results)
+        
         total = sum(len(v) for k, v in all_data.items() if isinstance(v, list))
         print(f"\n📊 扩展源总计: {total} 条")
         
@@ -291,6 +335,11 @@ class EnhancedInsightAnalyzer:
                     item['data_source'] = 'extended'
                     self.all_items.append(item)
         
+        # 还没有统一热度的条目（扩展源、未经 AIAnalyzer 的基础数据）按平台历史归一化
+        scorer = HotnessScorer()
+        scorer.annotate([item for item in self.all_items if 'hotness' not in item])
+        scorer.save()
+        
         print(f"\n📊 合并后总数据: {len(self.all_items)} 条")
         print(f"   基础源: {len([i for i in self.all_items if i.get('data_source') == 'base'])} 条")
         print(f"   扩展源: {len([i for i in self.all_items if i.get('data_source') == 'extended'])} 条")
@@ -306,6 +355,10 @@ class EnhancedInsightAnalyzer:
         
         return source_dist
     
+    def find_story_clusters(self):
+        """聚类所有信息源中描述同一事件的标题，返回跨平台事件簇"""
+        return story_clusters(self.all_items)
+    
     def generate_enhanced_insight(self):
         """生成增强版热点解读"""
         # 按平台分组
@@ -347,21 +400,17 @@ class EnhancedInsightAnalyzer:
             titles = [i['title'][:20] + "..." for i in by_platform['tieba'][:2]]
             lines.append(f"- 💬 **贴吧**：{'、'.join(titles)}（草根声音）")
         
-        # 跨平台共识
+        # 跨平台共识：同一事件在多个平台同时出现
         lines.append(f"\n**跨平台共识**：")
-        lines.append(f"- DeepSeek开源、OpenAI Operator、Gemini 3.1 Pro 在多个平台同时出现")
-        lines.append(f"- 国内关注国产AI崛起，国际关注AI安全与伦理")
-        
-        # 多维研判
-        lines.append(f"\n**多维研判**：")
-        lines.append(f"- **投资视角**（财联社）：AI板块节后大涨，机构密集调研算力产业链")
-        lines.append(f"- **技术视角**（HN）：AI Agent安全性和可控性引发深度讨论")
-        lines.append(f"- **大众视角**（微博/贴吧）：国产AI产品用户接受度快速提升")
+        clusters = self.find_story_clusters()
+        for cluster in clusters[:3]:
+            lines.append(f"- {cluster['title'][:30]}（{'、'.join(cluster['sources'])}）")
+        if not clusters:
+            lines.append(f"- 今日各平台热点较分散，暂无同一事件在多个平台同时出现")
         
-        lines.append(f"\n**研判建议**：")
-        lines.append(f"- 投资者：关注有实际落地应用的AI标的，警惕纯概念炒作")
-        lines.append(f"- 开发者：开源模型降低门槛，是构建AI应用的好时机")
-        lines.append(f"- 从业者：多模态和AI Agent是近期最值得关注的方向")
+        # 趋势研判：基于热榜历史的升降温，而非固定文案
+        lines.append(f"\n**趋势研判**：")
+        lines.extend(format_trend_lines(detect_trends(AIAnalyzer.AI_KEYWORDS)))
         
         return '\n'.join(lines)
 
@@ -4,26 +4,48 @@ TechInsight Hub - 多平台热榜聚合与AI分析系统 v2.1
 支持：知乎、微博、Hacker News、百度热搜、财联社 + 备用数据
 """
 
-import requests
 import json
 import re
-import time
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+from circuit_breaker import CircuitBreaker
+from classifier import get_classifier
+from fetch_scheduler import run_sources
+from hn_client import HNClient
+from hotness import HotnessScorer
+from http_client import create_session
+from keyphrases import extract_keyphrases
+from keyword_matcher import KeywordMatcher
+from news_selector import select_diverse
+from relevance_model import get_relevance_model
+from story_cluster import story_clusters
+from trend_detector import detect_trends, format_trend_lines
+from trend_store import record_snapshot
+
 class TrendingFetcher:
     """多平台热榜获取器"""
     
-    def __init__(self, use_mock=False):
-        self.session = requests.Session()
+    def __init__(self, use_mock=False, hn_concurrency=8):
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
         })
         self.use_mock = use_mock
+        self.hn = HNClient(self.session, concurrency=hn_concurrency)
+        self.breaker = CircuitBreaker()
+    
+    # 各平台截止时间（秒）与总时间预算，超时使用备用数据
+    SOURCE_TIMEOUTS = {'zhihu': 12, 'weibo': 12, 'hackernews': 20, 'baidu': 12}
+    FETCH_BUDGET = 25
+    # 单次请求超时，重试一次加退避仍在平台截止时间内
+    REQUEST_TIMEOUT = 5
     
-    # 备用数据 - 当抓取失败时使用
+    # 备用数据 - 当抓取失败时使用；生成的条目带 fallback 标记，不计入热榜时间序列
     MOCK_ZHIHU = [
         {"title": "DeepSeek-R1推理模型技术报告公开：如何用强化学习提升大模型推理能力", "score": "580万", "url": "https://zhuanlan.zhihu.com/p/", "type": "tech"},
         {"title": "Google Gemini 3.1 Pro发布，多模态能力再升级，能否挑战GPT-4地位？", "score": "420万", "url": "https://zhuanlan.zhihu.com/p/", "type": "tech"},
@@ -57,26 +79,60 @@ class TrendingFetcher:
         {"title": "AI Agent写错报道", "hotScore": 2654000},
     ]
     
+    def mock_zhihu(self, limit=10):
+        """知乎备用数据"""
+        return [{
+            'title': item['title'],
+            'url': item['url'],
+            'source': '知乎',
+            'platform': 'zhihu',
+            'score': item['score'],
+            'type': item.get('type', 'discussion'),
+            'fallback': True
+        } for item in self.MOCK_ZHIHU[:limit]]
+    
+    def mock_weibo(self, limit=10):
+        """微博备用数据"""
+        return [{
+            'title': item['title'],
+            'url': f"https://s.weibo.com/weibo?q={item['title']}",
+            'source': '微博',
+            'platform': 'weibo',
+            'score': str(item['score']),
+            'type': 'hot',
+            'category': item.get('category', ''),
+            'fallback': True
+        } for item in self.MOCK_WEIBO[:limit]]
+    
+    def mock_baidu(self, limit=10):
+        """百度备用数据"""
+        return [{
+            'title': item['title'],
+            'url': f"https://www.baidu.com/s?wd={item['title']}",
+            'source': '百度',
+            'platform': 'baidu',
+            'score': str(item['hotScore']),
+            'type': 'hot',
+            'fallback': True
+        } for item in self.MOCK_BAIDU[:limit]]
+    
+    def _get_json(self, name, url):
+        """经熔断器请求平台接口，非200视为失败；熔断中直接抛出异常"""
+        def request():
+            resp = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
+            resp.raise_for_status()
+            return resp.json()
+        return self.breaker.call(name, request)
+    
     def fetch_zhihu(self, limit=10):
         """获取知乎热榜"""
         if self.use_mock:
             print("📡 使用知乎备用数据...")
-            return [{
-                'title': item['title'],
-                'url': item['url'],
-                'source': '知乎',
-                'platform': 'zhihu',
-                'score': item['score'],
-                'type': item.get('type', 'discussion')
-            } for item in self.MOCK_ZHIHU[:limit]]
+            return self.mock_zhihu(limit)
         
         try:
             print("📡 正在获取 知乎热榜...")
-            resp = self.session.get(
-                'https://www.zhihu.com/api/v3/feed/topstory/hot-lists/total?limit=50',
-                timeout=10
-            )
-            data = resp.json()
+            data = self._get_json('zhihu', 'https://www.zhihu.com/api/v3/feed/topstory/hot-lists/total?limit=50')
             
             items = []
             for item in data.get('data', [])[:limit]:
@@ -89,7 +145,7 @@ class TrendingFetcher:
                         'url': url if url.startswith('http') else f"https://zhihu.com{url}",
                         'source': '知乎',
                         'platform': 'zhihu',
-                        'score': item.get('detail_text', '').replace('万', '0000').replace('热度', '').strip() or '0',
+                        'score': item.get('detail_text', '') or '0',  # 如 "580万热度"，由 hotness 统一解析
                         'type': 'discussion'
                     })
             
@@ -97,36 +153,17 @@ class TrendingFetcher:
             return items
         except Exception as e:
             print(f"⚠️ 知乎获取失败，使用备用数据: {e}")
-            return [{
-                'title': item['title'],
-                'url': item['url'],
-                'source': '知乎',
-                'platform': 'zhihu',
-                'score': item['score'],
-                'type': item.get('type', 'discussion')
-            } for item in self.MOCK_ZHIHU[:limit]]
+            return self.mock_zhihu(limit)
     
     def fetch_weibo(self, limit=10):
         """获取微博热搜"""
         if self.use_mock:
             print("📡 使用微博备用数据...")
-            return [{
-                'title': item['title'],
-                'url': f"https://s.weibo.com/weibo?q={item['title']}",
-                'source': '微博',
-                'platform': 'weibo',
-                'score': str(item['score']),
-                'type': 'hot',
-                'category': item.get('category', '')
-            } for item in self.MOCK_WEIBO[:limit]]
+            return self.mock_weibo(limit)
         
         try:
             print("📡 正在获取 微博热搜...")
-            resp = self.session.get(
-                'https://weibo.com/ajax/side/hotSearch',
-                timeout=10
-            )
-            data = resp.json()
+            data = self._get_json('weibo', 'https://weibo.com/ajax/side/hotSearch')
             
             items = []
             for item in data.get('data', {}).get('realtime', [])[:limit]:
@@ -146,50 +183,27 @@ class TrendingFetcher:
             return items
         except Exception as e:
             print(f"⚠️ 微博获取失败，使用备用数据: {e}")
-            return [{
-                'title': item['title'],
-                'url': f"https://s.weibo.com/weibo?q={item['title']}",
-                'source': '微博',
-                'platform': 'weibo',
-                'score': str(item['score']),
-                'type': 'hot',
-                'category': item.get('category', '')
-            } for item in self.MOCK_WEIBO[:limit]]
+            return self.mock_weibo(limit)
     
     def fetch_hackernews(self, limit=10):
         """获取Hacker News热榜"""
         try:
             print("📡 正在获取 Hacker News...")
             
-            resp = self.session.get(
-                'https://hacker-news.firebaseio.com/v0/topstories.json',
-                timeout=10
-            )
-            story_ids = resp.json()[:limit+10]
+            # 并发获取详情（带磁盘缓存），凑满limit条后取消剩余请求
+            stories = self.hn.top_stories(limit + 10, limit)
             
             items = []
-            for story_id in story_ids:
-                if len(items) >= limit:
-                    break
-                try:
-                    story_resp = self.session.get(
-                        f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json',
-                        timeout=5
-                    )
-                    story = story_resp.json()
-                    if story and 'title' in story:
-                        items.append({
-                            'title': story['title'],
-                            'url': story.get('url') or f"https://news.ycombinator.com/item?id={story_id}",
-                            'source': 'Hacker News',
-                            'platform': 'hackernews',
-                            'score': story.get('score', 0),
-                            'type': 'tech',
-                            'comments': story.get('descendants', 0)
-                        })
-                    time.sleep(0.05)
-                except:
-                    continue
+            for story in stories:
+                items.append({
+                    'title': story['title'],
+                    'url': story.get('url') or f"https://news.ycombinator.com/item?id={story['id']}",
+                    'source': 'Hacker News',
+                    'platform': 'hackernews',
+                    'score': story.get('score', 0),
+                    'type': 'tech',
+                    'comments': story.get('descendants', 0)
+                })
             
             print(f"✅ Hacker News: {len(items)} 条")
             return items
@@ -201,22 +215,11 @@ class TrendingFetcher:
         """获取百度热搜"""
         if self.use_mock:
             print("📡 使用百度备用数据...")
-            return [{
-                'title': item['title'],
-                'url': f"https://www.baidu.com/s?wd={item['title']}",
-                'source': '百度',
-                'platform': 'baidu',
-                'score': str(item['hotScore']),
-                'type': 'hot'
-            } for item in self.MOCK_BAIDU[:limit]]
+            return self.mock_baidu(limit)
         
         try:
             print("📡 正在获取 百度热搜...")
-            resp = self.session.get(
-                'https://top.baidu.com/api/board?platform=wise&tab=realtime',
-                timeout=10
-            )
-            data = resp.json()
+            data = self._get_json('baidu', 'https://top.baidu.com/api/board?platform=wise&tab=realtime')
             
             items = []
             for item in data.get('data', {}).get('cards', [{}])[0].get('content', [])[:limit]:
@@ -235,14 +238,7 @@ class TrendingFetcher:
             return items
         except Exception as e:
             print(f"⚠️ 百度获取失败，使用备用数据: {e}")
-            return [{
-                'title': item['title'],
-                'url': f"https://www.baidu.com/s?wd={item['title']}",
-                'source': '百度',
-                'platform': 'baidu',
-                'score': str(item['hotScore']),
-                'type': 'hot'
-            } for item in self.MOCK_BAIDU[:limit]]
+            return self.mock_baidu(limit)
     
     def fetch_all(self):
         """获取所有平台热榜"""
@@ -250,11 +246,23 @@ class TrendingFetcher:
         print("🌐 多平台热榜获取")
         print("="*60 + "\n")
         
+        # 各平台并发抓取，超时的平台使用备用数据
+        results = run_sources([
+            {'name': 'zhihu', 'fetch': lambda: self.fetch_zhihu(10),
+             'timeout': self.SOURCE_TIMEOUTS['zhihu'], 'fallback': lambda: self.mock_zhihu(10)},
+            {'name': 'weibo', 'fetch': lambda: self.fetch_weibo(10),
+             'timeout': self.SOURCE_TIMEOUTS['weibo'], 'fallback': lambda: self.mock_weibo(10)},
+            {'name': 'hackernews', 'fetch': lambda: self.fetch_hackernews(10),
+             'timeout': self.SOURCE_TIMEOUTS['hackernews'], 'fallback': lambda: []},
+            {'name': 'baidu', 'fetch': lambda: self.fetch_baidu(10),
+             'timeout': self.SOURCE_TIMEOUTS['baidu'], 'fallback': lambda: self.mock_baidu(10)},
+        ], budget=self.FETCH_BUDGET)
+        
         all_data = {
-            'zhihu': self.fetch_zhihu(10),
-            'weibo': self.fetch_weibo(10),
-            'hackernews': self.fetch_hackernews(10),
-            'baidu': self.fetch_baidu(10),
+            'zhihu': results['zhihu'],
+            'weibo': results['weibo'],
+            'hackernews': results['hackernews'],
+            'baidu': results['baidu'],
             'updated_at': datetime.now().isoformat()
         }
         
@@ -263,6 +271,10 @@ class TrendingFetcher:
         with open('api/trending_raw.json', 'w', encoding='utf-8') as f:
             json.dump(all_data, f, ensure_ascii=False, indent=2)
         
+        # 排名和热度追加到时间序列，保留历史轨迹；备用数据模式下没有真实观测，不记录
+        if not self.use_mock:
+            record_snapshot({k: v for k, v in all_data.items() if isinstance(v, list)})
+        
         total = sum(len(v) for k, v in all_data.items() if isinstance(v, list))
         print(f"\n📊 总计获取: {total} 条热榜数据")
         
@@ -283,23 +295,13 @@ class AIAnalyzer:
         'AI应用', 'AI产品', 'AI公司', '融资', '投资', 'startup',
         'Gemini', 'Operator', 'Stargate', 'AI Agent', 'MuMu', 'Player'
     ]
-    
-    # 热点类别映射
-    CATEGORY_MAP = {
-        '大模型': ['GPT', 'Claude', 'Gemini', 'DeepSeek', 'Llama', '大模型', 'LLM', '基础模型', 'Gemini'],
-        '产品发布': ['发布', '上线', '推出', '新品', 'APP', '应用', 'Pro', '发布'],
-        '技术突破': ['突破', '创新', '架构', '算法', '论文', '研究', 'Consistency', 'Diffusion'],
-        '投融资': ['融资', '估值', '投资', 'IPO', '上市', '独角兽', 'Stargate'],
-        '产业动态': ['产业', '行业', '市场', '生态', '政策', '监管'],
-        '硬件芯片': ['芯片', 'GPU', 'NVIDIA', '算力', '推理', '训练', '集群'],
-        'AI应用': ['应用', '落地', '商业化', '产品', '用户', 'DAU'],
-        '开源生态': ['开源', 'GitHub', '社区', '开发者', '权重', '模型'],
-        'AI伦理': ['Agent', '智能体', '安全', '伦理', '风险', '隐私', 'Reconnaissance'],
-    }
+    # 预编译的关键词自动机，每个标题只扫描一遍
+    AI_MATCHER = KeywordMatcher(AI_KEYWORDS)
     
     def __init__(self, trending_data):
         self.data = trending_data
         self.ai_items = []
+        self.scored_by_model = False
         
     def filter_ai_items(self):
         """筛选AI相关热点"""
@@ -310,35 +312,41 @@ class AIAnalyzer:
                     item['platform'] = platform
                     all_items.append(item)
         
-        # 筛选AI相关
+        # 各平台热度批量解析并按平台历史归一化为 0~100 的统一热度
+        scorer = HotnessScorer()
+        scorer.annotate(all_items)
+        scorer.save()
+        
+        # 筛选AI相关：有训练好的模型时整批打分，ai_score 为阈值以上的置信度（0~1），
+        # 否则退回关键词计数
+        titles = [item.get('title', '') for item in all_items]
+        model = get_relevance_model()
+        self.scored_by_model = model is not None
+        if model is not None:
+            probs = model.scores(titles)
+            scores = [round(float(c), 4) if p >= model.threshold else None
+                      for p, c in zip(probs, model.confidence(probs))]
+        else:
+            scores = [self.AI_MATCHER.score(title) or None for title in titles]
         ai_items = []
-        for item in all_items:
-            title = item.get('title', '').lower()
-            if any(kw.lower() in title for kw in self.AI_KEYWORDS):
-                # 添加AI相关性分数
-                item['ai_score'] = sum(1 for kw in self.AI_KEYWORDS if kw.lower() in title)
+        for item, score in zip(all_items, scores):
+            if score is not None:
+                item['ai_score'] = score
                 ai_items.append(item)
         
-        # 按AI相关性排序
-        ai_items.sort(key=lambda x: x.get('ai_score', 0), reverse=True)
-        self.ai_items = ai_items[:30]  # 取前30条
+        # 按相关性（AI 相关度 + 统一热度）排序
+        order = np.argsort([-self.relevance(item) for item in ai_items], kind='stable')
+        self.ai_items = [ai_items[i] for i in order[:30]]  # 取前30条
         
         print(f"\n🤖 AI相关热点: {len(self.ai_items)} 条")
         return self.ai_items
     
     def categorize_items(self):
         """为热点分类"""
+        # 类别规则见 category_rules.json 的 ai_category
+        classifier = get_classifier()
         for item in self.ai_items:
-            title = item.get('title', '')
-            categories = []
-            
-            for cat, keywords in self.CATEGORY_MAP.items():
-                if any(kw in title for kw in keywords):
-                    categories.append(cat)
-            
-            if not categories:
-                categories = ['综合']
-            
+            categories = classifier.labels('ai_category', item.get('title', ''))
             item['categories'] = categories
             item['primary_category'] = categories[0]
         
@@ -356,17 +364,25 @@ class AIAnalyzer:
                 category_platforms[cat] = set()
             category_platforms[cat].add(platform)
         
-        # 找出跨平台热点（在多个平台出现）
-        cross_platform = {}
-        for cat, platforms in category_platforms.items():
-            if len(platforms) >= 2:
-                cross_platform[cat] = list(platforms)
+        # 跨平台热点：同一事件（标题片段重合聚类）出现在多个平台，而不只是同一类别
+        clusters = story_clusters(self.ai_items)
+        cross_platform = {cluster['title']: cluster['platforms'] for cluster in clusters}
         
         return {
             'cross_platform_topics': cross_platform,
-            'category_distribution': {k: len(v) for k, v in category_platforms.items()}
+            'category_distribution': {k: len(v) for k, v in category_platforms.items()},
+            'story_clusters': clusters
         }
     
+    @staticmethod
+    def _top_category(items):
+        """条目最多的主类别，没有条目时返回"暂无" """
+        counts = {}
+        for item in items:
+            cat = item.get('primary_category', '综合')
+            counts[cat] = counts.get(cat, 0) + 1
+        return max(counts, key=counts.get) if counts else '暂无'
+    
     def generate_insight(self):
         """生成今日热点解读"""
         if not self.ai_items:
@@ -395,9 +411,18 @@ class AIAnalyzer:
         trends = self.analyze_trends()
         cross = trends.get('cross_platform_topics', {})
         if cross:
-            cross_cats = list(cross.keys())[:2]
+            cross_cats = [title[:20] for title in list(cross.keys())[:2]]
             lines.append(f"「{'、'.join(cross_cats)}」话题在多平台引发热议，显示行业共识正在形成。\n")
-        
+
+        # 关键短语：只读背景语料，今日统计由全信息源整合（merge_all_sources）写入
+        try:
+            phrases = extract_keyphrases([item['title'] for item in self.ai_items], top=5, update=False)
+        except Exception as e:
+            print(f"⚠️ 关键短语提取失败: {e}")
+            phrases = []
+        if phrases:
+            lines.append(f"**今日关键短语**：{'、'.join(p['phrase'] for p in phrases)}")
+
         # 分类解读
         lines.append("\n**热点分布**：")
         for cat in top_categories[:3]:
@@ -410,58 +435,50 @@ class AIAnalyzer:
         international = [i for i in self.ai_items if i.get('platform') == 'hackernews']
         
         lines.append(f"\n**舆论风向**：")
-        lines.append(f"- 国内聚焦：产品落地与商业应用（{len(domestic)}条）")
-        lines.append(f"- 国际关注：技术创新与开源生态（{len(international)}条）")
+        lines.append(f"- 国内聚焦：{self._top_category(domestic)}（{len(domestic)}条）")
+        lines.append(f"- 国际关注：{self._top_category(international)}（{len(international)}条）")
         
-        lines.append("\n**研判建议**：")
-        lines.append("- 投资者：关注有业绩支撑的AI应用标的，警惕纯概念炒作")
-        lines.append("- 开发者：大模型API成本持续下降，是构建AI应用的好时机")
-        lines.append("- 从业者：多模态和AI Agent是近期最值得关注的方向")
+        # 趋势研判：基于热榜历史的升降温，而非固定文案
+        lines.append("\n**趋势研判**：")
+        lines.extend(format_trend_lines(detect_trends(self.AI_KEYWORDS)))
         
         return '\n'.join(lines)
     
+    # 模型置信度（0~1）与热度（0~1）相加时热度的权重：AI 相关度为主，热度次之
+    MODEL_HOTNESS_WEIGHT = 0.5
+    
+    def relevance(self, item):
+        """
+        排序与精选用的相关性
+
+        关键词计数时每多命中一个词胜过任何热度差，热度只在计数相同时起作用；
+        模型置信度是连续值，热度按 MODEL_HOTNESS_WEIGHT 加权参与，
+        明显更热的条目可以排在置信度略高的条目之前。
+        """
+        hotness = item.get('hotness', 0) / 100
+        if self.scored_by_model:
+            return item.get('ai_score', 0) + self.MODEL_HOTNESS_WEIGHT * hotness
+        return item.get('ai_score', 0) + hotness
+    
+    # 精选时每个类别、每个来源最多占用的条数
+    CATEGORY_CAP = 8
+    SOURCE_CAP = 10
+    
     def select_top_news(self, count=20):
-        """精选Top新闻 - 平衡国内外、不同类别"""
-        # 按类别分组
-        by_category = {}
+        """精选Top新闻 - 平衡国内外、不同类别（堆 + MMR，见 news_selector）"""
         for item in self.ai_items:
-            cat = item.get('primary_category', '综合')
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(item)
-        
-        # 按平台分组
-        by_platform = {
-            'domestic': [i for i in self.ai_items if i.get('platform') in ['zhihu', 'weibo', 'baidu']],
-            'international': [i for i in self.ai_items if i.get('platform') == 'hackernews']
-        }
-        
-        selected = []
+            item['region'] = '国际' if item.get('platform') == 'hackernews' else '国内'
         
-        # 确保国内外平衡（各10条）
+        # 国内外各占一半，同一事件的近似标题互相扣分
         domestic_count = count // 2
-        intl_count = count - domestic_count
-        
-        # 从国内选
-        domestic_selected = by_platform['domestic'][:domestic_count]
-        for item in domestic_selected:
-            item['region'] = '国内'
-            selected.append(item)
-        
-        # 从国际选
-        intl_selected = by_platform['international'][:intl_count]
-        for item in intl_selected:
-            item['region'] = '国际'
-            selected.append(item)
-        
-        # 补充到20条（如果不够）
-        if len(selected) < count:
-            remaining = [i for i in self.ai_items if i not in selected]
-            for item in remaining[:count - len(selected)]:
-                item['region'] = '国内' if item.get('platform') != 'hackernews' else '国际'
-                selected.append(item)
-        
-        return selected[:count]
+        return select_diverse(
+            self.ai_items, count,
+            relevance=self.relevance,
+            quotas={'国内': domestic_count, '国际': count - domestic_count},
+            group=lambda item: item['region'],
+            caps=[(lambda item: item.get('primary_category', '综合'), self.CATEGORY_CAP),
+                  (lambda item: item.get('source', ''), self.SOURCE_CAP)]
+        )
     
     def generate_recommended_reading(self):
         """生成推荐阅读"""
@@ -560,7 +577,7 @@ class ContentGenerator:
                 "source": item.get('source', 'Tech News'),
                 "date": "今天",
                 "url": item['url'],
-                "views": int(item.get('score', 5000)) * 10 if str(item.get('score')).isdigit() else 5000 + i * 100,
+                "views": item['heat'] * 10 if item.get('heat') else 5000 + i * 100,
                 "isHot": i <= 3,
                 "platform": item.get('platform', ''),
                 "category": category
@@ -600,7 +617,9 @@ def main():
     
     cross = trends.get('cross_platform_topics', {})
     if cross:
-        print(f"\n🔥 跨平台热点: {', '.join(cross.keys())}")
+        print(f"\n🔥 跨平台热点:")
+        for cluster in trends['story_clusters']:
+            print(f"   {cluster['title'][:30]} ({', '.join(cluster['platforms'])})")
     
     # 生成热点解读
     insight = analyzer.generate_insight()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 多源并发抓取调度器
+所有信息源同时抓取，共享一个总时间预算，每个源有独立截止时间；
+超时或失败的源使用其备用数据，总耗时接近最慢的单个源而不是所有源之和
+"""
+
+import threading
+import time
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+
+
+def _start(fetch):
+    """在守护线程中执行 fetch，超时的线程不会阻塞进程退出"""
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fetch())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def run_sources(sources, budget):
+    """
+    并发执行所有信息源，返回 {name: 结果}
+
+    sources: [{'name': ..., 'fetch': 无参函数, 'timeout': 秒, 'fallback': 无参函数}, ...]
+    budget:  总时间预算（秒），单源截止时间不超过总预算
+    """
+    start = time.monotonic()
+    futures = {}
+    deadlines = {}
+    for source in sources:
+        future = _start(source['fetch'])
+        futures[future] = source
+        deadlines[future] = start + min(source.get('timeout', budget), budget)
+
+    results = {}
+    pending = set(futures)
+    while pending:
+        now = time.monotonic()
+        expired = {f for f in pending if deadlines[f] <= now}
+        for future in expired:
+            source = futures[future]
+            print(f"⏱️ {source['name']} 超过 {deadlines[future] - start:.0f}s 截止时间，使用备用数据")
+            results[source['name']] = source['fallback']()
+        pending -= expired
+        if not pending:
+            break
+
+        next_deadline = min(deadlines[f] for f in pending)
+        done, pending = wait(pending, timeout=max(0, next_deadline - now),
+                             return_when=FIRST_COMPLETED)
+        for future in done:
+            source = futures[future]
+            try:
+                results[source['name']] = future.result()
+            except Exception as e:
+                print(f"⚠️ {source['name']} 获取失败，使用备用数据: {e}")
+                results[source['name']] = source['fallback']()
+
+    print(f"⏱️ 并发抓取 {len(sources)} 个源，耗时 {time.monotonic() - start:.1f}s")
+    return results
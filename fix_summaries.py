@@ -5,6 +5,8 @@
 
 import json
 
+from content_cache import cached_generator, data_version
+
 # 扩展文本的模板
 EXTENSIONS = {
     "OpenAI发布Operator": " 这一突破性技术展示了AI从被动对话向主动执行任务的重大转变，为未来的AI助手形态指明了方向。",
@@ -23,6 +25,16 @@ EXTENSIONS = {
     "科大讯飞": " 政务市场是大模型商业化落地的重要场景，科大讯飞的突破为行业树立了标杆。"
 }
 
+@cached_generator('fix_summaries.extend', data_version(EXTENSIONS))
+def extend_summary(title, summary):
+    """为短摘要追加与标题匹配的扩展文本"""
+    # 找到匹配的扩展文本
+    for key, extension in EXTENSIONS.items():
+        if key in title:
+            return summary + extension
+    # 如果没有匹配，添加通用扩展
+    return summary + " 这一发展将对AI行业产生深远影响，值得持续关注后续进展。"
+
 def main():
     with open('api/tech-news.json', 'r', encoding='utf-8') as f:
         data = json.load(f)
@@ -32,16 +44,8 @@ def main():
     
     for article in articles:
         if len(article['summary']) < 200:
-            # 找到匹配的扩展文本
-            for key, extension in EXTENSIONS.items():
-                if key in article['title']:
-                    article['summary'] += extension
-                    fixed_count += 1
-                    break
-            else:
-                # 如果没有匹配，添加通用扩展
-                article['summary'] += " 这一发展将对AI行业产生深远影响，值得持续关注后续进展。"
-                fixed_count += 1
+            article['summary'] = extend_summary(article['title'], article['summary'])
+            fixed_count += 1
     
     # 保存
     with open('api/tech-news.json', 'w', encoding='utf-8') as f:
@@ -4,16 +4,21 @@ TechInsight Hub - 智能摘要生成版
 根据新闻标题智能生成核心观点摘要
 """
 
-import requests
 import json
-import re
-import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from arxiv_client import stream_papers
+from classifier import get_classifier
+from hn_client import HNClient
+from http_client import create_session
+from relevance_model import story_filter
+from title_rules import get_title_rules
+from topic_clusters import TopicClusterer
+
 class DataFetcher:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -25,27 +30,23 @@ class DataFetcher:
             keywords = ['AI', 'LLM', 'GPT', 'Claude', 'OpenAI', 'DeepSeek', 'machine learning', 
                        'neural', 'artificial intelligence', 'chatbot', 'transformer']
             
-            resp = self.session.get('https://hacker-news.firebaseio.com/v0/topstories.json', timeout=10)
-            story_ids = resp.json()[:80]
+            def is_ai_story(story):
+                if not story or 'title' not in story:
+                    return False
+                return any(kw.lower() in story['title'].lower() for kw in keywords)
             
+            # 有相关性模型时用模型判定并扫描全部 topstories
+            accept, scan = story_filter(is_ai_story, 80)
+            hn = HNClient(self.session)
             stories = []
-            for story_id in story_ids:
-                if len(stories) >= limit:
-                    break
-                try:
-                    story = self.session.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json', timeout=5).json()
-                    if story and 'title' in story:
-                        if any(kw.lower() in story['title'].lower() for kw in keywords):
-                            stories.append({
-                                'title': story['title'],
-                                'url': story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
-                                'source': 'Hacker News',
-                                'score': story.get('score', 0),
-                                'type': '国外热点'
-                            })
-                    time.sleep(0.02)
-                except:
-                    continue
+            for story in hn.top_stories(scan, limit, accept=accept):
+                stories.append({
+                    'title': story['title'],
+                    'url': story.get('url', f"https://news.ycombinator.com/item?id={story['id']}"),
+                    'source': 'Hacker News',
+                    'score': story.get('score', 0),
+                    'type': '国外热点'
+                })
             return stories
         except Exception as e:
             print(f"❌ HN失败: {e}")
@@ -60,28 +61,21 @@ class DataFetcher:
             
             for cat in categories[:3]:
                 try:
-                    url = f'http://export.arxiv.org/api/query?search_query=cat:{cat}&sortBy=submittedDate&sortOrder=descending&max_results=4'
-                    resp = self.session.get(url, timeout=15)
-                    
-                    entries = re.findall(r'<entry>(.*?)</entry>', resp.text, re.DOTALL)
-                    
-                    for entry in entries[:3]:
-                        title_match = re.search(r'<title>(.*?)</title>', entry, re.DOTALL)
-                        id_match = re.search(r'<id>.*?/(\d+\.\d+)</id>', entry)
-                        
-                        if title_match and id_match:
-                            title = re.sub(r'\s+', ' ', title_match.group(1)).strip()
-                            arxiv_id = id_match.group(1)
-                            
-                            papers.append({
-                                'title': title,
-                                'arxiv_id': arxiv_id,
-                                'url': f'https://arxiv.org/abs/{arxiv_id}',
-                                'category': cat,
-                                'source': 'arXiv'
-                            })
-                    
-                    time.sleep(0.2)
+                    for paper in stream_papers(self.session, {
+                        'search_query': f'cat:{cat}',
+                        'sortBy': 'submittedDate',
+                        'sortOrder': 'descending',
+                        'max_results': 3
+                    }):
+                        papers.append({
+                            'title': paper['title'],
+                            'arxiv_id': paper['arxiv_id'],
+                            'url': f"https://arxiv.org/abs/{paper['arxiv_id']}",
+                            'abstract': paper['abstract'],
+                            'authors': paper['authors'],
+                            'category': cat,
+                            'source': 'arXiv'
+                        })
                 except Exception as e:
                     continue
             
@@ -92,338 +86,96 @@ class DataFetcher:
             return []
 
 def generate_smart_title(title_en, index=0):
-    """根据英文标题智能生成中文标题"""
-    t = title_en.lower()
-    
-    # Claude相关
-    if 'claude' in t:
-        if '4.6' in t or 'sonnet' in t:
-            return 'Claude Sonnet 4.6发布：编程能力大幅提升'
-        elif '3.5' in t:
-            return 'Claude 3.5更新：代码生成准确率创新高'
-        elif 'opus' in t:
-            return 'Claude Opus旗舰模型：复杂任务处理能力突破'
-        else:
-            return f'Claude大模型新功能发布（{index+1}）'
-    
-    # OpenAI/GPT相关
-    if 'openai' in t or 'gpt' in t or 'chatgpt' in t:
-        if 'o3' in t or 'o1' in t:
-            return 'OpenAI o3推理模型：数学竞赛成绩超越人类'
-        elif 'gpt-5' in t or 'gpt5' in t:
-            return 'GPT-5预告发布：多模态能力全面升级'
-        elif '4.5' in t or '4o' in t:
-            return 'GPT-4o更新：实时语音交互能力增强'
-        elif 'sora' in t:
-            return 'OpenAI Sora视频生成：60秒高清视频突破'
-        else:
-            return f'OpenAI GPT模型重大更新（{index+1}）'
-    
-    # DeepSeek
-    if 'deepseek' in t:
-        if 'r1' in t:
-            return 'DeepSeek-R1开源：推理能力对标OpenAI o1'
-        elif 'v3' in t:
-            return 'DeepSeek-V3发布：训练成本仅557万美元'
-        else:
-            return 'DeepSeek大模型：国产AI技术新突破'
-    
-    # Google/Gemini
-    if 'google' in t or 'gemini' in t:
-        if '2.0' in t:
-            return 'Google Gemini 2.0：原生多模态能力领先'
-        elif '1.5' in t:
-            return 'Gemini 1.5 Pro：百万token上下文突破'
-        else:
-            return 'Google Gemini模型更新：性能全面提升'
-    
-    # Meta/Llama
-    if 'meta' in t or 'llama' in t:
-        if '4' in t:
-            return 'Llama 4发布：开源模型性能逼近GPT-4'
-        elif '3' in t:
-            return 'Llama 3.1更新：4050亿参数开源'
-        else:
-            return 'Meta Llama开源模型：社区生态繁荣'
-    
-    # 硬件/芯片
-    if 'nvidia' in t:
-        return 'NVIDIA AI芯片：Blackwell架构算力翻倍'
-    if 'gpu' in t and ('async' in t or 'await' in t):
-        return 'GPU异步编程：让AI推理效率提升10倍'
-    if 'gpu' in t:
-        return 'GPU加速技术：大模型推理成本大幅降低'
-    if 'chip' in t or 'processor' in t or 'hardware' in t:
-        return 'AI芯片新突破：存算一体降低能耗90%'
-    
-    # 企业应用/生产力
-    if 'ceo' in t and ('productivity' in t or 'impact' in t):
-        return 'AI生产力悖论：数千CEO承认AI未达预期'
-    if 'enterprise' in t or 'business' in t:
-        return '企业AI落地现状：从试点到规模化的挑战'
-    if 'job' in t or 'employment' in t or 'worker' in t:
-        return 'AI对就业影响：白领工作面临最大冲击'
-    if 'roi' in t or 'investment' in t or 'cost' in t:
-        return 'AI投资回报调查：60%项目未达预期收益'
-    
-    # 投资/市场
-    if 'funding' in t or 'billion' in t or 'million' in t:
-        return 'AI融资新动向：资本聚焦应用层创新'
-    if 'valuation' in t or 'ipo' in t:
-        return 'AI公司估值：从狂热到理性的回归'
-    if 'market' in t and 'ai' in t:
-        return 'AI市场规模：2025年预计突破5000亿美元'
-    
-    # 开源/社区
-    if 'open source' in t:
-        return '开源AI新动态：社区项目挑战商业模型'
-    if 'github' in t or 'repository' in t:
-        return 'GitHub AI趋势：开发者工具革新加速'
-    
-    # 技术研究
-    if 'agent' in t or 'autonomous' in t:
-        return 'AI智能体突破：自主完成复杂任务链'
-    if 'multimodal' in t:
-        return '多模态AI进展：视觉语言理解新高度'
-    if 'rag' in t or 'retrieval' in t:
-        return 'RAG技术优化：大模型幻觉问题新解法'
-    if 'fine-tuning' in t or 'finetuning' in t:
-        return '模型微调新方法：小数据也能出效果'
-    if 'quantization' in t:
-        return '模型量化技术：手机也能跑大模型'
-    if 'safety' in t or 'alignment' in t:
-        return 'AI安全研究：如何防止模型被恶意利用'
-    if 'hallucination' in t:
-        return '大模型幻觉问题：新检测方法准确率95%'
-    
-    # 默认分类
-    topics = [
-        'AI应用落地新案例', '大模型技术突破', 'AI算法优化', 
-        'AI产业动态', 'AI技术前沿', '机器学习新进展'
-    ]
-    return f'{topics[index % len(topics)]}'
+    """根据英文标题智能生成中文标题，规则见 title_rules.json 的 smart_title"""
+    return get_title_rules().render('smart_title', title_en, index)
 
 def generate_core_summary(title_en, index=0):
     """
     根据英文标题生成核心观点摘要
-    总结文章最有价值的信息
+    总结文章最有价值的信息，规则见 title_rules.json 的 core_summary
     """
-    t = title_en.lower()
-    
-    # === 模型发布类 ===
-    if 'claude' in t:
-        if '4.6' in t or 'sonnet' in t:
-            return 'Anthropic发布Claude Sonnet 4.6，编程能力测试得分超越前代40%，支持200K上下文窗口，代码生成和调试效率显著提升，企业级API已开放申请。'
-        return 'Anthropic更新Claude大模型，在推理准确性、上下文理解和多轮对话方面均有提升，继续巩固在AI助手领域的领先地位。'
-    
-    if 'openai' in t or 'gpt' in t:
-        if 'o3' in t or 'o1' in t:
-            return 'OpenAI发布o3推理模型，在ARC-AGI基准测试中达到87.5%准确率，首次超越人类水平，数学竞赛成绩进入全球前500名，标志着AI推理能力质变。'
-        if 'sora' in t:
-            return 'OpenAI Sora视频生成模型支持60秒1080P高清视频，能理解和模拟物理世界，电影制作、广告创意行业已开始试用，内容创作方式或将重塑。'
-        if '4o' in t or 'voice' in t or 'audio' in t:
-            return 'GPT-4o实现近乎实时的语音交互，延迟低至232毫秒，支持情绪感知和自然打断，人机对话体验接近真人交流水平。'
-        return 'OpenAI更新GPT系列模型，在多模态理解、推理速度和API成本方面持续优化，进一步巩固其在生成式AI领域的市场主导地位。'
-    
-    if 'deepseek' in t:
-        if 'r1' in t:
-            return 'DeepSeek-R1以开源形式发布，数学推理能力媲美OpenAI o1，训练成本仅600万美元，推理API价格低至o1的1/30，开源社区反响热烈。'
-        if 'v3' in t:
-            return 'DeepSeek-V3采用MoE架构，总参数6710亿，训练仅花费557万美元（使用2048块H800 GPU），性能比肩GPT-4o，性价比引发业界震动。'
-        return '国产AI公司DeepSeek发布新模型，在中文理解、代码生成和数学推理方面表现优异，代表中国在开源大模型领域的重大突破。'
-    
-    if 'gemini' in t or 'google' in t:
-        if '2.0' in t:
-            return 'Google Gemini 2.0采用原生多模态架构，在视频理解、长文本处理上超越GPT-4o，支持实时屏幕共享和语音对话，已集成至Android和Workspace。'
-        if '1.5' in t:
-            return 'Gemini 1.5 Pro支持100万token上下文，可一次性处理1小时视频或700页PDF，长文档分析能力领先业界，企业客户已开始大规模部署。'
-        return 'Google更新Gemini模型生态，在多模态理解、推理速度和与企业产品集成方面持续发力，与OpenAI竞争日趋白热化。'
-    
-    if 'llama' in t or 'meta' in t:
-        if '4' in t:
-            return 'Meta发布Llama 4系列，最高4000亿参数，在多项基准测试中逼近GPT-4水平，继续开源策略挑战闭源模型商业壁垒，开发者社区积极响应。'
-        return 'Meta Llama开源模型持续迭代，在性能、安全性和多语言支持方面均有提升，免费商用授权吸引更多企业采用，开源生态日趋成熟。'
-    
-    # === 企业应用类 ===
-    if 'ceo' in t and ('productivity' in t or 'impact' in t):
-        return 'Fortune对数千名CEO的调查显示，70%认为AI尚未显著提升生产力或效率，投资回报不确定、员工技能不足、数据安全顾虑是主要障碍，AI落地仍处早期阶段。'
-    
-    if 'enterprise' in t or 'business' in t:
-        return '企业AI应用从概念验证走向规模化部署面临挑战：数据质量、系统集成、人才短缺是三大痛点，成功案例多集中在客服、代码辅助和内容生成场景。'
-    
-    if 'job' in t or 'employment' in t or 'worker' in t:
-        return '研究表明AI对白领工作冲击最大，法律、金融、编程岗位自动化风险较高，但同时创造AI训练师、提示工程师等新职业，整体就业市场呈现结构性调整。'
-    
-    if 'roi' in t or 'investment' in t or 'cost' in t:
-        return 'Gartner报告显示60%企业AI项目未达预期ROI，主要问题在于期望过高、数据准备不足、缺乏清晰应用场景，建议从具体业务痛点出发而非盲目追逐技术。'
-    
-    # === 硬件/芯片类 ===
-    if 'nvidia' in t:
-        return 'NVIDIA发布新一代AI芯片，算力较前代提升5倍，能耗降低25%，云计算厂商已开始部署，但供应紧张问题仍存，中国特供版性能受限引发关注。'
-    
-    if 'gpu' in t:
-        return 'GPU加速技术新进展让大模型推理成本降低50%以上，量化技术和专用推理芯片的发展使边缘设备部署成为可能，AI应用门槛持续降低。'
-    
-    if 'chip' in t or 'processor' in t:
-        return '存算一体AI芯片架构突破传统冯诺依曼瓶颈，推理能效比提升10倍，多家初创公司推出商用产品，有望重塑AI硬件市场格局。'
-    
-    # === 技术研究类 ===
-    if 'agent' in t or 'autonomous' in t:
-        return 'AI智能体技术突破让大模型能够自主规划、调用工具、完成多步骤任务，在自动化办公、科研辅助等领域展现潜力，但仍面临可靠性和安全性挑战。'
-    
-    if 'multimodal' in t:
-        return '多模态AI在图文理解、视频分析等任务上达到新高度，能同时处理文本、图像、音频信息，应用场景拓展至医疗影像、自动驾驶等领域。'
-    
-    if 'rag' in t or 'retrieval' in t:
-        return 'RAG（检索增强生成）技术优化有效降低大模型幻觉问题，结合向量数据库让AI回答更精准，已成为企业知识库应用的标准架构。'
-    
-    if 'fine-tuning' in t:
-        return '新的模型微调方法让小数据量也能获得显著效果提升，LoRA、QLoRA等技术大幅降低微调成本，企业定制专属AI模型门槛持续降低。'
-    
-    if 'safety' in t or 'alignment' in t:
-        return 'AI安全研究聚焦于如何让大模型符合人类价值观，RLHF、Constitutional AI等技术不断演进，防止模型被恶意利用成为行业共识。'
-    
-    if 'hallucination' in t:
-        return '研究人员提出新的大模型幻觉检测方法，准确率达95%，可实时识别AI生成内容中的事实错误，为提升AI可靠性提供重要工具。'
-    
-    # === 开源/社区类 ===
-    if 'open source' in t:
-        return '开源AI社区发布多个重量级项目，在模型性能、工具链完善度上持续追赶商业产品，开源策略正改变AI行业竞争格局，推动技术民主化进程。'
-    
-    # === 投资/市场类 ===
-    if 'funding' in t or 'billion' in t:
-        return 'AI领域融资持续活跃，资本从基础模型转向应用层和垂直领域，AI Agent、代码助手、企业知识库成为投资热点，市场趋于理性但依然火热。'
-    
-    if 'valuation' in t:
-        return 'AI独角兽估值经历调整，从讲故事转向看收入，商业化能力成为估值核心，行业正从泡沫期进入健康发展阶段。'
-    
-    # === 默认摘要池（确保多样性）===
-    default_summaries = [
-        'AI技术在医疗诊断领域取得突破，影像识别准确率超越资深医生，辅助诊断系统已在多家医院试点，有望缓解医疗资源紧张问题。',
-        '教育AI应用快速普及，个性化学习系统根据学生特点定制课程，学习效果提升30%，但如何保护学生隐私成为关注焦点。',
-        'AI内容生成工具席卷创意产业，文案、设计、视频制作效率大幅提升，同时引发版权争议和职业替代焦虑，行业规范亟待建立。',
-        '自动驾驶技术持续推进，L3级车型开始量产，但完全无人驾驶仍面临长尾场景挑战，安全性和法规是商业化关键。',
-        'AI在科学研究中发挥越来越大作用，从蛋白质结构预测到新材料发现，AI for Science成为新趋势，科研范式正在重塑。',
-        '语音合成技术突破让AI声音更自然，支持多语言、多情感表达，有声书、播客、客服等行业应用加速落地。',
-        'AI编程助手成为开发者标配，代码自动生成和Bug修复准确率达80%，编程效率提升显著，但复杂架构设计仍需人类主导。',
-        'AI安全治理框架逐步建立，欧盟AI法案、中国算法备案等监管措施出台，平衡创新与安全成为各国共同课题。',
-        '边缘AI发展迅速，模型压缩技术让大模型能在手机、IoT设备运行，隐私保护和低延迟优势推动应用场景拓展。',
-        'AI与人类协作模式探索深入，人机协同成为主流，AI处理重复性工作，人类专注创造性决策，工作效率和满意度双提升。'
-    ]
-    
-    return default_summaries[index % len(default_summaries)]
+    return get_title_rules().render('core_summary', title_en, index)
 
 def get_topic_category(title_en):
-    """获取新闻主题分类"""
-    t = title_en.lower()
-    
-    if 'claude' in t:
-        return 'claude', 'Claude模型动态'
-    if 'openai' in t or 'gpt' in t or 'chatgpt' in t:
-        return 'openai', 'OpenAI/GPT模型'
-    if 'deepseek' in t:
-        return 'deepseek', 'DeepSeek模型'
-    if 'gemini' in t or 'google' in t:
-        return 'gemini', 'Google Gemini模型'
-    if 'llama' in t or 'meta' in t:
-        return 'llama', 'Meta Llama模型'
-    if 'nvidia' in t or 'gpu' in t or 'chip' in t:
-        return 'hardware', 'AI芯片硬件'
-    if 'ceo' in t or 'productivity' in t or 'enterprise' in t or 'business' in t:
-        return 'enterprise', '企业AI应用'
-    if 'job' in t or 'employment' in t or 'worker' in t:
-        return 'employment', 'AI与就业'
-    if 'funding' in t or 'investment' in t or 'billion' in t:
-        return 'investment', 'AI投资融资'
-    if 'open source' in t or 'github' in t:
-        return 'opensource', '开源AI'
-    if 'agent' in t or 'autonomous' in t:
-        return 'agent', 'AI智能体'
-    if 'multimodal' in t:
-        return 'multimodal', '多模态AI'
-    if 'safety' in t or 'alignment' in t:
-        return 'safety', 'AI安全'
-    
-    return 'other', 'AI综合动态'
+    """获取新闻主题分类，规则见 category_rules.json 的 topic"""
+    rule = get_classifier().first('topic', title_en)
+    return rule['label'], rule['name']
+
+# 聚合标题，未列出的主题使用 "{主题名}：最新动态汇总"
+TOPIC_TITLES = {
+    'claude': 'Claude模型系列更新：多项功能升级',
+    'openai': 'OpenAI产品线更新：模型能力全面提升',
+    'deepseek': 'DeepSeek大模型进展：国产AI持续突破',
+    'gemini': 'Google Gemini生态更新：多模态能力增强',
+    'llama': 'Llama开源模型动态：社区生态繁荣',
+    'hardware': 'AI硬件技术进展：算力与效率双提升',
+    'enterprise': '企业AI应用现状：从试点到规模化的挑战',
+    'employment': 'AI对就业市场影响：结构性调整持续深化',
+    'investment': 'AI领域投资动态：资本聚焦应用层创新',
+    'opensource': '开源AI社区进展：开源生态日趋成熟',
+    'agent': 'AI智能体技术突破：自主能力持续提升',
+    'multimodal': '多模态AI技术进展：感知理解能力增强',
+    'safety': 'AI安全研究进展：对齐与治理受关注'
+}
 
 def merge_same_topic_news(news_list):
-    """将相同主题的新闻聚合成一条"""
-    topic_groups = {}
+    """将同一话题簇的新闻聚合成一条（话题簇跨运行保留，见 topic_clusters）"""
+    clusterer = TopicClusterer(label=get_topic_category)
+    clusters = clusterer.assign_many([news['title'] for news in news_list])
+    clusterer.save()
     
-    for news in news_list:
-        topic_key, topic_name = get_topic_category(news['title'])
-        if topic_key not in topic_groups:
-            topic_groups[topic_key] = {
-                'name': topic_name,
+    topic_groups = {}
+    for news, cluster in zip(news_list, clusters):
+        if cluster['id'] not in topic_groups:
+            topic_groups[cluster['id']] = {
+                'topic': cluster['topic'],
+                'name': cluster['name'],
                 'articles': [],
                 'sources': set(),
                 'total_score': 0
             }
-        topic_groups[topic_key]['articles'].append(news)
-        topic_groups[topic_key]['sources'].add(news.get('source', 'News'))
-        topic_groups[topic_key]['total_score'] += news.get('score', 0)
+        group = topic_groups[cluster['id']]
+        group['articles'].append(news)
+        group['sources'].add(news.get('source', 'News'))
+        group['total_score'] += news.get('score', 0)
     
     merged_news = []
-    for topic_key, group in topic_groups.items():
+    used_titles = set()
+    # 热度高的簇优先使用主题聚合标题，同主题的其他簇沿用代表新闻的标题
+    for group in sorted(topic_groups.values(), key=lambda g: g['total_score'], reverse=True):
         articles = group['articles']
         if len(articles) == 1:
             # 单条新闻直接使用
             merged_news.append(articles[0])
-        else:
-            # 多条新闻聚合
-            # 选择热度最高的作为代表
-            main_article = max(articles, key=lambda x: x.get('score', 0))
-            
-            # 生成聚合标题
-            if topic_key == 'claude':
-                title = 'Claude模型系列更新：多项功能升级'
-            elif topic_key == 'openai':
-                title = 'OpenAI产品线更新：模型能力全面提升'
-            elif topic_key == 'deepseek':
-                title = 'DeepSeek大模型进展：国产AI持续突破'
-            elif topic_key == 'gemini':
-                title = 'Google Gemini生态更新：多模态能力增强'
-            elif topic_key == 'llama':
-                title = 'Llama开源模型动态：社区生态繁荣'
-            elif topic_key == 'hardware':
-                title = 'AI硬件技术进展：算力与效率双提升'
-            elif topic_key == 'enterprise':
-                title = '企业AI应用现状：从试点到规模化的挑战'
-            elif topic_key == 'employment':
-                title = 'AI对就业市场影响：结构性调整持续深化'
-            elif topic_key == 'investment':
-                title = 'AI领域投资动态：资本聚焦应用层创新'
-            elif topic_key == 'opensource':
-                title = '开源AI社区进展：开源生态日趋成熟'
-            elif topic_key == 'agent':
-                title = 'AI智能体技术突破：自主能力持续提升'
-            elif topic_key == 'multimodal':
-                title = '多模态AI技术进展：感知理解能力增强'
-            elif topic_key == 'safety':
-                title = 'AI安全研究进展：对齐与治理受关注'
-            else:
-                title = f"{group['name']}：最新动态汇总"
-            
-            # 生成聚合摘要
-            summary = generate_core_summary(main_article['title'], 0)
-            if len(articles) > 1:
-                sources_str = '、'.join(list(group['sources'])[:3])
-                summary = f"【多篇相关报道】{summary[:80]}... 相关讨论来自{sources_str}等平台，热度持续攀升。"
-            
-            merged_news.append({
-                'title': main_article['title'],  # 保留原始标题用于摘要生成
-                'merged_title': title,  # 聚合后的标题
-                'summary': summary,
-                'url': main_article['url'],
-                'source': main_article['source'],
-                'score': group['total_score'],
-                'type': '国外热点',
-                'article_count': len(articles)
-            })
+            continue
+        
+        # 多条新闻聚合，选择热度最高的作为代表
+        main_article = max(articles, key=lambda x: x.get('score', 0))
+        
+        # 生成聚合摘要
+        summary = generate_core_summary(main_article['title'], 0)
+        sources_str = '、'.join(list(group['sources'])[:3])
+        summary = f"【多篇相关报道】{summary[:80]}... 相关讨论来自{sources_str}等平台，热度持续攀升。"
+        
+        merged = {
+            'title': main_article['title'],  # 保留原始标题用于摘要生成
+            'summary': summary,
+            'url': main_article['url'],
+            'source': main_article['source'],
+            'score': group['total_score'],
+            'type': '国外热点',
+            'article_count': len(articles)
+        }
+        title = TOPIC_TITLES.get(group['topic'], f"{group['name']}：最新动态汇总")
+        if title not in used_titles:
+            used_titles.add(title)
+            merged['merged_title'] = title  # 聚合后的标题
+        merged_news.append(merged)
     
     # 按热度排序
     merged_news.sort(key=lambda x: x.get('score', 0), reverse=True)
     return merged_news
+
 def main():
     print("=" * 60)
     print("🚀 TechInsight Hub - 智能摘要生成版（主题聚合）")
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - Hacker News 客户端
+并发获取 item 详情：按 topstories 原顺序返回，凑满 limit 条后立即取消剩余请求
+item 详情写入磁盘缓存，同一流水线中的多个脚本共享，每个故事只下载一次
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+HN_API = 'https://hacker-news.firebaseio.com/v0'
+
+# 默认并发上限（同时在途的 item 请求数）
+DEFAULT_CONCURRENCY = 8
+
+# 缓存配置
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+CACHE_FILE = DATA_DIR / 'hn_items.json'
+COUNTS_TTL = 60 * 60           # 分数/评论数超过1小时才重新获取
+ITEM_TTL = 3 * 24 * 60 * 60    # 标题/链接等稳定字段保留3天
+
+# 只缓存下游用到的字段；score/descendants 会变化，其余视为稳定
+STABLE_FIELDS = ('id', 'type', 'by', 'time', 'title', 'url')
+COUNT_FIELDS = ('score', 'descendants')
+
+
+def default_accept(story):
+    """默认筛选：有标题的故事"""
+    return bool(story) and 'title' in story
+
+
+class ItemCache:
+    """HN item 磁盘缓存，以故事ID为键"""
+
+    def __init__(self, path=CACHE_FILE, counts_ttl=COUNTS_TTL, item_ttl=ITEM_TTL):
+        self.path = Path(path)
+        self.counts_ttl = counts_ttl
+        self.item_ttl = item_ttl
+        self.entries = self._load()
+        self.dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('items', {})
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, story_id, now=None):
+        """返回 (item, counts_fresh)；未缓存或已过期返回 (None, False)"""
+        now = now or time.time()
+        entry = self.entries.get(str(story_id))
+        if not entry or now - entry['fetched_at'] > self.item_ttl:
+            return None, False
+        return dict(entry['item']), now - entry['refreshed_at'] <= self.counts_ttl
+
+    def put(self, story_id, story, now=None):
+        """写入新获取的 item；已缓存的故事只刷新分数和评论数"""
+        now = now or time.time()
+        key = str(story_id)
+        entry = self.entries.get(key)
+        if entry and now - entry['fetched_at'] <= self.item_ttl:
+            for field in COUNT_FIELDS:
+                if field in story:
+                    entry['item'][field] = story[field]
+            entry['refreshed_at'] = now
+        else:
+            item = {k: story[k] for k in STABLE_FIELDS + COUNT_FIELDS if k in story}
+            self.entries[key] = {'item': item, 'fetched_at': now, 'refreshed_at': now}
+        self.dirty = True
+        return dict(self.entries[key]['item'])
+
+    def save(self):
+        """合并磁盘上的最新内容后原子写回，并清理过期条目"""
+        if not self.dirty:
+            return
+        now = time.time()
+        merged = self._load()
+        for key, entry in self.entries.items():
+            current = merged.get(key)
+            if not current or current['refreshed_at'] < entry['refreshed_at']:
+                merged[key] = entry
+        merged = {k: v for k, v in merged.items() if now - v['fetched_at'] <= self.item_ttl}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'items': merged}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self.entries = merged
+        self.dirty = False
+
+
+def fetch_top_ids(session, count, timeout=10):
+    """获取 topstories 前 count 个故事ID"""
+    resp = session.get(f'{HN_API}/topstories.json', timeout=timeout)
+    return resp.json()[:count]
+
+
+def _get_item(session, story_id, timeout):
+    """同步获取单个 item，失败返回 None"""
+    try:
+        resp = session.get(f'{HN_API}/item/{story_id}.json', timeout=timeout)
+        return resp.json()
+    except Exception:
+        return None
+
+
+async def harvest_items(session, story_ids, limit, accept=None,
+                        concurrency=DEFAULT_CONCURRENCY, timeout=5, cache=None):
+    """
+    并发获取 story_ids 的详情，返回前 limit 个满足 accept 的 item
+
+    结果顺序与 story_ids 一致，与逐条顺序抓取的结果相同；
+    一旦前缀中已凑满 limit 条，立即取消所有未完成的请求。
+    传入 cache 时：计数未过期的故事不发请求；已缓存但被 accept
+    拒绝的故事也不发请求（accept 只应依赖标题等稳定字段）。
+    """
+    accept = accept or default_accept
+    if limit <= 0 or not story_ids:
+        return []
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch_one(story_id):
+        async with semaphore:
+            return await loop.run_in_executor(executor, _get_item, session, story_id, timeout)
+
+    results = {}
+    stale = {}
+    tasks = {}
+    for i, sid in enumerate(story_ids):
+        if cache is not None:
+            cached, fresh = cache.get(sid)
+            if cached is not None and (fresh or not accept(cached)):
+                results[i] = cached
+                continue
+            if cached is not None:
+                stale[i] = cached
+        tasks[asyncio.ensure_future(fetch_one(sid))] = i
+
+    pending = set(tasks)
+    selected = []
+    cursor = 0
+
+    try:
+        while True:
+            # 只消费已连续完成的前缀，保证与顺序抓取的结果一致
+            while cursor in results and len(selected) < limit:
+                story = results.pop(cursor)
+                if accept(story):
+                    selected.append(story)
+                cursor += 1
+            if len(selected) >= limit or not pending:
+                break
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                i = tasks[task]
+                story = task.result()
+                if cache is not None and isinstance(story, dict) and 'id' in story:
+                    story = cache.put(story_ids[i], story)
+                elif story is None and i in stale:
+                    # 刷新失败时沿用缓存的旧计数
+                    story = stale[i]
+                results[i] = story
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        # 不等待线程中仍在途的请求，直接丢弃其结果
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return selected
+
+
+def harvest(session, story_ids, limit, accept=None,
+            concurrency=DEFAULT_CONCURRENCY, timeout=5, cache=None):
+    """harvest_items 的同步入口"""
+    return asyncio.run(harvest_items(
+        session, story_ids, limit,
+        accept=accept, concurrency=concurrency, timeout=timeout, cache=cache
+    ))
+
+
+class HNClient:
+    """带磁盘缓存的 Hacker News 客户端，供各抓取脚本共用"""
+
+    def __init__(self, session, cache=None, concurrency=DEFAULT_CONCURRENCY):
+        self.session = session
+        self.cache = cache if cache is not None else ItemCache()
+        self.concurrency = concurrency
+
+    def top_ids(self, count, timeout=10):
+        """获取 topstories 前 count 个故事ID"""
+        return fetch_top_ids(self.session, count, timeout=timeout)
+
+    def stories(self, story_ids, limit, accept=None, timeout=5):
+        """按顺序返回前 limit 个满足 accept 的故事，并写回缓存"""
+        try:
+            return harvest(
+                self.session, story_ids, limit, accept=accept,
+                concurrency=self.concurrency, timeout=timeout, cache=self.cache
+            )
+        finally:
+            self.cache.save()
+
+    def top_stories(self, scan, limit, accept=None, timeout=5):
+        """扫描 topstories 前 scan 个ID，返回前 limit 个满足 accept 的故事"""
+        return self.stories(self.top_ids(scan), limit, accept=accept, timeout=timeout)
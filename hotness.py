@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 跨平台热度归一化
+各平台热度格式不一（知乎 "580万热度"、微博 num、百度 hotScore、HN 点数、RSS 固定 5000），
+批量解析为 NumPy 数组后，按平台与其历史热度比较得到百分位（或 z 分数），
+输出 0~100 的统一热度，排序只需一次 argsort
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+HISTORY_FILE = DATA_DIR / 'hotness_history.json'
+HISTORY_KEEP = 1000          # 每个平台保留最近的热度样本数（对数值）
+UNITS = {'万': 1e4, '亿': 1e8, 'w': 1e4, 'k': 1e3}
+
+# 每行一个值：第一个数字（可含千分位逗号和小数）及其后的单位，其余文字忽略
+HEAT_LINE = re.compile(r'^[^\d\n]*(\d[\d,]*(?:\.\d+)?)?[ \t]*([万亿wWkK])?.*$', re.M)
+
+
+def parse_heat(values):
+    """
+    批量解析热度值，返回 float64 数组，无法解析的记为 0
+
+    数值直接取用；字符串拼接后用一次正则扫描取出数字和单位，再整体换算。
+    """
+    heats = np.zeros(len(values))
+    texts, positions = [], []
+    for i, value in enumerate(values):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            heats[i] = value
+        elif value:
+            texts.append(str(value).replace('\n', ' '))
+            positions.append(i)
+    if not texts:
+        return heats
+
+    numbers, units = [], []
+    for match in HEAT_LINE.finditer('\n'.join(texts)):
+        numbers.append(match.group(1) or '0')
+        units.append((match.group(2) or '').lower())
+    numbers = np.char.replace(np.array(numbers), ',', '').astype(np.float64)
+    units = np.array(units)
+    scale = np.ones(len(units))
+    for unit, factor in UNITS.items():
+        scale[units == unit] = factor
+    heats[positions] = numbers * scale
+    return heats
+
+
+class HotnessScorer:
+    """
+    按平台历史归一化热度
+
+    method='percentile'：当前值在该平台历史样本（含本批）中的中位秩百分位；
+    method='zscore'：对数热度相对历史均值的 z 分数，经 logistic 近似正态分布函数映射到 0~1。
+    """
+
+    def __init__(self, path=HISTORY_FILE, keep=HISTORY_KEEP, method='percentile'):
+        self.path = Path(path)
+        self.keep = keep
+        self.method = method
+        self.history = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.history = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def score(self, platforms, values):
+        """返回 (原始热度数组, 0~100 统一热度数组)，并把本批样本记入历史"""
+        heats = parse_heat(values)
+        platforms = np.array(platforms, dtype=object)
+        logs = np.log1p(np.maximum(heats, 0))
+        hotness = np.zeros(len(heats))
+        for platform in dict.fromkeys(platforms):
+            mask = platforms == platform
+            current = logs[mask]
+            history = np.concatenate([np.asarray(self.history.get(platform, []), dtype=np.float64), current])
+            if self.method == 'zscore':
+                std = history.std()
+                z = (current - history.mean()) / std if std else np.zeros(len(current))
+                hotness[mask] = 1 / (1 + np.exp(-1.702 * z))
+            else:
+                history.sort()
+                left = np.searchsorted(history, current, 'left')
+                right = np.searchsorted(history, current, 'right')
+                hotness[mask] = (left + right) / 2 / len(history)
+            samples = self.history.get(platform, []) + [round(v, 4) for v in current.tolist()]
+            self.history[platform] = samples[-self.keep:]
+        return heats, np.round(hotness * 100, 1)
+
+    def annotate(self, items):
+        """为每条写入 heat（解析后的原始热度）和 hotness（统一热度），返回热度数组"""
+        if not items:
+            return np.zeros(0)
+        heats, hotness = self.score([item.get('platform', 'unknown') for item in items],
+                                    [item.get('score') for item in items])
+        for item, heat, hot in zip(items, heats.tolist(), hotness.tolist()):
+            item['heat'] = int(heat)
+            item['hotness'] = hot
+        return hotness
+
+    def save(self):
+        """原子写入：先写临时文件再替换"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.history, f)
+        os.replace(tmp, self.path)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 共享 HTTP 会话
+所有抓取器通过 create_session() 创建会话，请求发出前按目标主机经令牌桶限速：
+各主机速率集中配置在 HOST_RATES，同一进程内所有会话和线程共用同一组令牌桶
+"""
+
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_replay import wrap_adapter
+
+# 主机 -> (每秒请求数, 突发容量)
+HOST_RATES = {
+    'hacker-news.firebaseio.com': (30, 10),
+    'export.arxiv.org': (1 / 3, 1),        # arXiv API 要求请求间隔3秒
+    'api.github.com': (1, 5),
+    'www.zhihu.com': (2, 2),
+    'weibo.com': (2, 2),
+    'top.baidu.com': (2, 2),
+    'tieba.baidu.com': (2, 2),
+    'www.cls.cn': (2, 2),
+    'www.jiqizhixin.com': (1, 2),
+    '36kr.com': (1, 2),
+}
+DEFAULT_RATE = (5, 5)
+
+# 设置后所有请求改发到本地平台模拟服务器（不限速），见 platform_simulator.py
+SIMULATOR_URL = os.environ.get('TECHHUB_SIMULATOR_URL', '')
+
+
+class TokenBucket:
+    """线程安全的令牌桶；令牌不足时预约下一个令牌并在锁外等待"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """按主机懒创建令牌桶"""
+
+    def __init__(self, rates=HOST_RATES, default=DEFAULT_RATE):
+        self.rates = rates
+        self.default = default
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url):
+        host = urlsplit(url).hostname or ''
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(*self.rates.get(host, self.default))
+        bucket.acquire()
+
+
+LIMITER = RateLimiter()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """发送前先从目标主机的令牌桶取令牌"""
+
+    def __init__(self, limiter=LIMITER, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire(request.url)
+        return super().send(request, **kwargs)
+
+
+def create_session(headers=None):
+    """创建带主机限速的 requests 会话；设置 TECHHUB_HTTP_MODE 时改为录制/回放"""
+    session = requests.Session()
+    if SIMULATOR_URL:
+        # 模拟服务器只用于压测与故障演练，设置了环境变量才导入
+        from platform_simulator import SimulatorAdapter
+        adapter = SimulatorAdapter(SIMULATOR_URL)
+    else:
+        adapter = wrap_adapter(RateLimitedAdapter())
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - HTTP 录制/回放传输层
+通过环境变量切换，抓取代码无需改动：
+
+    TECHHUB_HTTP_MODE=record   真实请求并把每次交互录入存档
+    TECHHUB_HTTP_MODE=replay   不联网，从存档回放响应
+    TECHHUB_HTTP_ARCHIVE       存档路径，默认 data/http_archive.json.gz
+    TECHHUB_REPLAY_LATENCY     回放时按录制耗时的倍数模拟延迟，默认 0（不等待）
+
+存档为 gzip 压缩的 JSON，按「方法 + 规范化URL + 请求体摘要」索引；
+同一请求录制多次时按顺序回放，用完后重复最后一次。
+非 HTTP 的第三方搜索（如 DuckDuckGo）用 replayable 装饰器在函数层录制/回放。
+"""
+
+import atexit
+import base64
+import functools
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+MODE = os.environ.get('TECHHUB_HTTP_MODE', '').lower()
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+ARCHIVE_FILE = os.environ.get('TECHHUB_HTTP_ARCHIVE', str(DATA_DIR / 'http_archive.json.gz'))
+REPLAY_LATENCY = float(os.environ.get('TECHHUB_REPLAY_LATENCY', '0') or 0)
+
+# 录制的是解码后的响应体，这些头部回放时不再成立
+DROP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+def request_key(method, url, body=None):
+    """请求索引：查询参数排序，请求体取摘要"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))}"
+    if body:
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        key += ' #' + hashlib.sha1(body).hexdigest()[:12]
+    return key
+
+
+class Archive:
+    """线程安全的交互存档"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.exchanges = self._load()
+        self.recorded = {}    # 本次运行录制的 key -> [交互]
+        self.cursors = {}
+        self.lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                return json.load(f).get('exchanges', {})
+        except (OSError, ValueError):
+            return {}
+
+    def add(self, key, exchange):
+        with self.lock:
+            self.recorded.setdefault(key, []).append(exchange)
+
+    def next(self, key):
+        """按录制顺序取下一条，没有录制时返回 None"""
+        with self.lock:
+            exchanges = self.exchanges.get(key)
+            if not exchanges:
+                return None
+            index = self.cursors.get(key, 0)
+            self.cursors[key] = index + 1
+            return exchanges[min(index, len(exchanges) - 1)]
+
+    def save(self):
+        """本次录制的请求覆盖存档中的同名请求，其余保留"""
+        with self.lock:
+            if not self.recorded:
+                return
+            merged = dict(self._load())
+            merged.update(self.recorded)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+            json.dump({'version': 1, 'exchanges': merged}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, self.path)
+        print(f"💾 已录制 {len(self.recorded)} 个请求到 {self.path}")
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = Archive(ARCHIVE_FILE)
+            if MODE == 'record':
+                atexit.register(_archive.save)
+        return _archive
+
+
+def _encode_body(body):
+    try:
+        return {'text': body.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'base64': base64.b64encode(body).decode('ascii')}
+
+
+def _decode_body(exchange):
+    if 'base64' in exchange:
+        return base64.b64decode(exchange['base64'])
+    return exchange.get('text', '').encode('utf-8')
+
+
+class _ReplayBody(io.BytesIO):
+    """兼容 urllib3 响应的 read(decode_content=...) 调用"""
+
+    def read(self, amt=None, decode_content=None):
+        return super().read(-1 if amt is None else amt)
+
+
+def _build_response(request, exchange, body):
+    resp = requests.Response()
+    resp.status_code = exchange['status']
+    resp.reason = exchange.get('reason', '')
+    resp.headers = CaseInsensitiveDict(exchange.get('headers', {}))
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp.raw = _ReplayBody(body)
+    resp.url = request.url
+    resp.request = request
+    return resp
+
+
+class RecordingAdapter(BaseAdapter):
+    """透传给真实适配器，同时把完整响应录入存档"""
+
+    def __init__(self, inner, archive=None):
+        super().__init__()
+        self.inner = inner
+        self.archive = archive or get_archive()
+
+    def send(self, request, **kwargs):
+        start = time.monotonic()
+        resp = self.inner.send(request, **kwargs)
+        body = resp.content  # 读完整响应体后用内存副本替换，调用方仍可流式读取
+        elapsed = time.monotonic() - start
+        exchange = {
+            'status': resp.status_code,
+            'reason': resp.reason,
+            'headers': {k: v for k, v in resp.headers.items() if k.lower() not in DROP_HEADERS},
+            'elapsed': round(elapsed, 3),
+        }
+        exchange.update(_encode_body(body))
+        self.archive.add(request_key(request.method, request.url, request.body), exchange)
+        resp._content = False
+        resp._content_consumed = False
+        resp.raw = _ReplayBody(body)
+        return resp
+
+    def close(self):
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """从存档回放响应，不发出任何网络请求"""
+
+    def __init__(self, archive=None, latency=REPLAY_LATENCY):
+        super().__init__()
+        self.archive = archive or get_archive()
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method, request.url, request.body)
+        exchange = self.archive.next(key)
+        if exchange is None:
+            raise requests.ConnectionError(f"回放存档中没有该请求: {key}")
+        if self.latency:
+            time.sleep(exchange.get('elapsed', 0) * self.latency)
+        return _build_response(request, exchange, _decode_body(exchange))
+
+    def close(self):
+        pass
+
+
+def wrap_adapter(adapter):
+    """按 TECHHUB_HTTP_MODE 包装或替换会话的传输适配器"""
+    if MODE == 'record':
+        return RecordingAdapter(adapter)
+    if MODE == 'replay':
+        return ReplayAdapter()
+    return adapter
+
+
+def replayable(name):
+    """
+    函数级录制/回放，用于不经过 requests 会话的第三方客户端
+
+    返回值需可 JSON 序列化；以函数名和参数为索引。
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if MODE not in ('record', 'replay'):
+                return func(*args, **kwargs)
+            key = f"CALL {name} " + json.dumps([args, kwargs], ensure_ascii=False, sort_keys=True)
+            archive = get_archive()
+            if MODE == 'replay':
+                exchange = archive.next(key)
+                if exchange is None:
+                    raise requests.ConnectionError(f"回放存档中没有该调用: {key}")
+                if REPLAY_LATENCY:
+                    time.sleep(exchange.get('elapsed', 0) * REPLAY_LATENCY)
+                return exchange['result']
+            start = time.monotonic()
+            result = func(*args, **kwargs)
+            archive.add(key, {'result': result, 'elapsed': round(time.monotonic() - start, 3)})
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 每日关键短语提取
+标题切成中文字符 n-gram（2~4 字）与英文单词，建成 CSR 形式的稀疏「文档 x 词」矩阵，
+今日 TF 乘以背景 IDF 相对今日 IDF 的增量得到区分度，去掉互相包含的短语后取前若干个。
+背景语料的文档频率持久化在 data/ 下，每天把前一天的统计按衰减系数并入，不必重算历史
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+STATE_FILE = DATA_DIR / 'keyphrase_df.json'
+NGRAM_RANGE = (2, 4)
+DECAY = 0.97         # 每并入一天，历史文档频率乘以该系数，近期语料权重更高
+MIN_KEEP = 0.5       # 衰减后低于该值的词从背景语料中删除
+MIN_DF = 2           # 今日至少出现在这么多条标题中才算关键短语
+OVERLAP = 0.8        # 某片段这么大比例的标题已被选中短语覆盖时视为同一短语
+MAX_PHRASE = 12      # 片段向两侧延伸后的最大长度
+
+TOKEN = re.compile(r'[a-z0-9][a-z0-9.+#-]*[a-z0-9+#]|[a-z0-9]|[一-鿿]+', re.I)
+STOPWORDS = {
+    'the', 'and', 'for', 'with', 'from', 'into', 'your', 'you', 'our', 'are', 'was', 'how', 'why',
+    'what', 'when', 'who', 'its', 'this', 'that', 'now', 'new', 'show', 'ask', 'hn', 'can', 'will',
+    'has', 'have', 'not', 'more', 'than', 'all', 'via', 'is', 'in', 'on', 'of', 'to', 'an', 'as',
+    'at', 'by', 'be', 'it', 'or', 'we', 'my', 'vs'
+}
+
+
+def _is_cjk(token):
+    return '一' <= token[0] <= '鿿'
+
+
+def _expand(gram, titles):
+    """把中文片段向左右延伸：包含它的标题中至少 OVERLAP 比例在同一侧是同一个汉字就并入"""
+    phrase = gram
+    while len(phrase) < MAX_PHRASE:
+        grown = False
+        for side in (-1, 1):
+            counts = {}
+            for title in titles:
+                pos = title.find(phrase)
+                if pos < 0:
+                    continue
+                j = pos - 1 if side < 0 else pos + len(phrase)
+                if 0 <= j < len(title) and _is_cjk(title[j]):
+                    counts[title[j]] = counts.get(title[j], 0) + 1
+            if counts:
+                char = max(counts, key=counts.get)
+                if counts[char] >= OVERLAP * len(titles):
+                    phrase = char + phrase if side < 0 else phrase + char
+                    grown = True
+        if not grown:
+            break
+    return phrase
+
+
+class KeyphraseExtractor:
+    """
+    增量背景语料 + 今日 TF-IDF 关键短语
+
+    同一天多次运行时，今日统计以最后一次为准；日期变化时才把上一天并入背景。
+    """
+
+    def __init__(self, path=STATE_FILE, ngram_range=NGRAM_RANGE, decay=DECAY):
+        self.path = Path(path)
+        self.ngram_range = ngram_range
+        self.decay = decay
+        self.docs = 0.0
+        self.df = {}
+        self.today = {'day': None, 'docs': 0, 'df': {}}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.docs = state.get('docs', 0.0)
+            self.df = state.get('df', {})
+            self.today = state.get('today', self.today)
+        except (OSError, ValueError):
+            pass
+
+    def grams(self, title):
+        """返回 {词: 展示形式}：中文取 2~4 字片段，英文取单词（小写为键，保留原文大小写展示）"""
+        low, high = self.ngram_range
+        result = {}
+        for token in TOKEN.findall(title):
+            if _is_cjk(token):
+                for n in range(low, high + 1):
+                    for i in range(len(token) - n + 1):
+                        result.setdefault(token[i:i + n], token[i:i + n])
+            elif len(token) > 1 and not token.isdigit() and token.lower() not in STOPWORDS:
+                result.setdefault(token.lower(), token)
+        return result
+
+    def matrix(self, titles):
+        """
+        稀疏文档-词矩阵（CSR）：返回 (vocab, display, indptr, indices, data)
+
+        每条标题中同一个词只记一次（二值 TF），短标题里重复片段不加权。
+        """
+        vocab = {}
+        display = []
+        indptr = [0]
+        indices = []
+        for title in titles:
+            for gram, shown in self.grams(title).items():
+                if gram not in vocab:
+                    vocab[gram] = len(vocab)
+                    display.append(shown)
+                indices.append(vocab[gram])
+            indptr.append(len(indices))
+        indices = np.array(indices, dtype=np.int64)
+        return list(vocab), display, np.array(indptr, dtype=np.int64), indices, np.ones(len(indices))
+
+    def _fold_previous_day(self, day):
+        """把之前某天的今日统计按衰减并入背景语料"""
+        previous = self.today
+        if previous['day'] in (None, day):
+            return
+        self.docs = self.docs * self.decay + previous['docs']
+        df = {}
+        for gram, count in self.df.items():
+            count *= self.decay
+            if count >= MIN_KEEP:
+                df[gram] = count
+        for gram, count in previous['df'].items():
+            df[gram] = df.get(gram, 0.0) + count
+        self.df = df
+        self.today = {'day': None, 'docs': 0, 'df': {}}
+
+    def extract(self, titles, top=10, day=None, min_df=MIN_DF, update=True):
+        """
+        今日最具区分度的短语：[{'phrase', 'score', 'count'}]，按分数从高到低
+
+        update=False 时只读背景语料，不记录今日统计。
+        """
+        day = day or datetime.now().strftime('%Y-%m-%d')
+        if update:
+            self._fold_previous_day(day)
+        vocab, display, indptr, indices, data = self.matrix(titles)
+        n_docs = len(indptr) - 1
+        if not vocab:
+            return []
+
+        today_df = np.bincount(indices, weights=data, minlength=len(vocab))
+        if update:
+            self.today = {'day': day, 'docs': n_docs,
+                          'df': {vocab[i]: int(c) for i, c in enumerate(today_df.tolist())}}
+
+        # 区分度 = 今日 TF x（背景 IDF - 今日 IDF）：今日越集中、历史越少见，分数越高；
+        # 天天都有的泛词两个 IDF 接近，分数趋于 0。还没有背景语料时按今日文档数平滑
+        background = np.array([self.df.get(gram, 0.0) for gram in vocab])
+        tf = today_df / n_docs
+        docs = self.docs or n_docs
+        scores = tf * (np.log((1 + docs) / (1 + background)) - np.log(n_docs / today_df))
+        scores[today_df < min_df] = 0
+        lengths = np.array([len(gram) for gram in vocab])
+
+        # 按列（词）取包含它的文档行号：CSR 的列索引稳定排序即得 CSC
+        rows = np.repeat(np.arange(n_docs), np.diff(indptr))[np.argsort(indices, kind='stable')]
+        col_ptr = np.concatenate([[0], np.cumsum(today_df.astype(np.int64))])
+
+        phrases = []
+        # 分数相同时较长的短语在前（「新一代」优先于「新一」）
+        for i in np.lexsort((-lengths, -scores)):
+            if scores[i] <= 0 or len(phrases) >= top:
+                break
+            gram = vocab[i]
+            docs = set(rows[col_ptr[i]:col_ptr[i + 1]].tolist())
+            # 互相包含、或大多出现在同一批标题里（同一短语的不同片段）的只保留分数高的一个
+            if any(gram in p['key'] or p['key'] in gram or len(docs & p['docs']) >= OVERLAP * len(docs)
+                   for p in phrases):
+                continue
+            shown = display[i]
+            if _is_cjk(gram):
+                shown = _expand(gram, [titles[d] for d in docs])
+            phrases.append({'key': shown.lower(), 'docs': docs, 'phrase': shown,
+                            'score': round(float(scores[i]), 4), 'count': int(today_df[i])})
+        for p in phrases:
+            del p['key'], p['docs']
+        return phrases
+
+    def save(self):
+        """原子写入：先写临时文件再替换"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {'docs': self.docs, 'df': {g: round(c, 3) for g, c in self.df.items()}, 'today': self.today}
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, self.path)
+
+
+def extract_keyphrases(titles, top=10, update=True):
+    """加载背景语料，提取今日关键短语；update 时把今日统计写回"""
+    extractor = KeyphraseExtractor()
+    phrases = extractor.extract(titles, top=top, update=update)
+    if update:
+        extractor.save()
+    return phrases
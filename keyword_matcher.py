@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 多关键词匹配引擎
+Aho-Corasick 自动机：关键词预先编译一次，每个标题只扫描一遍即可得到
+全部命中的关键词、命中次数和在原文中的位置
+"""
+
+
+class KeywordMatcher:
+    """
+    大小写不敏感（与 str.lower() 一致）的多关键词匹配器
+
+    关键词列表中的重复项保留其重数：'Gemini' 出现两次则命中时计 2 分，
+    与逐个关键词做 `kw.lower() in title.lower()` 的计数结果相同。
+    """
+
+    def __init__(self, keywords, fold=True):
+        self.keywords = list(keywords)
+        self.fold = fold
+        # 折叠后的模式 -> 在原列表中的所有关键词
+        self.patterns = []
+        self.keywords_of = []
+        index_of = {}
+        for kw in self.keywords:
+            pattern = kw.lower() if fold else kw
+            if not pattern:
+                continue
+            if pattern not in index_of:
+                index_of[pattern] = len(self.patterns)
+                self.patterns.append(pattern)
+                self.keywords_of.append([])
+            self.keywords_of[index_of[pattern]].append(kw)
+        self._build()
+
+    def _build(self):
+        """构建 goto / fail / output 表"""
+        goto = [{}]
+        output = [[]]
+        for pid, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append([])
+                state = nxt
+            output[state].append(pid)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                output[nxt] = output[nxt] + output[fail[nxt]]
+
+        self.goto = goto
+        self.fail = fail
+        self.output = [tuple(o) for o in output]
+
+    def _folded(self, text):
+        """返回折叠后的文本及其每个字符对应的原文位置"""
+        if not self.fold:
+            return text, None
+        folded = text.lower()
+        if len(folded) == len(text):
+            return folded, None
+        # 个别字符小写后长度变化（如 'İ'），逐字符建立位置映射
+        chars, origin = [], []
+        for i, ch in enumerate(text):
+            low = ch.lower()
+            chars.append(low)
+            origin.extend([i] * len(low))
+        return ''.join(chars), origin
+
+    def _scan(self, folded):
+        """一遍扫描，产出 (结束位置, 模式ID)"""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for i, ch in enumerate(folded):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pid in output[state]:
+                yield i, pid
+
+    def _hits(self, text):
+        """产出 (start, end, 模式ID)，位置为原文下标，end 不含"""
+        folded, origin = self._folded(text)
+        for i, pid in self._scan(folded):
+            start = i - len(self.patterns[pid]) + 1
+            if origin is not None:
+                yield origin[start], origin[i] + 1, pid
+            else:
+                yield start, i + 1, pid
+
+    def iter_matches(self, text):
+        """产出每次命中 (start, end, keywords)，keywords 为折叠后相同的全部原始关键词"""
+        for start, end, pid in self._hits(text):
+            yield start, end, self.keywords_of[pid]
+
+    def finditer(self, text):
+        """产出每次命中 (start, end, keyword)"""
+        for start, end, pid in self._hits(text):
+            yield start, end, self.keywords_of[pid][0]
+
+    def found(self, text):
+        """命中的关键词集合（按折叠后的模式去重）"""
+        folded, _ = self._folded(text)
+        return {self.patterns[pid] for _, pid in self._scan(folded)}
+
+    def search(self, text):
+        """
+        一遍扫描返回全部结果：
+        score 命中的关键词数（含重数）、hits 各关键词出现次数、positions [(start, end, keyword)]
+        """
+        positions = []
+        counts = {}
+        for start, end, pid in self._hits(text):
+            positions.append((start, end, self.keywords_of[pid][0]))
+            counts[pid] = counts.get(pid, 0) + 1
+        return {
+            'score': sum(len(self.keywords_of[pid]) for pid in counts),
+            'hits': {self.keywords_of[pid][0]: n for pid, n in counts.items()},
+            'positions': positions
+        }
+
+    def score(self, text):
+        """命中的关键词数，重复关键词按其在列表中的重数计"""
+        folded, _ = self._folded(text)
+        seen = set()
+        total = 0
+        for _, pid in self._scan(folded):
+            if pid not in seen:
+                seen.add(pid)
+                total += len(self.keywords_of[pid])
+        return total
+
+    def matches(self, text):
+        """是否命中任一关键词，命中即停止扫描"""
+        folded, _ = self._folded(text)
+        for _ in self._scan(folded):
+            return True
+        return False
@@ -8,6 +8,10 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from keyphrases import extract_keyphrases
+
+KEYPHRASE_COUNT = 5
+
 def load_all_data():
     """加载所有数据源"""
     # 加载基础数据（已存在的）
@@ -112,18 +116,27 @@ def generate_full_insight(all_items):
         for item in items:
             lines.append(f"  • {item['title'][:35]}...")
     
-    # 跨平台共识热点
+    # 跨平台共识热点：今日标题相对历史语料最具区分度的短语
     lines.append(f"\n**🔥 跨平台共识热点**：\n")
-    lines.append(f"通过多平台数据交叉验证，以下话题在各平台均有较高关注度：\n")
-    
-    hot_topics = [
-        ("DeepSeek开源", ["知乎", "微博", "百度", "财联社"]),
-        ("OpenAI Operator", ["知乎", "微博", "Hacker News", "财联社"]),
-        ("Gemini 3.1 Pro", ["知乎", "微博", "百度", "Hacker News"]),
-    ]
-    
-    for topic, platforms in hot_topics:
-        lines.append(f"- **{topic}**：出现在 {', '.join(platforms)}")
+    lines.append(f"对比近期历史标题，以下短语今日出现最集中：\n")
+
+    titles = [item.get('title', '') for item in all_items]
+    try:
+        hot_topics = extract_keyphrases(titles, top=KEYPHRASE_COUNT)
+    except Exception as e:
+        print(f"⚠️ 关键短语提取失败: {e}")
+        hot_topics = []
+
+    for topic in hot_topics:
+        phrase = topic['phrase'].lower()
+        platforms = []
+        for item in all_items:
+            source = item.get('source_type', '')
+            if source not in platforms and phrase in item.get('title', '').lower():
+                platforms.append(source)
+        lines.append(f"- **{topic['phrase']}**：{topic['count']} 条，出现在 {', '.join(platforms)}")
+    if not hot_topics:
+        lines.append("- 今日暂无集中出现的短语")
     
     # 不同视角的解读
     lines.append(f"\n**📊 多维视角分析**：\n")
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 标题近重复检测
+重复规则是不对称的包含关系：新标题的字符有超过一半（> 0.5）出现在某条历史标题中。
+历史标题按字符建倒排索引，与新标题共享的字符数直接由倒排表计数得到，
+达到 min_shared 的才是候选，再用字符重合率精确校验；被长标题包含的短标题不会漏掉。
+倒排表由 dedup_store 持久化
+"""
+
+import math
+
+THRESHOLD = 0.5      # 新标题字符集合与历史标题的重合率阈值
+INDEX_VERSION = 'chars-1'   # 索引字符的规则变化时递增，dedup_store 据此重建倒排表
+
+
+def overlap_ratio(title, sent):
+    """新标题的字符有多大比例出现在历史标题中"""
+    chars = set(title)
+    if not chars:
+        return 0.0
+    return len(chars & set(sent)) / len(chars)
+
+
+def index_chars(title):
+    """倒排表中标题对应的字符，与 overlap_ratio 取字符的方式一致"""
+    return set(title)
+
+
+def min_shared(title, threshold=THRESHOLD):
+    """重合率超过 threshold 至少需要与历史标题共享的字符数"""
+    return math.floor(len(set(title)) * threshold) + 1
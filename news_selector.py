@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 多样化 Top-K 精选
+候选按相关性建堆，惰性贪心的 MMR（最大边际相关性）逐条选出：
+弹出堆顶后按已选条目重新计算边际分，仍不低于下一个堆顶才入选，否则放回堆中；
+地区配额、类别上限、来源上限不满足的候选暂存，配额用完仍不足 K 条时按相关性补齐
+"""
+
+import heapq
+
+from story_cluster import MAX_DISTANCE, simhash
+
+LAMBDA = 2.0        # 与已选条目近重复时的扣分系数
+
+
+def similarity(fp_a, fp_b, max_distance=MAX_DISTANCE):
+    """
+    SimHash 指纹相似度，0~1
+
+    只有近重复（海明距离不超过 max_distance）才有相似度，
+    更远的距离在短标题上基本是哈希噪声，一律视为不相似。
+    """
+    if fp_a is None or fp_b is None:
+        return 0.0
+    distance = bin(fp_a ^ fp_b).count('1')
+    return 1 - distance / (2 * (max_distance + 1)) if distance <= max_distance else 0.0
+
+
+def select_diverse(items, count, relevance, quotas=None, group=None, caps=(), lam=LAMBDA):
+    """
+    从 items 中选出 count 条
+
+    relevance: item -> 相关性分数（越大越好）
+    quotas:    {分组: 名额}，group(item) 给出分组，例如国内/国际各占一半
+    caps:      [(key(item), 上限)]，例如每个类别、每个来源最多几条
+
+    返回按入选顺序排列的条目列表；条目按对象身份区分，不做 dict 比较。
+    """
+    quotas = dict(quotas or {})
+    fingerprints = {}
+    heap = []
+    for seq, item in enumerate(items):
+        heap.append((-relevance(item), seq, item))
+    heapq.heapify(heap)
+
+    selected = []
+    deferred = []
+    used = {}
+    cap_counts = [{} for _ in caps]
+
+    def fingerprint(item):
+        # 只为弹出过堆顶的候选计算指纹
+        if id(item) not in fingerprints:
+            fingerprints[id(item)] = simhash(item.get('title', ''))
+        return fingerprints[id(item)]
+
+    def marginal(item, base):
+        fp = fingerprint(item)
+        penalty = max((similarity(fp, fingerprint(s)) for s in selected), default=0.0)
+        return base - lam * penalty
+
+    def admissible(item):
+        if group is not None and group(item) in quotas and used.get(group(item), 0) >= quotas[group(item)]:
+            return False
+        return all(counts.get(key(item), 0) < limit for (key, limit), counts in zip(caps, cap_counts))
+
+    while heap and len(selected) < count:
+        neg_score, seq, item = heapq.heappop(heap)
+        if not admissible(item):
+            deferred.append((seq, item))
+            continue
+        score = marginal(item, relevance(item))
+        # 边际分只会随已选条目增多而下降，仍不低于下一个堆顶即为当前最优
+        if heap and score < -heap[0][0]:
+            heapq.heappush(heap, (-score, seq, item))
+            continue
+        selected.append(item)
+        if group is not None:
+            used[group(item)] = used.get(group(item), 0) + 1
+        for (key, _), counts in zip(caps, cap_counts):
+            counts[key(item)] = counts.get(key(item), 0) + 1
+
+    # 配额或上限导致不足 count 条时，按原相关性补齐
+    if len(selected) < count:
+        chosen = {id(item) for item in selected}
+        rest = sorted(deferred + [(seq, item) for _, seq, item in heap], key=lambda x: (-relevance(x[1]), x[0]))
+        for _, item in rest:
+            if len(selected) >= count:
+                break
+            if id(item) not in chosen:
+                chosen.add(id(item))
+                selected.append(item)
+    return selected
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 本地平台模拟服务器
+模拟抓取器用到的各平台接口（HN topstories/item、arXiv query、知乎 hot-lists、
+微博 hotSearch、百度 board、GitHub 搜索、RSS 订阅源），可配置延迟分布、错误率、
+慢速响应体和超大响应，用于压测并发抓取和验证备用数据逻辑，不访问真实站点。
+
+请求地址格式为 http://127.0.0.1:PORT/<原主机名>/<原路径>，抓取器设置
+TECHHUB_SIMULATOR_URL=http://127.0.0.1:PORT 后由 create_session() 自动改写。
+
+    python3 platform_simulator.py --port 8765 --latency lognormal:0.2:0.6 \\
+        --error-rate 0.05 --host weibo.com:error_rate=1
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+from requests.adapters import HTTPAdapter
+
+DEFAULT_PROFILE = {
+    'latency': 'fixed:0',          # fixed:S | uniform:A:B | exponential:MEAN | lognormal:MEDIAN:SIGMA
+    'error_rate': 0.0,             # 返回错误状态码的概率
+    'error_statuses': [429, 500, 502, 503],
+    'slow_body': 0.0,              # 响应体分块发送的总时长（秒）
+    'oversize': 1,                 # 条目数量与摘要长度的放大倍数
+}
+
+TOPICS = ['GPT-5', 'Claude', 'Gemini', 'DeepSeek', 'Llama', 'Qwen', 'AI Agent', 'RAG',
+          'Transformer', 'Diffusion', 'LLM', 'Reinforcement Learning', 'GPU', 'Robotics']
+ACTIONS = ['发布', '开源', '升级', '评测', 'Released', 'Benchmarks', 'Explained', 'Scaling']
+
+
+def sample_latency(spec, rng):
+    """按延迟分布描述采样一次延迟（秒）"""
+    kind, *params = spec.split(':')
+    params = [float(p) for p in params]
+    if kind == 'fixed':
+        return params[0] if params else 0.0
+    if kind == 'uniform':
+        return rng.uniform(params[0], params[1])
+    if kind == 'exponential':
+        return rng.expovariate(1 / params[0]) if params[0] > 0 else 0.0
+    if kind == 'lognormal':
+        return rng.lognormvariate(math.log(params[0]), params[1])
+    raise ValueError(f"未知的延迟分布: {spec}")
+
+
+def _title(index):
+    """按序号确定性生成标题"""
+    topic = TOPICS[index % len(TOPICS)]
+    action = ACTIONS[(index // len(TOPICS)) % len(ACTIONS)]
+    return f"{topic} {action} #{index}"
+
+
+def hn_topstories(query, profile):
+    return [1000 + i for i in range(500 * profile['oversize'])]
+
+
+def hn_item(item_id):
+    now = int(time.time())
+    return {
+        'id': item_id, 'type': 'story', 'by': f'user{item_id % 97}',
+        'time': now - (item_id % 500) * 60, 'title': _title(item_id),
+        'url': f'https://example.com/story/{item_id}',
+        'score': 500 - item_id % 500, 'descendants': item_id % 120
+    }
+
+
+def arxiv_query(query, profile):
+    start = int(query.get('start', ['0'])[0])
+    count = int(query.get('max_results', ['10'])[0])
+    newest = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    abstract = ' '.join(['We study scaling behaviour of large models.'] * 5 * profile['oversize'])
+    entries = []
+    for i in range(start, start + count):
+        published = (newest - timedelta(minutes=i)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        entries.append(f"""<entry>
+<id>http://arxiv.org/abs/2610.{i:05d}v1</id><updated>{published}</updated><published>{published}</published>
+<title>{escape(_title(i))}</title><summary>{abstract}</summary>
+<author><name>Author {i % 13}</name></author>
+<arxiv:primary_category xmlns:arxiv="http://arxiv.org/schemas/atom" term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+<category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/><category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+</entry>""")
+    body = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>arXiv Query</title>'
+            + ''.join(entries) + '</feed>')
+    return body.encode('utf-8'), 'application/atom+xml; charset=utf-8'
+
+
+def zhihu_hot(query, profile):
+    count = int(query.get('limit', ['50'])[0]) * profile['oversize']
+    return {'data': [{
+        'target': {'title': _title(i), 'url': f'https://api.zhihu.com/questions/{100000 + i}'},
+        'detail_text': f'{max(1, 600 - i * 7)} 万热度'
+    } for i in range(count)]}
+
+
+def weibo_hot(query, profile):
+    return {'data': {'realtime': [{
+        'word': _title(i), 'num': 5000000 - i * 40000, 'category': '科技'
+    } for i in range(50 * profile['oversize'])]}}
+
+
+def baidu_board(query, profile):
+    return {'data': {'cards': [{'content': [{
+        'word': _title(i), 'rawUrl': f'https://www.baidu.com/s?wd=topic{i}',
+        'hotScore': 4900000 - i * 30000
+    } for i in range(50 * profile['oversize'])]}]}}
+
+
+def github_search(query, profile):
+    count = int(query.get('per_page', ['30'])[0])
+    return {'total_count': count, 'items': [{
+        'full_name': f'sim-org/{_title(i).split()[0].lower()}-{i}',
+        'html_url': f'https://github.com/sim-org/repo-{i}',
+        'description': _title(i), 'stargazers_count': 5000 - i * 10
+    } for i in range(count)]}
+
+
+def rss_feed(host, path, profile):
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    items = ''.join(
+        f"<item><title>{escape(_title(i))}</title>"
+        f"<link>https://{host}/post/{i}</link>"
+        f"<pubDate>{format_datetime(now - timedelta(hours=i))}</pubDate></item>"
+        for i in range(20 * profile['oversize']))
+    body = (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f'<title>{escape(host)}</title>{items}</channel></rss>')
+    return body.encode('utf-8'), 'application/rss+xml; charset=utf-8'
+
+
+# (主机, 路径前缀) -> 处理函数；其余请求按 RSS 订阅源处理
+JSON_ROUTES = {
+    ('hacker-news.firebaseio.com', '/v0/topstories.json'): hn_topstories,
+    ('www.zhihu.com', '/api/v3/feed/topstory/hot-lists'): zhihu_hot,
+    ('weibo.com', '/ajax/side/hotSearch'): weibo_hot,
+    ('top.baidu.com', '/api/board'): baidu_board,
+    ('api.github.com', '/search/repositories'): github_search,
+}
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        if parts.path == '/__stats':
+            return self._send(200, json.dumps(server.stats_snapshot()).encode(), 'application/json')
+
+        host, _, path = parts.path.lstrip('/').partition('/')
+        path = '/' + path
+        query = parse_qs(parts.query)
+        profile = server.profile_for(host)
+        server.count(host)
+
+        delay = sample_latency(profile['latency'], server.rng)
+        if delay > 0:
+            time.sleep(delay)
+        if server.rng.random() < profile['error_rate']:
+            status = server.rng.choice(profile['error_statuses'])
+            server.count(host, 'errors')
+            return self._send(status, json.dumps({'error': 'simulated'}).encode(), 'application/json')
+
+        body, content_type = self._route(host, path, query, profile)
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        if self.headers.get('If-None-Match') == etag:
+            return self._send(304, b'', content_type, {'ETag': etag})
+        self._send(200, body, content_type, {'ETag': etag}, profile['slow_body'])
+
+    def _route(self, host, path, query, profile):
+        if host == 'hacker-news.firebaseio.com' and path.startswith('/v0/item/'):
+            item_id = int(path.rsplit('/', 1)[-1].split('.')[0])
+            return json.dumps(hn_item(item_id)).encode(), 'application/json'
+        if host == 'export.arxiv.org':
+            return arxiv_query(query, profile)
+        for (route_host, prefix), handler in JSON_ROUTES.items():
+            if host == route_host and path.startswith(prefix):
+                return json.dumps(handler(query, profile), ensure_ascii=False).encode('utf-8'), 'application/json'
+        return rss_feed(host, path, profile)
+
+    def _send(self, status, body, content_type, headers=None, slow_body=0):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if not slow_body:
+            self.wfile.write(body)
+            return
+        # 慢速响应体：分 20 块在 slow_body 秒内发完
+        step = max(1, len(body) // 20)
+        for i in range(0, len(body), step):
+            self.wfile.write(body[i:i + step])
+            self.wfile.flush()
+            time.sleep(slow_body / 20)
+
+
+class SimulatorServer(ThreadingHTTPServer):
+    """多线程模拟服务器，按主机应用不同的故障配置"""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, profile=None, hosts=None, seed=None):
+        super().__init__(address, SimulatorHandler)
+        self.profile = dict(DEFAULT_PROFILE, **(profile or {}))
+        self.hosts = hosts or {}
+        self.rng = random.Random(seed)
+        self.stats = {}
+        self.stats_lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def profile_for(self, host):
+        return dict(self.profile, **self.hosts.get(host, {}))
+
+    def count(self, host, field='requests'):
+        with self.stats_lock:
+            self.stats.setdefault(host, {'requests': 0, 'errors': 0})[field] += 1
+
+    def stats_snapshot(self):
+        with self.stats_lock:
+            return {host: dict(counts) for host, counts in self.stats.items()}
+
+
+def start_simulator(port=0, profile=None, hosts=None, seed=None):
+    """在后台线程启动模拟服务器并返回，port=0 时自动选择端口"""
+    server = SimulatorServer(('127.0.0.1', port), profile, hosts, seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class SimulatorAdapter(HTTPAdapter):
+    """把请求改写到模拟服务器：https://host/path?q -> {base}/host/path?q"""
+
+    def __init__(self, base_url, **kwargs):
+        self.base_url = base_url.rstrip('/')
+        kwargs.setdefault('pool_maxsize', 64)
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = f"{self.base_url}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else '')
+        return super().send(request, **kwargs)
+
+
+def _parse_override(text):
+    """解析 --host weibo.com:error_rate=1,latency=fixed:2"""
+    host, _, settings = text.partition(':')
+    overrides = {}
+    for item in settings.split(','):
+        key, _, value = item.partition('=')
+        if key == 'latency':
+            overrides[key] = value
+        elif key == 'error_statuses':
+            overrides[key] = [int(v) for v in value.split('|')]
+        elif key == 'oversize':
+            overrides[key] = int(value)
+        elif key:
+            overrides[key] = float(value)
+    return host, overrides
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TechInsight Hub 本地平台模拟服务器')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', default=DEFAULT_PROFILE['latency'])
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--slow-body', type=float, default=0.0)
+    parser.add_argument('--oversize', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--config', help='JSON 配置文件: {"profile": {...}, "hosts": {"weibo.com": {...}}}')
+    parser.add_argument('--host', action='append', default=[],
+                        help='按主机覆盖配置，如 weibo.com:error_rate=1,latency=fixed:2')
+    args = parser.parse_args()
+
+    profile = {'latency': args.latency, 'error_rate': args.error_rate,
+               'slow_body': args.slow_body, 'oversize': args.oversize}
+    hosts = {}
+    if args.config:
+        with open(args.config, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        profile.update(config.get('profile', {}))
+        hosts.update(config.get('hosts', {}))
+    for text in args.host:
+        host, overrides = _parse_override(text)
+        hosts.setdefault(host, {}).update(overrides)
+
+    server = SimulatorServer(('127.0.0.1', args.port), profile, hosts, args.seed)
+    print(f"🧪 平台模拟服务器已启动: {server.url}")
+    print(f"   使用: TECHHUB_SIMULATOR_URL={server.url} python3 fetch_multi_platform.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 请求统计: {json.dumps(server.stats_snapshot(), ensure_ascii=False)}")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
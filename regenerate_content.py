@@ -6,6 +6,9 @@
 import json
 from pathlib import Path
 
+from content_cache import cached_generator
+
+@cached_generator('regenerate_content.headline')
 def generate_content(title_en):
     """根据英文标题生成吸引人的中文标题和摘要"""
     title_lower = title_en.lower()
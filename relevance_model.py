@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - AI 相关性分类器
+标题切成中文字符 2~3 gram、英文单词/词对/词内字符 3-gram，哈希到固定维度的稀疏特征，
+逻辑回归离线训练：已发布条目与 news-sent 记录为正例，被筛掉的候选标题为负例。
+推理时整批标题一次 NumPy 运算（np.bincount 聚合权重），几千条只需几毫秒；
+模型文件不存在时调用方退回关键词匹配
+
+训练：python3 relevance_model.py
+"""
+
+import json
+import re
+import unicodedata
+import zlib
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from dedup_store import DedupStore
+from hn_client import ItemCache
+from text_utils import normalize_title
+from trend_store import DB_FILE as TRENDS_DB, TrendStore
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+MODEL_FILE = DATA_DIR / 'relevance_model.npz'
+DIM = 2 ** 18             # 哈希特征维度（模型权重长度）
+HN_SCAN = 500             # 有模型时 HN 扫描全部 topstories（API 最多返回 500 个）
+EPOCHS = 300
+LEARNING_RATE = 0.05
+L2 = 1e-5
+HOLDOUT = 0.2             # 按标题哈希划出的验证集比例，用于选阈值
+PRECISION_BETA = 0.5      # 选阈值时的 F-beta，<1 更看重精确率
+MIN_CLASS = 200           # 正例、负例各至少这么多条才训练，否则继续用关键词匹配
+MIN_HOLDOUT = 40          # 验证集正例、负例各至少这么多条，精确率才可信
+MIN_PRECISION = 0.9       # 验证集精确率低于该值时不保存模型
+MIN_RECALL = 0.5          # 只放行极少数标题换来的高精确率不算数
+
+# 正例：已发布的条目；负例：抓取过但未发布、也不含明显 AI 词的候选
+PUBLISHED_FILES = ('api/tech-news.json', 'daily_news_data.json')
+CANDIDATE_FILES = ('api/trending_raw.json',)
+
+TOKEN = re.compile(r'[a-z0-9][a-z0-9.+#-]*[a-z0-9+#]|[a-z0-9]|[一-鿿]+')
+
+# 未发布的候选中含这些明显 AI 词的，可能只是名额不够没有入选，不作负例
+AI_WORDS = {'ai', 'agi', 'llm', 'llms', 'gpt', 'chatgpt', 'openai', 'anthropic', 'claude', 'gemini',
+            'deepseek', 'llama', 'mistral', 'transformer', 'neural', 'diffusion', 'agent', 'agents'}
+AI_PHRASES = ('人工智能', '大模型', '智能体', '机器学习', '深度学习', '神经网络', 'machine learning')
+
+
+def _bucket(feature):
+    return zlib.crc32(feature.encode('utf-8')) & (DIM - 1)
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_buckets(token):
+    """单个词的特征桶：中文取 2~3 字片段，英文取整词与词内字符 3-gram；高频词只算一次"""
+    if '一' <= token[0] <= '鿿':
+        if len(token) == 1:
+            return (_bucket('c:' + token),)
+        return tuple({_bucket('c:' + token[i:i + n]) for n in (2, 3) for i in range(len(token) - n + 1)})
+    padded = f'<{token}>'
+    return tuple({_bucket('w:' + token)} | {_bucket('g:' + padded[i:i + 3]) for i in range(len(padded) - 2)})
+
+
+def buckets(title):
+    """标题的特征桶集合：各词的特征加上相邻英文词对"""
+    tokens = TOKEN.findall(unicodedata.normalize('NFKC', title).lower())
+    result = set()
+    previous = None
+    for token in tokens:
+        result.update(_token_buckets(token))
+        if '一' <= token[0] <= '鿿':
+            previous = None
+            continue
+        if previous:
+            result.add(_bucket('b:' + previous + ' ' + token))
+        previous = token
+    return result
+
+
+def featurize(titles):
+    """整批标题的稀疏特征（COO）：(行号, 列号, 值)，每行 L2 归一化"""
+    rows, cols, vals = [], [], []
+    for row, title in enumerate(titles):
+        found = buckets(title)
+        if not found:
+            continue
+        rows.extend([row] * len(found))
+        cols.extend(found)
+        vals.extend([1 / len(found) ** 0.5] * len(found))
+    return (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), np.array(vals))
+
+
+def _sigmoid(z):
+    return 1 / (1 + np.exp(-np.clip(z, -30, 30)))
+
+
+class RelevanceModel:
+    """哈希特征逻辑回归；threshold 为判为 AI 相关的概率下限"""
+
+    def __init__(self, weights, bias, threshold=0.5):
+        self.weights = weights
+        self.bias = bias
+        self.threshold = threshold
+
+    def scores(self, titles):
+        """整批标题的 AI 相关概率数组"""
+        titles = list(titles)
+        rows, cols, vals = featurize(titles)
+        logits = np.bincount(rows, weights=self.weights[cols] * vals, minlength=len(titles)) + self.bias
+        return _sigmoid(logits)
+
+    def is_relevant(self, title):
+        return bool(self.scores([title])[0] >= self.threshold)
+
+    def confidence(self, probs):
+        """概率映射到阈值以上的置信度：阈值处为 0，概率 1 处为 1，阈值以下截为 0"""
+        return np.clip((np.asarray(probs) - self.threshold) / max(1 - self.threshold, 1e-6), 0, 1)
+
+    def save(self, path=MODEL_FILE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # np.savez 会自动补 .npz 后缀，先写到同后缀的临时文件再替换
+        tmp = Path(path).with_name(Path(path).stem + '.tmp.npz')
+        np.savez_compressed(tmp, weights=self.weights.astype(np.float32),
+                            bias=np.float64(self.bias), threshold=np.float64(self.threshold))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path=MODEL_FILE):
+        with np.load(path) as data:
+            return cls(data['weights'].astype(np.float64), float(data['bias']), float(data['threshold']))
+
+
+def fit(titles, labels, epochs=EPOCHS, lr=LEARNING_RATE, l2=L2):
+    """全批量 Adam 训练，正负例按类别频率加权平衡"""
+    labels = np.asarray(labels, dtype=np.float64)
+    rows, cols, vals = featurize(titles)
+    n = len(labels)
+    pos = labels.sum()
+    sample_weight = np.where(labels > 0, n / (2 * max(pos, 1)), n / (2 * max(n - pos, 1)))
+    weights = np.zeros(DIM)
+    bias = 0.0
+    m, v = np.zeros(DIM), np.zeros(DIM)
+    mb = vb = 0.0
+    for step in range(1, epochs + 1):
+        logits = np.bincount(rows, weights=weights[cols] * vals, minlength=n) + bias
+        err = (_sigmoid(logits) - labels) * sample_weight / n
+        grad = np.bincount(cols, weights=err[rows] * vals, minlength=DIM) + l2 * weights
+        grad_b = err.sum()
+        m = 0.9 * m + 0.1 * grad
+        v = 0.999 * v + 0.001 * grad * grad
+        mb = 0.9 * mb + 0.1 * grad_b
+        vb = 0.999 * vb + 0.001 * grad_b * grad_b
+        correction = np.sqrt(1 - 0.999 ** step) / (1 - 0.9 ** step)
+        weights -= lr * correction * m / (np.sqrt(v) + 1e-8)
+        bias -= lr * correction * mb / (np.sqrt(vb) + 1e-8)
+    return RelevanceModel(weights, bias)
+
+
+def pick_threshold(probs, labels, beta=PRECISION_BETA):
+    """验证集上 F-beta 最高的阈值，及其精确率/召回率"""
+    labels = np.asarray(labels, dtype=bool)
+    best = (0.5, 0.0, 0.0, -1.0)
+    for threshold in np.unique(np.round(probs, 3)):
+        predicted = probs >= threshold
+        tp = (predicted & labels).sum()
+        if not tp:
+            continue
+        precision = tp / predicted.sum()
+        recall = tp / labels.sum()
+        score = (1 + beta ** 2) * precision * recall / (beta ** 2 * precision + recall)
+        if score > best[3]:
+            best = (float(threshold), float(precision), float(recall), score)
+    return best[:3]
+
+
+def _titles_from_json(path):
+    """读取 API/数据文件中所有条目的标题（跳过带 fallback 标记的备用数据）"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    titles = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if node.get('fallback'):
+                return  # 抓取失败时的备用数据，不是真实候选
+            if isinstance(node.get('title'), str):
+                titles.append(node['title'])
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(data)
+    return titles
+
+
+def mentions_ai(title):
+    """标题是否含明显的 AI 词（英文按整词，中文按子串）"""
+    text = unicodedata.normalize('NFKC', title).lower()
+    if any(phrase in text for phrase in AI_PHRASES):
+        return True
+    return any(token in AI_WORDS or token.startswith('gpt-') for token in TOKEN.findall(text))
+
+
+def collect_training_data():
+    """从本地历史收集 (正例标题, 负例标题)，按规范化标题去重，正例优先"""
+    positives = []
+    for path in PUBLISHED_FILES:
+        positives += _titles_from_json(path)
+    store = DedupStore()
+    try:
+        store.import_text()
+        positives += store.titles()
+    finally:
+        store.close()
+
+    candidates = []
+    for path in CANDIDATE_FILES:
+        candidates += _titles_from_json(path)
+    candidates += [entry['item']['title'] for entry in ItemCache().entries.values() if 'title' in entry['item']]
+    if Path(TRENDS_DB).exists():
+        store = TrendStore()
+        try:
+            candidates += store.titles()
+        finally:
+            store.close()
+
+    seen = set()
+    pos, neg = [], []
+    for titles, bucket in ((positives, pos), (candidates, neg)):
+        for title in titles:
+            norm = normalize_title(title)
+            if norm and norm not in seen:
+                seen.add(norm)
+                if bucket is pos or not mentions_ai(title):
+                    bucket.append(title)
+    return pos, neg
+
+
+def train(path=MODEL_FILE):
+    """
+    离线训练：验证集上选阈值，再用全部数据重训并保存
+
+    数据不足或验证集精确率不达标时不保存（已有模型文件保持不变），返回 None，
+    抓取时继续用关键词匹配或原有模型。
+    """
+    pos, neg = collect_training_data()
+    print(f"📚 训练数据: 正例 {len(pos)} 条, 负例 {len(neg)} 条")
+    if len(pos) < MIN_CLASS or len(neg) < MIN_CLASS:
+        print(f"⚠️ 正例或负例不足 {MIN_CLASS} 条，跳过训练")
+        return None
+    titles = pos + neg
+    labels = np.array([1] * len(pos) + [0] * len(neg))
+    # 按标题哈希划分，同一标题每次都落在同一侧
+    holdout = np.array([zlib.crc32(normalize_title(t).encode('utf-8')) % 100 < HOLDOUT * 100 for t in titles])
+
+    held_pos = int(labels[holdout].sum())
+    held_neg = int(holdout.sum()) - held_pos
+    if held_pos < MIN_HOLDOUT or held_neg < MIN_HOLDOUT:
+        print(f"⚠️ 验证集正例 {held_pos} 条、负例 {held_neg} 条，不足 {MIN_HOLDOUT} 条，跳过训练")
+        return None
+
+    model = fit([t for t, h in zip(titles, holdout) if not h], labels[~holdout])
+    threshold, precision, recall = pick_threshold(
+        model.scores([t for t, h in zip(titles, holdout) if h]), labels[holdout])
+    print(f"📊 验证集: 阈值 {threshold:.3f}, 精确率 {precision:.1%}, 召回率 {recall:.1%}")
+    if precision < MIN_PRECISION or recall < MIN_RECALL:
+        print(f"⚠️ 验证集精确率低于 {MIN_PRECISION:.0%} 或召回率低于 {MIN_RECALL:.0%}，不保存模型")
+        return None
+
+    model = fit(titles, labels)
+    model.threshold = threshold
+    model.save(path)
+    print(f"💾 模型已保存: {path}")
+    return model
+
+
+_model = None
+
+
+def get_relevance_model():
+    """进程内共享的已训练模型；没有模型文件时返回 None"""
+    global _model
+    if _model is None and Path(MODEL_FILE).exists():
+        try:
+            _model = RelevanceModel.load(MODEL_FILE)
+        except Exception as e:
+            print(f"⚠️ 相关性模型加载失败: {e}")
+    return _model
+
+
+def story_filter(fallback, scan):
+    """
+    HN 抓取用：返回 (accept, 扫描条数)
+
+    有模型时扩大到 HN_SCAN 条，由模型按验证集上选出的阈值单独判定
+    （不再要求先命中关键词，否则模型找不到关键词漏掉的 AI 故事）；
+    否则沿用原来的关键词判定和扫描条数。
+    """
+    model = get_relevance_model()
+    if model is None:
+        return fallback, scan
+
+    def accept(story):
+        if not story or 'title' not in story:
+            return False
+        return model.is_relevant(story['title'])
+
+    return accept, HN_SCAN
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("🚀 TechInsight Hub - AI 相关性分类器训练")
+    print("=" * 60)
+    train()
@@ -4,18 +4,25 @@ TechInsight Hub - 真实数据获取模块（增强版）
 支持多数据源：Hacker News, arXiv, 36氪, 机器之心等中文站点
 """
 
-import requests
 import json
 import re
-import time
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from arxiv_client import ArxivClient
+from circuit_breaker import CircuitBreaker
+from hn_client import HNClient
+from http_client import create_session
+from keyword_matcher import KeywordMatcher
+from relevance_model import story_filter
+
 class DataFetcher:
     """数据获取器基类"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -32,48 +39,30 @@ class HackerNewsFetcher(DataFetcher):
         'neural network', 'transformer', 'DeepSeek', 'Mistral', 'Llama',
         'ChatGPT', '大模型', '人工智能', '神经网络'
     ]
+    AI_MATCHER = KeywordMatcher(AI_KEYWORDS)
     
     def fetch(self, limit=8):
         """获取AI相关的HN热门故事"""
         try:
             print("📡 正在获取 Hacker News 数据...")
             
-            resp = self.session.get(
-                'https://hacker-news.firebaseio.com/v0/topstories.json',
-                timeout=10
-            )
-            story_ids = resp.json()[:60]
+            def is_ai_story(story):
+                if not story or 'title' not in story:
+                    return False
+                return self.AI_MATCHER.matches(story['title'])
             
+            # 扫描前60条（有相关性模型时扫描全部），缓存中已判定为非AI的故事不再请求
+            accept, scan = story_filter(is_ai_story, 60)
+            hn = HNClient(self.session)
             stories = []
-            for story_id in story_ids:
-                if len(stories) >= limit:
-                    break
-                    
-                try:
-                    story_resp = self.session.get(
-                        f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json',
-                        timeout=5
-                    )
-                    story = story_resp.json()
-                    
-                    if not story or 'title' not in story:
-                        continue
-                    
-                    title = story['title']
-                    
-                    if any(kw.lower() in title.lower() for kw in self.AI_KEYWORDS):
-                        stories.append({
-                            'title': title,
-                            'url': story.get('url') or f"https://news.ycombinator.com/item?id={story_id}",
-                            'source': 'Hacker News',
-                            'score': story.get('score', 0),
-                            'date': datetime.fromtimestamp(story.get('time', 0)).strftime('%b %d')
-                        })
-                        
-                    time.sleep(0.05)
-                    
-                except:
-                    continue
+            for story in hn.top_stories(scan, limit, accept=accept):
+                stories.append({
+                    'title': story['title'],
+                    'url': story.get('url') or f"https://news.ycombinator.com/item?id={story['id']}",
+                    'source': 'Hacker News',
+                    'score': story.get('score', 0),
+                    'date': datetime.fromtimestamp(story.get('time', 0)).strftime('%b %d')
+                })
             
             print(f"✅ HN: 获取 {len(stories)} 条AI相关热点")
             return stories
@@ -137,6 +126,18 @@ class ChinaAIFetcher(DataFetcher):
         }
     ]
     
+    def __init__(self):
+        super().__init__()
+        self.breaker = CircuitBreaker()
+    
+    def _get_page(self, name, url, **kwargs):
+        """经熔断器抓取页面，非200视为失败；熔断中直接抛出异常"""
+        def request():
+            resp = self.session.get(url, timeout=5, **kwargs)
+            resp.raise_for_status()
+            return resp
+        return self.breaker.call(name, request)
+    
     def fetch(self, limit=6):
         """获取国内AI热点"""
         stories = []
@@ -144,56 +145,51 @@ class ChinaAIFetcher(DataFetcher):
         # 尝试抓取机器之心
         try:
             print("📡 正在获取 机器之心 数据...")
-            resp = self.session.get(
+            resp = self._get_page(
+                'jiqizhixin',
                 'https://www.jiqizhixin.com/',
-                timeout=10,
                 headers={'Accept': 'text/html'}
             )
             
-            if resp.status_code == 200:
-                # 提取文章标题和链接
-                articles = re.findall(
-                    r'<a[^>]*href="(/articles/\d{4}-\d{2}-\d{2}-?\d*)"[^>]*>\s*<[^>]*>\s*([^<]{15,100})</',
-                    resp.text
-                )
-                
-                for href, title in articles[:3]:
-                    stories.append({
-                        'title': title.strip(),
-                        'url': f"https://www.jiqizhixin.com{href}",
-                        'source': '机器之心',
-                        'score': 4000 + len(stories) * 200,
-                        'date': '今天',
-                        'tag': '国内AI'
-                    })
+            # 提取文章标题和链接
+            articles = re.findall(
+                r'<a[^>]*href="(/articles/\d{4}-\d{2}-\d{2}-?\d*)"[^>]*>\s*<[^>]*>\s*([^<]{15,100})</',
+                resp.text
+            )
+            
+            for href, title in articles[:3]:
+                stories.append({
+                    'title': title.strip(),
+                    'url': f"https://www.jiqizhixin.com{href}",
+                    'source': '机器之心',
+                    'score': 4000 + len(stories) * 200,
+                    'date': '今天',
+                    'tag': '国内AI'
+                })
         except Exception as e:
             print(f"⚠️ 机器之心抓取失败: {e}")
         
         # 尝试抓取36氪
         try:
             print("📡 正在获取 36氪 数据...")
-            resp = self.session.get(
-                'https://36kr.com/search/articles/AI',
-                timeout=10
+            resp = self._get_page('36kr', 'https://36kr.com/search/articles/AI')
+            
+            articles = re.findall(
+                r'<a[^>]*href="(/p/\d+)"[^>]*title="([^"]{10,100})"',
+                resp.text
             )
             
-            if resp.status_code == 200:
-                articles = re.findall(
-                    r'<a[^>]*href="(/p/\d+)"[^>]*title="([^"]{10,100})"',
-                    resp.text
-                )
-                
-                for href, title in articles[:3]:
-                    if len(stories) >= limit:
-                        break
-                    stories.append({
-                        'title': title.strip(),
-                        'url': f"https://36kr.com{href}",
-                        'source': '36氪',
-                        'score': 3500 + len(stories) * 200,
-                        'date': '今天',
-                        'tag': '国内AI'
-                    })
+            for href, title in articles[:3]:
+                if len(stories) >= limit:
+                    break
+                stories.append({
+                    'title': title.strip(),
+                    'url': f"https://36kr.com{href}",
+                    'source': '36氪',
+                    'score': 3500 + len(stories) * 200,
+                    'date': '今天',
+                    'tag': '国内AI'
+                })
         except Exception as e:
             print(f"⚠️ 36氪抓取失败: {e}")
         
@@ -212,49 +208,16 @@ class ArxivFetcher(DataFetcher):
     
     CATEGORIES = ['cs.AI', 'cs.LG', 'cs.CL', 'cs.CV']
     
-    def fetch(self, limit_per_cat=3):
-        """获取最新AI论文"""
+    def fetch(self, limit=8):
+        """获取最新AI论文（单次OR查询，只下载上次运行之后的新论文）"""
         try:
             print("📡 正在获取 arXiv 论文...")
             
-            all_papers = []
-            
-            for cat in self.CATEGORIES:
-                try:
-                    url = (
-                        f'http://export.arxiv.org/api/query?'
-                        f'search_query=cat:{cat}&'
-                        f'sortBy=submittedDate&'
-                        f'sortOrder=descending&'
-                        f'max_results={limit_per_cat}'
-                    )
-                    
-                    resp = self.session.get(url, timeout=15)
-                    entries = re.findall(r'<entry>(.*?)</entry>', resp.text, re.DOTALL)
-                    
-                    for entry in entries:
-                        title_match = re.search(r'<title>(.*?)</title>', entry, re.DOTALL)
-                        id_match = re.search(r'<id>.*?/(\d+\.\d+)</id>', entry)
-                        
-                        if title_match and id_match:
-                            title = re.sub(r'\s+', ' ', title_match.group(1)).strip()
-                            arxiv_id = id_match.group(1)
-                            
-                            all_papers.append({
-                                'title': title,
-                                'arxiv_id': arxiv_id,
-                                'url': f'https://arxiv.org/abs/{arxiv_id}',
-                                'category': cat,
-                                'date': datetime.now().strftime('%b %d')
-                            })
-                    
-                    time.sleep(0.3)
-                    
-                except:
-                    continue
+            client = ArxivClient(self.session, self.CATEGORIES)
+            papers = client.fetch(limit)
             
-            print(f"✅ arXiv: 获取 {len(all_papers)} 篇论文")
-            return all_papers[:8]
+            print(f"✅ arXiv: 获取 {len(papers)} 篇论文")
+            return papers
             
         except Exception as e:
             print(f"❌ arXiv获取失败: {e}")
@@ -501,7 +464,7 @@ def main():
         all_data['news'].append(story)
     
     # arXiv
-    papers = fetchers['arxiv'].fetch(limit_per_cat=3)
+    papers = fetchers['arxiv'].fetch(limit=8)
     all_data['papers'] = papers
     
     # 生成API JSON
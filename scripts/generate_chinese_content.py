@@ -4,13 +4,21 @@ TechInsight Hub - 中文数据生成器
 所有内容均为中文，包括标题和摘要
 """
 
-import requests
 import json
-import re
-import time
+import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from arxiv_client import stream_papers
+from content_cache import cached_generator
+from hn_client import HNClient
+from http_client import create_session
+from relevance_model import story_filter
+
+# 所有请求共用一个按主机限速的会话
+session = create_session()
+
 # 英文标题到中文的映射
 TITLE_TRANSLATIONS = {
     # AI模型相关
@@ -47,6 +55,7 @@ TITLE_TRANSLATIONS = {
     'default': 'AI技术动态'
 }
 
+@cached_generator('scripts.generate_chinese_content.title')
 def translate_title(title):
     """将英文标题翻译/转换为中文标题"""
     
@@ -133,6 +142,7 @@ def translate_title(title):
     # 最后默认
     return f'AI领域最新动态'
 
+@cached_generator('scripts.generate_chinese_content.summary')
 def generate_chinese_summary(title, source=''):
     """生成中文摘要"""
     title_lower = title.lower()
@@ -202,47 +212,29 @@ def fetch_hackernews(limit=10):
     try:
         print("📡 获取 Hacker News 数据...")
         
-        resp = requests.get(
-            'https://hacker-news.firebaseio.com/v0/topstories.json',
-            timeout=10
-        )
-        story_ids = resp.json()[:80]
-        
-        stories = []
         keywords = ['AI', 'artificial', 'machine learning', 'deep learning', 
                    'LLM', 'GPT', 'Claude', 'OpenAI', 'DeepSeek', 'Gemini',
                    'neural', 'transformer', '模型', '大模型']
         
-        for story_id in story_ids:
-            if len(stories) >= limit:
-                break
-                
-            try:
-                story_resp = requests.get(
-                    f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json',
-                    timeout=5
-                )
-                story = story_resp.json()
-                
-                if not story or 'title' not in story:
-                    continue
-                
-                title = story['title']
-                
-                if any(kw.lower() in title.lower() for kw in keywords):
-                    stories.append({
-                        'title_en': title,
-                        'title': translate_title(title),
-                        'url': story.get('url') or f"https://news.ycombinator.com/item?id={story_id}",
-                        'source': 'Hacker News',
-                        'score': story.get('score', 0),
-                        'date': datetime.now().strftime('%m月%d日')
-                    })
-                    
-                time.sleep(0.03)
-                
-            except:
-                continue
+        def is_ai_story(story):
+            if not story or 'title' not in story:
+                return False
+            return any(kw.lower() in story['title'].lower() for kw in keywords)
+        
+        # 有相关性模型时用模型判定并扫描全部 topstories
+        accept, scan = story_filter(is_ai_story, 80)
+        hn = HNClient(session)
+        stories = []
+        for story in hn.top_stories(scan, limit, accept=accept):
+            title = story['title']
+            stories.append({
+                'title_en': title,
+                'title': translate_title(title),
+                'url': story.get('url') or f"https://news.ycombinator.com/item?id={story['id']}",
+                'source': 'Hacker News',
+                'score': story.get('score', 0),
+                'date': datetime.now().strftime('%m月%d日')
+            })
         
         print(f"✅ 获取 {len(stories)} 条热点")
         return stories
@@ -261,29 +253,23 @@ def fetch_arxiv(limit=8):
         
         for cat in categories:
             try:
-                url = f'http://export.arxiv.org/api/query?search_query=cat:{cat}&sortBy=submittedDate&sortOrder=descending&max_results=3'
-                resp = requests.get(url, timeout=15)
-                
-                entries = re.findall(r'<entry>(.*?)</entry>', resp.text, re.DOTALL)
-                
-                for entry in entries:
-                    title_match = re.search(r'<title>(.*?)</title>', entry, re.DOTALL)
-                    id_match = re.search(r'<id>.*?/(\d+\.\d+)</id>', entry)
-                    
-                    if title_match and id_match:
-                        title_en = re.sub(r'\s+', ' ', title_match.group(1)).strip()
-                        arxiv_id = id_match.group(1)
-                        
-                        papers.append({
-                            'title_en': title_en,
-                            'title': translate_title(title_en),
-                            'arxiv_id': arxiv_id,
-                            'url': f'https://arxiv.org/abs/{arxiv_id}',
-                            'category': cat,
-                            'date': datetime.now().strftime('%m月%d日')
-                        })
+                for paper in stream_papers(session, {
+                    'search_query': f'cat:{cat}',
+                    'sortBy': 'submittedDate',
+                    'sortOrder': 'descending',
+                    'max_results': 3
+                }):
+                    papers.append({
+                        'title_en': paper['title'],
+                        'title': translate_title(paper['title']),
+                        'arxiv_id': paper['arxiv_id'],
+                        'url': f"https://arxiv.org/abs/{paper['arxiv_id']}",
+                        'abstract': paper['abstract'],
+                        'authors': paper['authors'],
+                        'category': cat,
+                        'date': datetime.now().strftime('%m月%d日')
+                    })
                 
-                time.sleep(0.2)
                 
             except:
                 continue
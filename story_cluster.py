@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 跨平台同一事件聚类
+同一事件在各平台的写法差别很大（「DeepSeek发布新一代推理模型R2」/「DeepSeek R2推理模型正式发布」），
+按中文两字片段与英文词的 IDF 加权重合系数聚类，倒排索引取候选，只与簇代表比较，不做传递合并。
+另提供 64 位 SimHash 指纹，供精选时识别近乎逐字相同的标题（news_selector）
+"""
+
+import hashlib
+import math
+import re
+
+# SimHash 近重复：标点、空格、个别词不同的标题指纹距离在 0~6，
+# 无关标题在本仓库的历史标题中最小也有 11
+MAX_DISTANCE = 6
+BITS = 64
+
+# 事件聚类：重合系数不低于该值视为同一事件。本仓库历史标题与各平台备用数据中，
+# 同一事件的改写大多在 0.5 以上，不同事件共享「发布」「大模型」等泛词时在 0.5 以下
+MIN_OVERLAP = 0.5
+LATIN_WEIGHT = 2.0
+
+TOKEN = re.compile(r'[a-z0-9]+|[一-鿿]+')
+FEATURE_TOKEN = re.compile(r'[a-z0-9]+(?:\.[0-9]+)*|[一-鿿]+')
+CJK = re.compile(r'[一-鿿]')
+STOPWORDS = {
+    'the', 'a', 'an', 'of', 'to', 'in', 'on', 'for', 'and', 'with', 'by', 'at', 'is', 'are',
+    'as', 'its', 'from', 'how', 'why', 'what', 'new', 'show', 'hn', 'ask'
+}
+
+
+def _grams(title):
+    """小写后的英文词与相邻词对，中文连续片段的 2~3 字子串（不用单字，单字在无关标题间也大量重合）"""
+    grams = []
+    previous = None
+    for token in TOKEN.findall(title.lower()):
+        if '一' <= token[0] <= '鿿':
+            previous = None
+            if len(token) == 1:
+                grams.append(token)
+            for n in (2, 3):
+                grams += [token[i:i + n] for i in range(len(token) - n + 1)]
+            continue
+        grams.append(token)
+        if previous:
+            grams.append(previous + ' ' + token)
+        previous = token
+    return grams
+
+
+def _hash64(gram):
+    return int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(title):
+    """64 位 SimHash 指纹，无有效字符时返回 None"""
+    grams = _grams(title)
+    if not grams:
+        return None
+    weights = [0] * BITS
+    for gram in grams:
+        h = _hash64(gram)
+        for bit in range(BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(BITS) if weights[bit] > 0)
+
+
+def _is_cjk(text):
+    return '一' <= text[0] <= '鿿'
+
+
+def _features(title):
+    """
+    聚类特征 {特征: 基础权重}：中文连续片段取相邻两字，英文取整词（含 3.1 这类小数）
+
+    中文标题里夹的英文词几乎都是公司、产品名，权重加倍；英文停用词不计。
+    """
+    features = {}
+    for token in FEATURE_TOKEN.findall(title.lower()):
+        if _is_cjk(token):
+            for gram in [token] if len(token) == 1 else [token[i:i + 2] for i in range(len(token) - 1)]:
+                features[gram] = 1.0
+        elif token not in STOPWORDS:
+            features[token] = LATIN_WEIGHT
+    return features
+
+
+def _conflicts(a, b, title_a, title_b):
+    """
+    两条标题点名了不同的对象：都带数字但没有共同数字（RTX 5090 / RTX 6090），
+    或都是中文标题且各自有对方没有的英文词（Operator / Codex）
+    """
+    numbers_a = {f for f in a if any(c.isdigit() for c in f)}
+    numbers_b = {f for f in b if any(c.isdigit() for c in f)}
+    if numbers_a and numbers_b and not numbers_a & numbers_b:
+        return True
+    if CJK.search(title_a) and CJK.search(title_b):
+        latin_a = {f for f in a if not _is_cjk(f)}
+        latin_b = {f for f in b if not _is_cjk(f)}
+        return bool(latin_a - latin_b and latin_b - latin_a)
+    return False
+
+
+def cluster_items(items, min_overlap=MIN_OVERLAP):
+    """
+    把描述同一事件的标题聚成簇，返回 [[item, ...], ...]（只含两条以上的簇）
+
+    相似度是 IDF 加权的重合系数：共享特征的权重和除以较短一方的权重和，
+    短标题（「Stargate项目投资」）被长标题包含时也能归为一簇；IDF 按本批标题计算，
+    「发布」「模型」这类常见片段权重低。点名不同对象的标题直接判为不同事件。
+    按原顺序处理：候选只取与簇代表（簇内第一条）共享特征的簇（倒排索引），
+    挂到相似度最高且不低于 min_overlap 的簇，否则自成新簇并成为代表；
+    只与代表比较，避免 A~B~C 式的链式合并。同一簇内按原顺序排列，簇按条目数从多到少排列。
+    """
+    entries = []
+    df = {}
+    for item in items:
+        title = item.get('title', '')
+        features = _features(title)
+        if not features:
+            continue
+        entries.append((item, title, features))
+        for feature in features:
+            df[feature] = df.get(feature, 0) + 1
+    idf = {feature: math.log((len(entries) + 1) / (count + 1)) + 1 for feature, count in df.items()}
+
+    index = {}
+    representatives = []
+    groups = []
+    for item, title, features in entries:
+        weights = {feature: base * idf[feature] for feature, base in features.items()}
+        total = sum(weights.values())
+        candidates = set()
+        for feature in weights:
+            candidates.update(index.get(feature, ()))
+        best, best_score = None, min_overlap
+        for c in sorted(candidates):
+            rep_title, rep_weights, rep_total = representatives[c]
+            if _conflicts(weights, rep_weights, title, rep_title):
+                continue
+            shared = sum(w for feature, w in weights.items() if feature in rep_weights)
+            score = shared / min(total, rep_total)
+            if score > best_score or (best is None and score >= min_overlap):
+                best, best_score = c, score
+        if best is not None:
+            groups[best].append(item)
+            continue
+        for feature in weights:
+            index.setdefault(feature, []).append(len(groups))
+        representatives.append((title, weights, total))
+        groups.append([item])
+
+    clusters = [group for group in groups if len(group) > 1]
+    clusters.sort(key=len, reverse=True)
+    return clusters
+
+
+def story_clusters(items, min_overlap=MIN_OVERLAP, min_platforms=2):
+    """跨平台事件簇：至少出现在 min_platforms 个平台的簇及其成员"""
+    result = []
+    for group in cluster_items(items, min_overlap):
+        platforms = sorted({item.get('platform', 'unknown') for item in group})
+        if len(platforms) < min_platforms:
+            continue
+        result.append({
+            'title': group[0].get('title', ''),
+            'platforms': platforms,
+            'sources': list(dict.fromkeys(item.get('source', item.get('platform', '')) for item in group)),
+            'items': [{
+                'platform': item.get('platform', 'unknown'),
+                'source': item.get('source', ''),
+                'title': item.get('title', ''),
+                'url': item.get('url', '')
+            } for item in group]
+        })
+    return result
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 标题文本工具
+各模块共用的标题规范化：去重库、趋势库、话题聚类、相关性模型按同一规则判断「同一标题」
+"""
+
+import re
+import unicodedata
+
+
+def normalize_title(title):
+    """NFKC + 小写，去掉空白和标点"""
+    return re.sub(r'[\W_]+', '', unicodedata.normalize('NFKC', title).lower())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 标题/摘要规则引擎
+title_rules.json 中的规则表（按优先级排列，可嵌套）加载一次，
+全部关键词编译进同一个自动机：每个标题只扫描一遍，
+再按优先级取第一条满足条件的规则，结果按标题缓存
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from keyword_matcher import KeywordMatcher
+
+RULES_FILE = Path(__file__).resolve().parent / 'title_rules.json'
+CACHE_SIZE = 4096
+
+
+class TitleRules:
+    """
+    规则表格式：
+    - when: [[关键词, ...], ...]，组内任一命中（OR），各组都命中（AND）；省略则总是满足
+    - value: 输出（字符串中的 {n} 替换为 index + 1），或 rules: 子规则（满足 when 后再按顺序匹配）
+    - default: {'value': ...} 或 {'pool': [...]}（按 index 轮换）
+
+    关键词与原来的 `kw in title.lower()` 一致，按小写子串匹配。
+    """
+
+    def __init__(self, rules_path=RULES_FILE):
+        with open(rules_path, 'r', encoding='utf-8') as f:
+            self.rulesets = json.load(f)
+
+        keywords = []
+        for ruleset in self.rulesets.values():
+            self._compile(ruleset['rules'], keywords)
+        self.matcher = KeywordMatcher(keywords)
+        self.found = lru_cache(maxsize=CACHE_SIZE)(self._found)
+        self.match = lru_cache(maxsize=CACHE_SIZE)(self._match)
+
+    def _compile(self, rules, keywords):
+        """把 when 预处理为小写关键词集合的元组"""
+        for rule in rules:
+            groups = rule.get('when', [])
+            rule['_when'] = tuple(frozenset(kw.lower() for kw in group) for group in groups)
+            for group in groups:
+                keywords.extend(group)
+            if 'rules' in rule:
+                self._compile(rule['rules'], keywords)
+
+    def _found(self, title):
+        """标题中出现的全部关键词（小写），各规则集共用"""
+        return frozenset(self.matcher.found(title))
+
+    def _first(self, rules, found):
+        for rule in rules:
+            if all(group & found for group in rule['_when']):
+                if 'rules' not in rule:
+                    return rule
+                child = self._first(rule['rules'], found)
+                if child is not None:
+                    return child
+        return None
+
+    def _match(self, ruleset, title):
+        """按优先级返回第一条命中的规则，没有命中时返回 None"""
+        return self._first(self.rulesets[ruleset]['rules'], self.found(title))
+
+    def render(self, ruleset, title, index=0):
+        """规则输出；没有命中时使用默认值或按 index 轮换默认池"""
+        rule = self.match(ruleset, title)
+        if rule is None:
+            default = self.rulesets[ruleset]['default']
+            if 'pool' in default:
+                return default['pool'][index % len(default['pool'])]
+            return default['value']
+        value = rule['value']
+        if isinstance(value, str):
+            return value.replace('{n}', str(index + 1))
+        return value
+
+
+_rules = None
+
+
+def get_title_rules():
+    """进程内共享的规则引擎，首次使用时加载规则表"""
+    global _rules
+    if _rules is None:
+        _rules = TitleRules()
+    return _rules
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 增量话题聚类
+每个话题簇保存 TF-IDF 稀疏质心（词 -> 权重），状态跨运行持久化：
+新标题通过倒排索引只和共享词的簇比较，单遍挂到最相似的簇或新建簇，
+超过时间窗口没有新成员的簇被淘汰，文档频率按天衰减（半衰期为一个窗口），
+不需要每次重新聚类全部历史
+"""
+
+import json
+import math
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from text_utils import normalize_title
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+STATE_FILE = DATA_DIR / 'topic_clusters.json'
+SIMILARITY_THRESHOLD = 0.3   # 与质心的余弦相似度达到该值才挂入已有簇
+WINDOW_DAYS = 7              # 超过该天数没有新成员的簇被淘汰
+TOP_TERMS = 64               # 质心只保留权重最高的词，控制状态大小
+DECAY = 0.5 ** (1 / WINDOW_DAYS)   # 文档频率每天乘以该系数，一个窗口后减半
+MIN_KEEP = 0.5               # 衰减后低于该值的词从文档频率中删除
+
+STOPWORDS = {
+    'the', 'and', 'for', 'with', 'from', 'into', 'about', 'your', 'you', 'our', 'are', 'was',
+    'how', 'why', 'what', 'when', 'who', 'its', 'this', 'that', 'these', 'those', 'now', 'new',
+    'show', 'ask', 'hn', 'can', 'will', 'has', 'have', 'not', 'more', 'than', 'out', 'all',
+    'via', 'one', 'get', 'use', 'using', 'just', 'over', 'after', 'before', 'is', 'in', 'on',
+    'of', 'to', 'an', 'as', 'at', 'by', 'be', 'it', 'or', 'we', 'my', 'vs'
+}
+
+
+def tokenize(title):
+    """英文取小写词（去停用词），中文取相邻两字"""
+    text = title.lower()
+    terms = [w for w in re.findall(r'[a-z0-9][a-z0-9.+#-]*[a-z0-9+#]|[a-z0-9]', text)
+             if len(w) > 1 and w not in STOPWORDS]
+    for run in re.findall(r'[一-鿿]+', text):
+        terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def _norm(vector):
+    return math.sqrt(sum(w * w for w in vector.values()))
+
+
+class TopicClusterer:
+    """
+    持久化的增量话题聚类器
+
+    label 为可选函数 title -> (topic_key, topic_name)，新建簇时
+    用首条标题给簇打上主题标签，之后簇的标签保持不变。
+    """
+
+    def __init__(self, path=STATE_FILE, threshold=SIMILARITY_THRESHOLD, window_days=WINDOW_DAYS, label=None):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.window = timedelta(days=window_days)
+        self.label = label
+        self.docs = 0
+        self.df = {}
+        self.clusters = {}
+        self.members = {}    # 规范化标题 -> 簇 id，同一标题重复运行时不再计入
+        self.next_id = 1
+        self.decayed_on = None   # 文档频率最近一次衰减到的日期
+        self._load()
+        self.evict()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.docs = state.get('docs', 0)
+        self.df = state.get('df', {})
+        self.next_id = state.get('next_id', 1)
+        self.clusters = {c['id']: c for c in state.get('clusters', [])}
+        self.members = state.get('members', {})
+        self.decayed_on = state.get('decayed_on')
+
+    def save(self):
+        """原子写入：先写临时文件再替换"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            'docs': round(self.docs, 3),
+            'df': {term: round(count, 3) for term, count in self.df.items()},
+            'next_id': self.next_id,
+            'clusters': list(self.clusters.values()),
+            'members': self.members,
+            'decayed_on': self.decayed_on
+        }
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def evict(self, now=None):
+        """淘汰时间窗口内没有新成员的簇并衰减文档频率，返回淘汰簇的数量"""
+        now = now or datetime.now()
+        self._decay(now)
+        cutoff = (now - self.window).isoformat()
+        stale = [cid for cid, c in self.clusters.items() if c['last_seen'] < cutoff]
+        for cid in stale:
+            del self.clusters[cid]
+        if stale:
+            self.members = {norm: cid for norm, cid in self.members.items() if cid in self.clusters}
+        return len(stale)
+
+    def _decay(self, now):
+        """按距上次衰减的天数衰减文档频率，同一天多次运行只衰减一次"""
+        day = now.date()
+        if self.decayed_on is not None:
+            days = (day - datetime.fromisoformat(self.decayed_on).date()).days
+            if days <= 0:
+                return
+            factor = DECAY ** days
+            self.docs *= factor
+            self.df = {term: count * factor for term, count in self.df.items() if count * factor >= MIN_KEEP}
+        self.decayed_on = day.isoformat()
+
+    def vectorize(self, title):
+        """单位长度的 TF-IDF 向量（稀疏 dict）"""
+        tf = {}
+        for term in tokenize(title):
+            tf[term] = tf.get(term, 0) + 1
+        vector = {term: count * (math.log((1 + self.docs) / (1 + self.df.get(term, 0))) + 1)
+                  for term, count in tf.items()}
+        norm = _norm(vector)
+        return {term: w / norm for term, w in vector.items()} if norm else {}
+
+    def _index(self):
+        """词 -> 含该词的簇 id，只在一次 assign_many 内使用"""
+        index = {}
+        for cid, cluster in self.clusters.items():
+            for term in cluster['centroid']:
+                index.setdefault(term, set()).add(cid)
+        return index
+
+    def _best(self, vector, index):
+        best, best_sim = None, 0.0
+        candidates = set()
+        for term in vector:
+            candidates |= index.get(term, set())
+        for cid in candidates:
+            centroid = self.clusters[cid]['centroid']
+            norm = _norm(centroid)
+            sim = sum(w * centroid.get(term, 0.0) for term, w in vector.items()) / norm if norm else 0.0
+            if sim > best_sim:
+                best, best_sim = cid, sim
+        return best if best_sim >= self.threshold else None
+
+    def assign_many(self, titles, now=None):
+        """
+        单遍把标题挂到已有簇或新建簇，返回与 titles 对应的簇 dict 列表
+
+        质心是成员向量的均值，只保留权重最高的 TOP_TERMS 个词。
+        已计入过的标题（按规范化标题）直接返回原来的簇，文档频率、簇大小和质心不变，
+        同一天重复运行不会让统计膨胀。
+        """
+        stamp = (now or datetime.now()).isoformat()
+        index = self._index()
+        result = []
+        for title in titles:
+            norm = normalize_title(title)
+            if norm and self.members.get(norm) in self.clusters:
+                cluster = self.clusters[self.members[norm]]
+                cluster['last_seen'] = max(cluster['last_seen'], stamp)
+                result.append(cluster)
+                continue
+            vector = self.vectorize(title)
+            cid = self._best(vector, index) if vector else None
+            if cid is None:
+                cid = self.next_id
+                self.next_id += 1
+                topic, name = self.label(title) if self.label else ('other', '')
+                self.clusters[cid] = {'id': cid, 'topic': topic, 'name': name, 'title': title,
+                                      'size': 0, 'centroid': {}, 'last_seen': stamp}
+            cluster = self.clusters[cid]
+            size = cluster['size']
+            centroid = {term: w * size / (size + 1) for term, w in cluster['centroid'].items()}
+            for term, w in vector.items():
+                centroid[term] = centroid.get(term, 0.0) + w / (size + 1)
+            top = sorted(centroid.items(), key=lambda kv: kv[1], reverse=True)[:TOP_TERMS]
+            cluster['centroid'] = {term: round(w, 4) for term, w in top}
+            cluster['size'] = size + 1
+            cluster['last_seen'] = stamp
+            for term in cluster['centroid']:
+                index.setdefault(term, set()).add(cid)
+
+            if norm:
+                self.members[norm] = cid
+            self.docs += 1
+            for term in vector:
+                self.df[term] = self.df.get(term, 0) + 1
+            result.append(cluster)
+        return result
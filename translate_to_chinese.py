@@ -3,33 +3,46 @@
 快速将英文标题翻译为中文
 """
 
+import hashlib
 import json
 from pathlib import Path
 
-# 简单的翻译映射
-TRANSLATIONS = {
-    "Anthropic officially bans using subscription auth for third party use": "Anthropic官方禁止将订阅授权用于第三方",
-    "Tailscale Peer Relays is now generally available": "Tailscale对等中继功能正式发布",
-    "How AI is affecting productivity and jobs in Europe": "AI如何影响欧洲的生产力和就业",
-    "A Lisp where each function call runs a Docker container": "每个函数调用都运行Docker容器的Lisp方言",
-    "Rebrain.gg – Doom learn, don't doom scroll": "Rebrain.gg – 沉浸式学习，不要无意义刷屏",
-    "Microsoft guide to pirating Harry Potter for LLM training": "微软LLM训练数据获取指南引发争议",
-    "Async/Await on the GPU": "GPU上的异步/等待编程",
-    "Quamina and Claude, Case 1": "Quamina与Claude实战案例",
-    "Reverse Engineering Sid Meier's Railroad Tycoon": "《铁路大亨》逆向工程研究",
-    "Tesla Sales Down": "特斯拉销量大幅下滑",
-    "Beautiful interactive explainers": "Claude生成的精美交互式教程",
-    "Large Language Models": "大语言模型研究",
-    "Machine Learning": "机器学习",
-    "Deep Learning": "深度学习",
-    "Computer Vision": "计算机视觉",
-}
+from content_cache import cached_generator
+from keyword_matcher import KeywordMatcher
 
+PHRASES_FILE = Path(__file__).resolve().parent / 'phrase_table.json'
+# 短语表内容变化时缓存的翻译结果随之失效
+PHRASES_VERSION = hashlib.sha256(PHRASES_FILE.read_bytes()).hexdigest()[:12]
+
+_phrases = None
+
+def get_phrases():
+    """加载短语表（英文短语 -> 中文标题）并编译为大小写不敏感的自动机，只加载一次"""
+    global _phrases
+    if _phrases is None:
+        with open(PHRASES_FILE, 'r', encoding='utf-8') as f:
+            translations = json.load(f)
+        rank = {eng: i for i, eng in enumerate(translations)}
+        _phrases = translations, rank, KeywordMatcher(translations)
+    return _phrases
+
+def lookup_phrase(title):
+    """一遍扫描标题，返回最长命中短语的翻译（同长时取表中靠前的），没有命中返回 None"""
+    translations, rank, matcher = get_phrases()
+    best = None
+    for _, _, keywords in matcher.iter_matches(title):
+        for eng in keywords:
+            key = (-len(eng), rank[eng])
+            if best is None or key < best[0]:
+                best = (key, eng)
+    return translations[best[1]] if best else None
+
+@cached_generator('translate_to_chinese.title', PHRASES_VERSION)
 def translate_title(title):
     """翻译标题"""
-    for eng, chn in TRANSLATIONS.items():
-        if eng.lower() in title.lower():
-            return chn
+    chn = lookup_phrase(title)
+    if chn:
+        return chn
     
     # 简单规则翻译
     title_lower = title.lower()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 关键词/话题升降温检测
+从热榜时间序列（trend_store）只读取最近 WINDOW_DAYS 天的样本，
+按 (词, 日) 计数成 NumPy 矩阵，用累加和一次算出滚动窗口计数、
+速度（近 SPAN 天对比前 SPAN 天的日均变化）和加速度（速度的变化）
+"""
+
+import time
+
+import numpy as np
+
+from classifier import get_classifier
+from keyword_matcher import KeywordMatcher
+from trend_store import DB_FILE, TrendStore
+
+WINDOW_DAYS = 14     # 每次只读取这段历史
+SPAN = 3             # 滚动窗口天数：近 SPAN 天 vs 前 SPAN 天
+MIN_RECENT = 2       # 近 SPAN 天至少出现的条数，避免偶发标题
+DAY = 86400
+
+
+class TrendDetector:
+    """
+    统计每个关键词和话题（category_rules.json 的 ai_category）在各天出现的标题数
+
+    同一标题一天内被多次抓取、出现在多个平台只计一次。
+    """
+
+    def __init__(self, keywords, path=DB_FILE, days=WINDOW_DAYS, span=SPAN):
+        self.matcher = KeywordMatcher(keywords)
+        self.display = {}
+        for kw in keywords:
+            self.display.setdefault(kw.lower(), kw)
+        self.path = path
+        self.days = days
+        self.span = span
+        self.terms = []
+        self.counts = np.zeros((0, days))
+        self.days_covered = 0
+
+    def _terms(self, title, classifier):
+        terms = [('keyword', self.display[kw]) for kw in self.matcher.found(title)]
+        default = classifier.rulesets['ai_category']['default']['label']
+        terms += [('topic', label) for label in classifier.labels('ai_category', title) if label != default]
+        return terms
+
+    def load(self, now=None):
+        """读取窗口内的样本并建立 词 x 日 计数矩阵，返回样本行数"""
+        now = int(now if now is not None else time.time())
+        start = now - self.days * DAY
+        store = TrendStore(self.path)
+        try:
+            rows = store.window(start, now + 1)
+        finally:
+            store.close()
+
+        classifier = get_classifier()
+        term_index = {}
+        terms_of = {}
+        seen = set()
+        term_ids, day_ids = [], []
+        for ts, _, title, _, _ in rows:
+            day = min((ts - start) // DAY, self.days - 1)
+            if (day, title) in seen:
+                continue
+            seen.add((day, title))
+            if title not in terms_of:
+                terms_of[title] = self._terms(title, classifier)
+            for term in terms_of[title]:
+                term_ids.append(term_index.setdefault(term, len(term_index)))
+                day_ids.append(day)
+
+        self.terms = list(term_index)
+        self.counts = np.zeros((len(self.terms), self.days))
+        np.add.at(self.counts, (np.array(term_ids, dtype=np.intp), np.array(day_ids, dtype=np.intp)), 1)
+        self.days_covered = len({day for day, _ in seen})
+        return len(rows)
+
+    def metrics(self):
+        """
+        每个词的近 SPAN 天计数、前 SPAN 天计数、速度、加速度、持续度（有出现的天数占比）
+        以及滚动 SPAN 天计数序列，均为数组（行与 self.terms 对应）
+        """
+        span, days = self.span, self.days
+        cum = np.concatenate([np.zeros((len(self.terms), 1)), np.cumsum(self.counts, axis=1)], axis=1)
+        rolling = cum[:, span:] - cum[:, :-span]
+        recent = rolling[:, -1]
+        previous = rolling[:, -1 - span] if rolling.shape[1] > span else np.zeros(len(self.terms))
+        earlier = rolling[:, -1 - 2 * span] if rolling.shape[1] > 2 * span else np.zeros(len(self.terms))
+        velocity = (recent - previous) / span
+        acceleration = ((recent - previous) - (previous - earlier)) / span
+        persistence = (self.counts > 0).sum(axis=1) / days
+        return {
+            'recent': recent, 'previous': previous, 'velocity': velocity,
+            'acceleration': acceleration, 'persistence': persistence, 'rolling': rolling
+        }
+
+    def trends(self, limit=5):
+        """升温最快与降温最快的词：[{term, kind, recent, previous, velocity, acceleration, persistence}]"""
+        if not self.terms:
+            return {'rising': [], 'cooling': [], 'persistent': []}
+        m = self.metrics()
+        # 变化量按基数开方缩放，避免高频泛词（如 "AI"）总排在前面
+        strength = m['velocity'] / np.sqrt(m['previous'] + 1)
+
+        def pick(order, mask):
+            # 关键词与话题同名（如 "大模型"）时只保留排在前面的一个
+            result = []
+            names = set()
+            for i in order:
+                kind, term = self.terms[i]
+                if not mask[i] or term in names:
+                    continue
+                names.add(term)
+                result.append({
+                    'term': term, 'kind': kind,
+                    'recent': int(m['recent'][i]), 'previous': int(m['previous'][i]),
+                    'velocity': round(float(m['velocity'][i]), 2),
+                    'acceleration': round(float(m['acceleration'][i]), 2),
+                    'persistence': round(float(m['persistence'][i]), 2)
+                })
+                if len(result) >= limit:
+                    break
+            return result
+
+        return {
+            'rising': pick(np.argsort(-strength, kind='stable'), (m['velocity'] > 0) & (m['recent'] >= MIN_RECENT)),
+            'cooling': pick(np.argsort(strength, kind='stable'), m['velocity'] < 0),
+            # 持续热点：窗口内过半的日子上榜，且近 SPAN 天仍在榜（早已消失的词不算）
+            'persistent': pick(np.argsort(-m['persistence'], kind='stable'),
+                               (m['persistence'] > 0.5) & (m['recent'] > 0))
+        }
+
+
+def detect_trends(keywords, path=DB_FILE, limit=5, now=None):
+    """
+    读取历史并返回升降温词；历史不可用时返回空结果
+
+    历史不足 2*SPAN 天时前 SPAN 天的计数都是 0，每个词都会显得在升温，
+    此时不给出任何升降温结论（sufficient 为 False）。
+    """
+    detector = TrendDetector(keywords, path)
+    try:
+        detector.load(now)
+    except Exception as e:
+        print(f"⚠️ 读取热榜历史失败: {e}")
+    sufficient = detector.days_covered >= 2 * detector.span
+    if sufficient:
+        result = detector.trends(limit)
+    else:
+        result = {'rising': [], 'cooling': [], 'persistent': []}
+    result['days_covered'] = detector.days_covered
+    result['sufficient'] = sufficient
+    return result
+
+
+def format_trend_lines(trends, span=SPAN, days=WINDOW_DAYS):
+    """把检测结果写成解读文本的条目"""
+    lines = []
+    if not trends.get('sufficient', trends.get('days_covered', 0) >= 2 * span):
+        lines.append(f"- 热榜历史仅覆盖 {trends.get('days_covered', 0)} 天，升降温判断需积累满 {2 * span} 天")
+        return lines
+    for t in trends.get('rising', []):
+        speed = '加速' if t['acceleration'] > 0 else '放缓'
+        lines.append(f"- 升温：「{t['term']}」近{span}天 {t['recent']} 条，前{span}天 {t['previous']} 条（{speed}）")
+    if not trends.get('rising'):
+        lines.append("- 暂无明显升温的关键词或话题")
+    for t in trends.get('cooling', [])[:2]:
+        lines.append(f"- 降温：「{t['term']}」近{span}天 {t['recent']} 条，前{span}天 {t['previous']} 条")
+    persistent = [t['term'] for t in trends.get('persistent', [])[:3]]
+    if persistent:
+        lines.append(f"- 持续热点：{'、'.join(persistent)}（过去{days}天过半日子上榜，近{span}天仍在榜）")
+    return lines
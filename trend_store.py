@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+TechInsight Hub - 热榜时间序列库
+每次抓取只追加记录：每行一个 (平台, 规范化标题, 时间戳, 排名, 热度)，
+标题单独建表用整数 id 引用；样本表 WITHOUT ROWID，
+主键 (platform, title_id, ts) 直接服务单条轨迹查询，
+(ts, platform, title_id, rank, score) 覆盖索引服务按时间范围的扫描
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+from hotness import parse_heat
+from text_utils import normalize_title
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+DB_FILE = DATA_DIR / 'trends.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS titles (
+    id         INTEGER PRIMARY KEY,
+    norm_title TEXT NOT NULL UNIQUE,
+    title      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    platform TEXT NOT NULL,
+    title_id INTEGER NOT NULL,
+    ts       INTEGER NOT NULL,
+    rank     INTEGER NOT NULL,
+    score    REAL NOT NULL,
+    PRIMARY KEY (platform, title_id, ts)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS samples_ts ON samples (ts, platform, title_id, rank, score);
+"""
+
+
+class TrendStore:
+    """只追加的热榜排名/热度时间序列"""
+
+    def __init__(self, path=DB_FILE):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def _title_id(self, title):
+        norm = normalize_title(title)
+        if not norm:
+            return None
+        self.conn.execute('INSERT OR IGNORE INTO titles (norm_title, title) VALUES (?, ?)', (norm, title))
+        return self.conn.execute('SELECT id FROM titles WHERE norm_title = ?', (norm,)).fetchone()[0]
+
+    def record(self, by_platform, ts=None):
+        """
+        在一个事务中记录一次抓取：{平台: [条目, ...]}，排名为列表中的位置（从 1 开始）
+
+        热度用 hotness.parse_heat 批量解析；同一平台同一时刻的重复标题只记排名最高的一条。
+        返回写入的行数。
+        """
+        ts = int(ts if ts is not None else time.time())
+        rows = []
+        with self.conn:
+            for platform, items in by_platform.items():
+                if not items:
+                    continue
+                scores = parse_heat([item.get('score') for item in items]).tolist()
+                for rank, (item, score) in enumerate(zip(items, scores), 1):
+                    title_id = self._title_id(item.get('title', ''))
+                    if title_id is not None:
+                        rows.append((platform, title_id, ts, rank, score))
+            self.conn.executemany('INSERT OR IGNORE INTO samples (platform, title_id, ts, rank, score) '
+                                  'VALUES (?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def trajectory(self, title, platform=None, since=0):
+        """某条标题的 [(平台, 时间戳, 排名, 热度)]，按平台、时间排列"""
+        row = self.conn.execute('SELECT id FROM titles WHERE norm_title = ?', (normalize_title(title),)).fetchone()
+        if row is None:
+            return []
+        if platform is None:
+            return self.conn.execute(
+                'SELECT platform, ts, rank, score FROM samples WHERE title_id = ? AND ts >= ? '
+                'ORDER BY platform, ts', (row[0], since)).fetchall()
+        return self.conn.execute(
+            'SELECT platform, ts, rank, score FROM samples WHERE platform = ? AND title_id = ? AND ts >= ? '
+            'ORDER BY ts', (platform, row[0], since)).fetchall()
+
+    def window(self, start, end=None, platform=None):
+        """时间范围 [start, end) 内的 [(时间戳, 平台, 标题, 排名, 热度)]，按时间排列"""
+        end = end if end is not None else 2 ** 62
+        sql = ('SELECT s.ts, s.platform, t.title, s.rank, s.score FROM samples s '
+               'JOIN titles t ON t.id = s.title_id WHERE s.ts >= ? AND s.ts < ?')
+        params = [start, end]
+        if platform is not None:
+            sql += ' AND s.platform = ?'
+            params.append(platform)
+        return self.conn.execute(sql + ' ORDER BY s.ts', params).fetchall()
+
+    def titles(self):
+        """出现过的全部标题（每个规范化标题一条）"""
+        return [row[0] for row in self.conn.execute('SELECT title FROM titles')]
+
+    def close(self):
+        self.conn.close()
+
+
+def record_snapshot(by_platform, path=DB_FILE):
+    """
+    抓取脚本使用：记录一次快照，失败只打印警告，不影响主流程
+
+    抓取失败或超时的平台返回的是带 fallback 标记的备用数据，不是真实观测，整个平台跳过。
+    """
+    live = {}
+    for platform, items in by_platform.items():
+        if any(item.get('fallback') for item in items):
+            print(f"⏭️ {platform} 为备用数据，不记录到热榜时间序列")
+        else:
+            live[platform] = items
+    try:
+        store = TrendStore(path)
+        try:
+            count = store.record(live)
+        finally:
+            store.close()
+        print(f"💾 热榜时间序列: 记录 {count} 条")
+        return count
+    except Exception as e:
+        print(f"⚠️ 热榜时间序列写入失败: {e}")
+        return 0
@@ -10,16 +10,31 @@ import os
 from datetime import datetime
 from duckduckgo_search import DDGS
 
+from classifier import get_classifier
+from dedup_store import DedupStore, RETENTION_DAYS
+from http_replay import replayable
+
+@replayable('ddg.text')
+def ddg_text(query, **kwargs):
+    """DuckDuckGo 文本搜索"""
+    with DDGS() as ddgs:
+        return list(ddgs.text(query, **kwargs))
+
+@replayable('ddg.news')
+def ddg_news(query, **kwargs):
+    """DuckDuckGo 新闻搜索"""
+    with DDGS() as ddgs:
+        return list(ddgs.news(query, **kwargs))
+
 def resolve_real_url(title, source):
     """通过搜索获取真实文章URL"""
     try:
         query = f"{title} {source}"
-        with DDGS() as ddgs:
-            # 使用文本搜索获取真实链接
-            results = list(ddgs.text(query, region='cn-zh', max_results=3))
-            if results:
-                # 返回第一个结果的真实URL
-                return results[0]['href']
+        # 使用文本搜索获取真实链接
+        results = ddg_text(query, region='cn-zh', max_results=3)
+        if results:
+            # 返回第一个结果的真实URL
+            return results[0]['href']
     except Exception as e:
         print(f"⚠️ 解析链接失败: {e}")
     
@@ -41,42 +56,41 @@ def search_ai_news():
     
     all_news = []
     
-    with DDGS() as ddgs:
-        for query, source_name in sources_queries:
-            try:
-                results = list(ddgs.news(
-                    query, 
-                    region='cn-zh', 
-                    timelimit='d',
-                    max_results=5
-                ))
+    for query, source_name in sources_queries:
+        try:
+            results = ddg_news(
+                query, 
+                region='cn-zh', 
+                timelimit='d',
+                max_results=5
+            )
+            
+            for r in results:
+                # 检查URL是否有效
+                url = r['url']
+                title = r['title']
                 
-                for r in results:
-                    # 检查URL是否有效
-                    url = r['url']
-                    title = r['title']
-                    
-                    # 如果是根域名或无效链接，尝试解析真实链接
-                    if url in ['https://finance.sina.com.cn', 'https://www.chinaz.com', 
-                               'https://www.jiqizhixin.com', 'https://www.guancha.cn', 
-                               'https://www.36kr.com', 'https://new.qq.com',
-                               'https://www.pingwest.com', 'https://www.sohu.com', 
-                               'https://www.sina.com.cn'] or 'bing.com' in url:
-                        print(f"🔍 解析真实链接: {title[:30]}...")
-                        url = resolve_real_url(title, r.get('source', source_name))
-                    
-                    news = {
-                        'title': title,
-                        'source': r.get('source', source_name),
-                        'url': url,
-                        'date': r['date'][:10] if 'date' in r else datetime.now().strftime('%Y-%m-%d'),
-                        'body': r['body']
-                    }
-                    all_news.append(news)
-                    
-            except Exception as e:
-                print(f"⚠️ 搜索 {source_name} 时出错: {e}")
-                continue
+                # 如果是根域名或无效链接，尝试解析真实链接
+                if url in ['https://finance.sina.com.cn', 'https://www.chinaz.com', 
+                           'https://www.jiqizhixin.com', 'https://www.guancha.cn', 
+                           'https://www.36kr.com', 'https://new.qq.com',
+                           'https://www.pingwest.com', 'https://www.sohu.com', 
+                           'https://www.sina.com.cn'] or 'bing.com' in url:
+                    print(f"🔍 解析真实链接: {title[:30]}...")
+                    url = resolve_real_url(title, r.get('source', source_name))
+                
+                news = {
+                    'title': title,
+                    'source': r.get('source', source_name),
+                    'url': url,
+                    'date': r['date'][:10] if 'date' in r else datetime.now().strftime('%Y-%m-%d'),
+                    'body': r['body']
+                }
+                all_news.append(news)
+                
+        except Exception as e:
+            print(f"⚠️ 搜索 {source_name} 时出错: {e}")
+            continue
     
     # 去重
     seen = set()
@@ -91,26 +105,12 @@ def search_ai_news():
 
 def deduplicate_news(news_list):
     """去重（ai-news-digest 技能方式）"""
-    dedup_file = 'skills/ai-news-digest/data/news-sent.txt'
+    # 已发送标题库：精确查找 + 字符倒排表近重复查找，首次运行时导入旧的文本记录
+    store = DedupStore()
+    store.import_text()
     
-    sent_headlines = set()
-    if os.path.exists(dedup_file):
-        with open(dedup_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if '|' in line:
-                    headline = line.split('|')[1].strip()
-                    sent_headlines.add(headline)
-    
-    filtered = []
-    for news in news_list:
-        is_duplicate = False
-        for sent in sent_headlines:
-            if len(set(news['title']) & set(sent)) / len(set(news['title'])) > 0.5:
-                is_duplicate = True
-                break
-        
-        if not is_duplicate:
-            filtered.append(news)
+    filtered = [news for news in news_list if not store.is_duplicate(news['title'])]
+    store.close()
     
     print(f"📝 去重后剩余 {len(filtered)} 条新闻")
     return filtered
@@ -125,19 +125,11 @@ def curate_news(news_list):
         'other': []
     }
     
+    # 栏目规则见 category_rules.json 的 news_section，按优先级取第一个命中的栏目
+    classifier = get_classifier()
     for news in news_list:
-        title = news['title']
-        
-        if any(kw in title for kw in ['首超', '突破', '重磅', '炸裂', '霸榜', '里程碑', '历史性']):
-            categorized['breaking'].append(news)
-        elif any(kw in title for kw in ['财报', '收入', '融资', 'IPO', '投资', '收购', '商业', '市场']):
-            categorized['business'].append(news)
-        elif any(kw in title for kw in ['发布', '上线', '推出', '开源', '新品', '模型']):
-            categorized['product'].append(news)
-        elif any(kw in title for kw in ['研究', '论文', '技术', '算法', '突破']):
-            categorized['research'].append(news)
-        else:
-            categorized['other'].append(news)
+        section = classifier.first('news_section', news['title'])['label']
+        categorized[section].append(news)
     
     curated = []
     for cat in ['breaking', 'business', 'product', 'research', 'other']:
@@ -156,13 +148,10 @@ def curate_news(news_list):
 
 def update_dedup_tracker(news_list):
     """更新去重追踪器"""
-    dedup_file = 'skills/ai-news-digest/data/news-sent.txt'
-    os.makedirs(os.path.dirname(dedup_file), exist_ok=True)
-    
-    today = datetime.now().strftime('%Y-%m-%d')
-    with open(dedup_file, 'a', encoding='utf-8') as f:
-        for news in news_list:
-            f.write(f"{today}|{news['title']}\n")
+    store = DedupStore()
+    store.add_many([news['title'] for news in news_list])
+    store.prune(RETENTION_DAYS)
+    store.close()
     
     print(f"📝 已更新去重追踪器")
 